@@ -1,11 +1,17 @@
 from flask import Flask, request, jsonify, send_from_directory, render_template_string
 from flask_cors import CORS
+import hmac
 import json
 import os
 from datetime import datetime
-from fortune_engine import FortuneEngine
-from validation import validate_fortune_request
+from fortune_engine import DEFAULT_ALGORITHM_VERSION, FORECAST_MAX_DAYS
+from fortune_algorithms import available_versions
+import resources
+from validation import (
+    validate_fortune_request, validate_forecast_request, validate_algorithm_version, validate_menu_ids
+)
 import socket
+from werkzeug.http import generate_etag
 
 # 프론트엔드 파일 경로 설정
 frontend_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'frontend')
@@ -34,8 +40,18 @@ def after_request(response):
     
     return response
 
-# 운세 엔진 초기화
-fortune_engine = FortuneEngine()
+# 알고리즘 버전별 운세 엔진은 리소스 레지스트리가 관리 (요청의 algorithm_version으로 선택하며 여러 버전을 동시에 운영)
+get_fortune_engine = resources.get_fortune_engine
+
+# 기본 알고리즘 엔진과 메뉴/템플릿 데이터를 미리 로드 (gunicorn --preload이면 마스터에서 한 번만 로드되어 워커가 공유)
+default_algorithm_version = os.environ.get('FORTUNE_ALGORITHM_VERSION', DEFAULT_ALGORITHM_VERSION)
+resources.preload([default_algorithm_version])
+fortune_engine = get_fortune_engine(default_algorithm_version)
+template_loader = resources.registry.get("template_loader")
+
+# 템플릿/메뉴 핫 리로드 감시 스레드는 import 시점에 시작하지 않음 (preload된 gunicorn 마스터에서
+# 시작하면 잠금을 잡은 채 fork된 워커가 그 잠금을 물려받음). gunicorn에서는 post_fork 훅이,
+# 직접 실행할 때는 아래 __main__에서 시작
 
 @app.route('/')
 def home():
@@ -74,6 +90,7 @@ def get_local_ip():
 def api_status():
     """API 상태 확인 엔드포인트"""
     local_ip = get_local_ip()
+    menu_loader = resources.registry.get("menu_loader")
     port = int(os.environ.get('PORT', 8001))
     
     return jsonify({
@@ -87,6 +104,30 @@ def api_status():
             "network_url": f"http://{local_ip}:{port}",
             "debug_mode": app.debug
         },
+        "algorithm_versions": {
+            "default": fortune_engine.algorithm_version,
+            "available": available_versions()
+        },
+        "templates": {
+            "reload_version": template_loader.reload_version,
+            "last_reload_error": template_loader.last_reload_error
+        },
+        "menus": {
+            "generation": menu_loader.generation,
+            "count": menu_loader.menu_count,
+            "last_reload_error": menu_loader.last_reload_error,
+            "last_load_report": (
+                menu_loader.last_load_report.to_dict() if menu_loader.last_load_report else None
+            )
+        },
+        "recommendation_cache": (
+            resources.registry.get("recommendation_engine").recommendation_cache.stats()
+            if resources.registry.is_loaded("recommendation_engine") else None
+        ),
+        "fortune_cache": {
+            version: engine.fortune_cache.stats()
+            for version, engine in resources.loaded_fortune_engines().items()
+        },
         "frontend_path": frontend_path,
         "frontend_available": os.path.exists(os.path.join(frontend_path, 'index.html')),
         "access_info": {
@@ -141,6 +182,12 @@ def generate_fortune():
                 print(f"❌ 검증 실패: {validation_result['error']}")
             return jsonify({"error": validation_result["error"]}), 400
         
+        # 점수 알고리즘 버전 선택 (생략하면 기본 버전)
+        version_result = validate_algorithm_version(data, available_versions())
+        if not version_result["valid"]:
+            return jsonify({"error": version_result["error"]}), 400
+        engine = get_fortune_engine(data.get("algorithm_version", fortune_engine.algorithm_version))
+        
         # 현재 날짜
         current_date = datetime.now().strftime("%Y-%m-%d")
         
@@ -158,11 +205,12 @@ def generate_fortune():
             name = participant.get("name", "사용자")
             
             # 개인 운세 생성
-            fortune = fortune_engine.generate_individual_fortune(birth_date, current_date, name)
+            fortune = engine.generate_individual_fortune(birth_date, current_date, name)
             
             response = {
                 "date": current_date,
                 "mode": "individual",
+                "algorithm_version": engine.algorithm_version,
                 "individual_fortune": {
                     "name": name,
                     "birth_date": birth_date,
@@ -174,7 +222,10 @@ def generate_fortune():
                         }
                         for category, cat_fortune in fortune.categories.items()
                     },
-                    "total_score": fortune.total_score
+                    "total_score": fortune.total_score,
+                    "special_combination": (
+                        fortune.special_combination.to_dict() if fortune.special_combination else None
+                    )
                 }
             }
             
@@ -191,13 +242,13 @@ def generate_fortune():
             names = [p.get("name", f"참석자{i+1}") for i, p in enumerate(participants)]
             
             # 그룹 운세 생성
-            group_fortune = fortune_engine.generate_group_fortune(birth_dates, current_date, names)
+            group_fortune = engine.generate_group_fortune(birth_dates, current_date, names)
             
             # 개별 운세 정보 구성
             individual_fortunes = []
-            for fortune in group_fortune.individual_fortunes:
+            for name, fortune in zip(names, group_fortune.individual_fortunes):
                 individual_fortunes.append({
-                    "name": names[group_fortune.individual_fortunes.index(fortune)],
+                    "name": name,
                     "birth_date": fortune.birth_date,
                     "fortune": {
                         category: {
@@ -207,12 +258,16 @@ def generate_fortune():
                         }
                         for category, cat_fortune in fortune.categories.items()
                     },
-                    "total_score": fortune.total_score
+                    "total_score": fortune.total_score,
+                    "special_combination": (
+                        fortune.special_combination.to_dict() if fortune.special_combination else None
+                    )
                 })
             
             response = {
                 "date": current_date,
                 "mode": "group",
+                "algorithm_version": engine.algorithm_version,
                 "individual_fortunes": individual_fortunes,
                 "group_fortune": {
                     "average_score": round(group_fortune.average_score, 1),
@@ -223,16 +278,176 @@ def generate_fortune():
                 }
             }
         
+        elif mode == "large_group":
+            # 대규모 그룹 모드 (개별 운세 메시지 없이 점수 요약만 제공)
+            birth_dates = [p.get("birth_date") for p in participants]
+            names = [p.get("name", f"참석자{i+1}") for i, p in enumerate(participants)]
+            
+            large_group_fortune, session = engine.generate_large_group_fortune(
+                birth_dates, current_date, names
+            )
+            
+            response = {
+                "date": current_date,
+                "mode": "large_group",
+                "algorithm_version": engine.algorithm_version,
+                "participants": [
+                    {
+                        "name": participant["name"],
+                        "birth_date": participant["birth_date"],
+                        "total_score": participant["total_score"]
+                    }
+                    for participant in session.participants()
+                ],
+                "group_fortune": {
+                    "average_score": round(large_group_fortune.average_score, 1),
+                    "harmony_score": round(large_group_fortune.harmony_score, 1),
+                    "dominant_categories": large_group_fortune.dominant_categories,
+                    "group_message": large_group_fortune.group_message,
+                    "participant_count": large_group_fortune.participant_count
+                }
+            }
+        
         else:
-            return jsonify({"error": "지원하지 않는 모드입니다. 'individual' 또는 'group'을 사용하세요"}), 400
+            return jsonify({"error": "지원하지 않는 모드입니다. 'individual', 'group' 또는 'large_group'을 사용하세요"}), 400
         
-        return jsonify(response)
+        # 같은 입력에는 워커/재시작과 관계없이 같은 JSON이 생성되므로 ETag로 캐시 검증 가능
+        fortune_response = jsonify(response)
+        fortune_response.add_etag()
+        return fortune_response.make_conditional(request)
     
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": f"서버 오류가 발생했습니다: {str(e)}"}), 500
 
+@app.route('/api/fortune/forecast', methods=['POST'])
+def generate_fortune_forecast():
+    """운세 예보 API 엔드포인트 (여러 날짜의 점수를 한 번에 반환)"""
+    try:
+        # Content-Type 확인
+        if not request.is_json:
+            return jsonify({"error": "Content-Type은 application/json이어야 합니다"}), 400
+        
+        # 요청 데이터 가져오기
+        try:
+            data = request.get_json()
+        except Exception as e:
+            return jsonify({"error": "잘못된 JSON 형식입니다"}), 400
+        
+        if not data:
+            return jsonify({"error": "요청 데이터가 없습니다"}), 400
+        
+        # 입력 검증
+        validation_result = validate_forecast_request(data, FORECAST_MAX_DAYS)
+        if not validation_result["valid"]:
+            return jsonify({"error": validation_result["error"]}), 400
+        
+        version_result = validate_algorithm_version(data, available_versions())
+        if not version_result["valid"]:
+            return jsonify({"error": version_result["error"]}), 400
+        engine = get_fortune_engine(data.get("algorithm_version", fortune_engine.algorithm_version))
+        
+        birth_date = data["birth_date"]
+        start_date = data.get("start_date", datetime.now().strftime("%Y-%m-%d"))
+        days = data.get("days", 30)
+        
+        forecast = engine.generate_forecast(birth_date, start_date, days)
+        
+        response = {
+            "birth_date": birth_date,
+            "start_date": start_date,
+            "days": days,
+            "algorithm_version": engine.algorithm_version,
+            "forecast": forecast
+        }
+        
+        # 같은 입력에는 항상 같은 JSON이 생성되므로 ETag로 캐시 검증 가능
+        forecast_response = jsonify(response)
+        forecast_response.add_etag()
+        return forecast_response.make_conditional(request)
+    
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": f"서버 오류가 발생했습니다: {str(e)}"}), 500
+
+@app.route('/api/menus/<menu_id>')
+def get_menu(menu_id):
+    """메뉴 상세 조회 API 엔드포인트"""
+    menu = resources.registry.get("menu_loader").get_menu_by_id(menu_id)
+    if menu is None:
+        return jsonify({"error": f"메뉴를 찾을 수 없습니다: {menu_id}"}), 404
+    
+    menu_response = jsonify({"menu": menu.to_dict()})
+    menu_response.add_etag()
+    return menu_response.make_conditional(request)
+
+@app.route('/api/menus')
+def get_menus():
+    """메뉴 일괄 조회 API 엔드포인트 (?ids=menu_001,menu_002)"""
+    ids_param = request.args.get("ids", "")
+    menu_ids = [menu_id.strip() for menu_id in ids_param.split(",")] if ids_param else []
+    validation_result = validate_menu_ids(menu_ids)
+    if not validation_result["valid"]:
+        return jsonify({"error": validation_result["error"]}), 400
+    
+    menus = resources.registry.get("menu_loader").get_menus_by_ids(menu_ids)
+    menus_response = jsonify({
+        "menus": [menu.to_dict() for menu in menus if menu is not None],
+        "missing": [menu_id for menu_id, menu in zip(menu_ids, menus) if menu is None]
+    })
+    menus_response.add_etag()
+    return menus_response.make_conditional(request)
+
+# /api/menu-stats 응답 (카탈로그 세대, JSON 본문, ETag) - 세대가 바뀐 뒤 첫 요청에서만 직렬화
+_menu_stats_response = (None, b"", "")
+
+@app.route('/api/menu-stats')
+def get_menu_stats():
+    """
+    메뉴 카탈로그 통계 API 엔드포인트 (카테고리/난이도/공유 타입/키워드/점수 버킷별 메뉴 수)
+    
+    통계는 카탈로그 세대마다 한 번 계산되고 응답 본문과 ETag도 세대마다 한 번 만들므로,
+    요청 비용은 카탈로그 크기와 관계없습니다. ETag는 본문에서 만들어 내용이 같으면 워커가
+    달라도 같고, If-None-Match가 일치하면 304를 반환합니다. 경로는 /api/menus/<menu_id>의
+    ID 공간 밖에 두어 ID가 "stats"인 메뉴도 상세 조회할 수 있습니다.
+    """
+    global _menu_stats_response
+    menu_loader = resources.registry.get("menu_loader").pinned()
+    generation, body, etag = _menu_stats_response
+    if generation != menu_loader.generation:
+        body = app.json.response(menu_loader.get_catalog_statistics()).get_data()
+        etag = generate_etag(body)
+        _menu_stats_response = (menu_loader.generation, body, etag)
+    
+    stats_response = app.response_class(body, mimetype=app.json.mimetype)
+    stats_response.set_etag(etag)
+    return stats_response.make_conditional(request)
+
+@app.route('/api/admin/menus/reload', methods=['POST'])
+def reload_menus():
+    """
+    메뉴 카탈로그 리로드 관리 API 엔드포인트 (Authorization: Bearer <FORTUNE_ADMIN_TOKEN>)
+    
+    리로드는 백그라운드에서 실행되고 조회는 끝날 때까지 이전 카탈로그를 사용하므로 바로
+    202를 반환합니다. 완료 여부는 /api/status의 menus.generation으로 확인합니다.
+    이 요청을 처리한 워커 프로세스에만 적용됩니다.
+    """
+    admin_token = os.environ.get('FORTUNE_ADMIN_TOKEN')
+    if not admin_token:
+        return jsonify({"error": "관리 API가 비활성화되어 있습니다"}), 403
+    authorization = request.headers.get('Authorization', '')
+    if not hmac.compare_digest(authorization.encode('utf-8'), f"Bearer {admin_token}".encode('utf-8')):
+        return jsonify({"error": "인증에 실패했습니다"}), 401
+    
+    menu_loader = resources.registry.get("menu_loader")
+    return jsonify({
+        "reload_started": menu_loader.reload_in_background(force=True),
+        "generation": menu_loader.generation,
+        "last_reload_error": menu_loader.last_reload_error
+    }), 202
+
 @app.route('/api/menu-recommendation', methods=['POST'])
 def recommend_menu():
     """메뉴 추천 API 엔드포인트"""
@@ -424,6 +639,10 @@ if __name__ == '__main__':
     
     # 프로덕션에서는 gunicorn이 실행하므로 이 부분은 개발 환경에서만 실행
     if not is_production:
+        resources.start_background_tasks(
+            float(os.environ.get('FORTUNE_TEMPLATE_RELOAD_INTERVAL', resources.DEFAULT_TEMPLATE_RELOAD_INTERVAL)),
+            float(os.environ.get('FORTUNE_MENU_RELOAD_INTERVAL', resources.DEFAULT_MENU_RELOAD_INTERVAL))
+        )
         app.run(debug=True, host='0.0.0.0', port=port, threaded=True)
     else:
         # 프로덕션에서는 gunicorn이 앱을 실행
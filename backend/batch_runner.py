@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+대량 오프라인 운세 + 메뉴 추천 배치 실행기
+CSV/JSONL 입력을 스트리밍으로 읽어 프로세스 풀로 분산 처리하고 JSONL로 출력
+
+사용법: python -m fortune_engine batch --input rows.csv --output results.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from validation import validate_fortune_request
+
+# 워커 프로세스별 엔진 (initializer에서 생성)
+_fortune_engine = None
+_recommendation_engine = None
+
+
+class InvalidRow(NamedTuple):
+    """디코딩할 수 없는 입력 행 (워커에서 오류 레코드로 기록)"""
+    error: str
+
+
+def read_rows(input_path: str) -> Iterator[Any]:
+    """
+    입력 파일을 한 행씩 스트리밍으로 읽습니다.
+
+    확장자가 .jsonl/.ndjson이면 JSON Lines, 그 외에는 헤더가 있는 CSV로 읽습니다.
+    각 행에는 birth_date 필드가 필요하고 name 필드는 선택사항입니다. JSON으로
+    디코딩할 수 없는 줄은 배치를 중단하지 않도록 InvalidRow로 반환합니다.
+
+    Args:
+        input_path: 입력 파일 경로
+
+    Yields:
+        Any: 입력 행 (JSON Lines는 디코딩한 값 그대로, 객체가 아닐 수도 있음) 또는 InvalidRow
+    """
+    with open(input_path, 'r', encoding='utf-8', newline='') as f:
+        if input_path.endswith(('.jsonl', '.ndjson')):
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield InvalidRow(f"JSON 형식이 올바르지 않습니다: {e}")
+        else:
+            yield from csv.DictReader(f)
+
+
+def _init_worker(algorithm_version: str) -> None:
+    """워커 프로세스 초기화: 공유 리소스 레지스트리에서 엔진 참조 (fork로 상속되었으면 재사용)"""
+    global _fortune_engine, _recommendation_engine
+    import resources
+
+    _fortune_engine = resources.get_fortune_engine(algorithm_version)
+    _recommendation_engine = resources.registry.get("recommendation_engine")
+
+
+def _process_row(row_number: int, row: Any, current_date: str,
+                 num_recommendations: int) -> Dict[str, Any]:
+    """한 행의 운세와 메뉴 추천 결과 생성 (잘못된 행은 오류 레코드로 반환)"""
+    if isinstance(row, InvalidRow):
+        return {"row": row_number, "error": row.error}
+    if not isinstance(row, dict):
+        return {"row": row_number, "error": "행은 JSON 객체여야 합니다"}
+
+    birth_date = row.get("birth_date") or ""
+    name = row.get("name") or ""
+    if not isinstance(birth_date, str) or not isinstance(name, str):
+        return {"row": row_number, "error": "birth_date와 name은 문자열이어야 합니다"}
+    birth_date = birth_date.strip()
+    name = name.strip()
+
+    # API와 같은 검증 (1900년 이후, 미래 날짜 불가)
+    validation = validate_fortune_request({
+        "mode": "individual",
+        "participants": [{"birth_date": birth_date, "name": name}]
+    })
+    if not validation["valid"]:
+        return {"row": row_number, "name": name, "birth_date": birth_date, "error": validation["error"]}
+
+    try:
+        fortune = _fortune_engine.generate_individual_fortune(birth_date, current_date, name)
+        recommendations = _recommendation_engine.recommend_for_individual(fortune, num_recommendations)
+    except Exception as e:
+        return {"row": row_number, "name": name, "birth_date": birth_date, "error": str(e)}
+
+    return {
+        "row": row_number,
+        "name": name,
+        "birth_date": birth_date,
+        "fortune": fortune.to_dict(),
+        "recommendations": [
+            {
+                "menu_id": rec.menu.id,
+                "name": rec.menu.name,
+                "recommendation_score": rec.recommendation_score,
+                "reason": rec.reason
+            }
+            for rec in recommendations
+        ]
+    }
+
+
+def _process_chunk(first_row_number: int, rows: List[Any], current_date: str,
+                   num_recommendations: int) -> Tuple[str, int]:
+    """
+    청크 하나를 처리해 JSONL 문자열로 반환
+
+    Returns:
+        Tuple[str, int]: (JSONL 텍스트, 오류 행 수)
+    """
+    lines = []
+    errors = 0
+    for offset, row in enumerate(rows):
+        result = _process_row(first_row_number + offset, row, current_date, num_recommendations)
+        if "error" in result:
+            errors += 1
+        lines.append(json.dumps(result, ensure_ascii=False, sort_keys=True))
+    return "\n".join(lines) + "\n", errors
+
+
+def _load_checkpoint(checkpoint_path: Optional[str], input_path: str,
+                     current_date: str, algorithm_version: str) -> Dict[str, Any]:
+    """체크포인트 파일 로드 (없으면 처음부터, 다른 작업의 것이면 오류)"""
+    empty = {"input": os.path.abspath(input_path), "date": current_date,
+             "algorithm_version": algorithm_version,
+             "rows_done": 0, "output_bytes": 0, "errors": 0}
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return empty
+
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        checkpoint = json.load(f)
+
+    if (checkpoint.get("input") != empty["input"] or checkpoint.get("date") != current_date
+            or checkpoint.get("algorithm_version", algorithm_version) != algorithm_version):
+        raise ValueError(f"체크포인트가 다른 입력, 날짜 또는 알고리즘 버전의 작업입니다: {checkpoint_path}")
+    return checkpoint
+
+
+def _save_checkpoint(checkpoint_path: Optional[str], checkpoint: Dict[str, Any]) -> None:
+    """체크포인트 파일을 원자적으로 저장"""
+    if not checkpoint_path:
+        return
+    temp_path = f"{checkpoint_path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(temp_path, checkpoint_path)
+
+
+def run_batch(input_path: str, output_path: str, current_date: str,
+              algorithm_version: str, workers: int, chunk_size: int,
+              checkpoint_path: Optional[str] = None,
+              num_recommendations: int = 3) -> Dict[str, Any]:
+    """
+    배치 실행
+
+    입력을 chunk_size 행씩 읽어 프로세스 풀에 넘기며, 동시에 처리 중인 청크를
+    workers * 2개로 제한해 메모리 사용량이 입력 크기와 무관하게 유지됩니다.
+    출력은 입력 순서대로 기록되고, 청크마다 체크포인트를 갱신하므로 중단된
+    작업은 같은 체크포인트로 다시 실행하면 이어서 처리됩니다.
+
+    Args:
+        input_path: 입력 CSV/JSONL 경로
+        output_path: 출력 JSONL 경로
+        current_date: 운세 날짜 (YYYY-MM-DD)
+        algorithm_version: 점수 알고리즘 버전
+        workers: 워커 프로세스 수
+        chunk_size: 청크당 행 수
+        checkpoint_path: 체크포인트 파일 경로 (None이면 이어하기 비활성화)
+        num_recommendations: 행당 추천 메뉴 개수
+
+    Returns:
+        Dict[str, Any]: 처리 통계
+    """
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers와 chunk_size는 1 이상이어야 합니다")
+
+    checkpoint = _load_checkpoint(checkpoint_path, input_path, current_date, algorithm_version)
+    resumed_rows = checkpoint["rows_done"]
+
+    # 이어하기: 마지막 체크포인트 이후에 기록된 불완전한 출력은 잘라냄
+    if resumed_rows and not os.path.exists(output_path):
+        raise FileNotFoundError(f"이어서 기록할 출력 파일이 없습니다: {output_path}")
+    output_mode = 'r+b' if resumed_rows else 'wb'
+    started = time.perf_counter()
+    processed_rows = 0
+
+    rows = read_rows(input_path)
+    for _ in islice(rows, resumed_rows):
+        pass
+
+    # fork 방식 워커가 데이터를 copy-on-write로 공유하도록 부모에서 미리 로드
+    import resources
+    resources.preload([algorithm_version])
+
+    with open(output_path, output_mode) as output, ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(algorithm_version,)
+    ) as executor:
+        if output_mode == 'r+b':
+            output.truncate(checkpoint["output_bytes"])
+            output.seek(checkpoint["output_bytes"])
+
+        pending: Deque[Tuple[int, Future]] = deque()
+        next_row_number = resumed_rows
+
+        def flush_oldest() -> None:
+            nonlocal processed_rows
+            row_count, future = pending.popleft()
+            text, errors = future.result()
+            output.write(text.encode('utf-8'))
+            output.flush()
+            processed_rows += row_count
+            checkpoint["rows_done"] += row_count
+            checkpoint["errors"] += errors
+            checkpoint["output_bytes"] = output.tell()
+            _save_checkpoint(checkpoint_path, checkpoint)
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            future = executor.submit(
+                _process_chunk, next_row_number, chunk, current_date, num_recommendations
+            )
+            pending.append((len(chunk), future))
+            next_row_number += len(chunk)
+            if len(pending) >= workers * 2:
+                flush_oldest()
+
+        while pending:
+            flush_oldest()
+
+    elapsed = time.perf_counter() - started
+    rows_per_second = processed_rows / elapsed if elapsed > 0 else 0.0
+    return {
+        "rows_processed": processed_rows,
+        "rows_resumed": resumed_rows,
+        "errors": checkpoint["errors"],
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(rows_per_second, 1),
+        "rows_per_second_per_core": round(rows_per_second / workers, 1),
+        "workers": workers,
+        "algorithm_version": algorithm_version
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점 (python -m fortune_engine batch ...)"""
+    from fortune_algorithms import DEFAULT_ALGORITHM_VERSION, available_versions
+
+    parser = argparse.ArgumentParser(prog="python -m fortune_engine", description="운세 엔진 명령행 도구")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch = subparsers.add_parser("batch", help="대량 운세 + 메뉴 추천 배치 실행")
+    batch.add_argument("--input", required=True, help="입력 CSV 또는 JSONL 파일 (birth_date, name)")
+    batch.add_argument("--output", required=True, help="출력 JSONL 파일")
+    batch.add_argument("--date", default=datetime.now().strftime("%Y-%m-%d"), help="운세 날짜 (기본값: 오늘)")
+    batch.add_argument("--algorithm-version", default=DEFAULT_ALGORITHM_VERSION,
+                       choices=available_versions(), help="점수 알고리즘 버전")
+    batch.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    batch.add_argument("--chunk-size", type=int, default=1000, help="청크당 행 수")
+    batch.add_argument("--checkpoint", help="이어하기용 체크포인트 파일 경로")
+    batch.add_argument("--recommendations", type=int, default=3, help="행당 추천 메뉴 개수")
+
+    args = parser.parse_args(argv)
+
+    stats = run_batch(
+        input_path=args.input,
+        output_path=args.output,
+        current_date=args.date,
+        algorithm_version=args.algorithm_version,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        checkpoint_path=args.checkpoint,
+        num_recommendations=args.recommendations
+    )
+
+    print(json.dumps(stats, ensure_ascii=False), file=sys.stderr)
+    return 0
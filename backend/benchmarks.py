@@ -0,0 +1,1137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+성능 벤치마크 모음
+사용법: python benchmarks.py <벤치마크 이름> [옵션]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Optional
+
+
+def _report(label: str, total_seconds: float, iterations: int) -> float:
+    """벤치마크 결과를 출력하고 호출당 마이크로초를 반환"""
+    per_call_us = total_seconds / iterations * 1_000_000
+    print(f"  {label:<40} {per_call_us:10.3f} µs/call  ({iterations:,}회)")
+    return per_call_us
+
+
+def bench_score_kernel(args: argparse.Namespace) -> None:
+    """카테고리 점수 생성: v1(MD5 + random) vs v2(상태 없는 커널)"""
+    from fortune_engine import FortuneEngine
+    import fortune_kernel
+
+    engine = FortuneEngine()
+    birth_date, current_date = "1990-05-15", "2024-01-01"
+    seed = engine.generate_seed(birth_date, current_date)
+    iterations = args.iterations
+
+    print("=== 카테고리 점수 커널 벤치마크 ===")
+    v1 = _report(
+        "v1 generate_category_score",
+        timeit.timeit(lambda: engine.generate_category_score(seed, "love"), number=iterations),
+        iterations
+    )
+    v2 = _report(
+        "v2 fortune_kernel.category_score",
+        timeit.timeit(
+            lambda: fortune_kernel.category_score(birth_date, current_date, "love"),
+            number=iterations
+        ),
+        iterations
+    )
+    print(f"  속도 향상: {v1 / v2:.1f}x")
+
+    for version in ("v1", "v2"):
+        versioned = FortuneEngine(algorithm_version=version)
+        _report(
+            f"{version} generate_category_scores (4개)",
+            timeit.timeit(
+                lambda: versioned.generate_category_scores(birth_date, current_date),
+                number=iterations
+            ),
+            iterations
+        )
+
+
+def bench_daily_table(args: argparse.Namespace) -> None:
+    """일일 점수 테이블 생성 시간 및 조회 vs 직접 계산"""
+    from datetime import datetime
+    from fortune_algorithms import ALGORITHM_V2
+    from fortune_engine import FortuneEngine
+    from fortune_table import DailyFortuneTable
+
+    current_date = datetime.now().strftime("%Y-%m-%d")
+    categories = ["love", "health", "wealth", "career"]
+
+    print("=== 일일 운세 테이블 벤치마크 ===")
+    runs = 5
+    build_seconds = timeit.timeit(lambda: DailyFortuneTable(current_date, categories), number=runs)
+    table = DailyFortuneTable(current_date, categories)
+    print(f"  생년월일 {table.birth_date_count:,}개 x 카테고리 {len(categories)}개, "
+          f"{table.size_in_bytes():,} bytes")
+    print(f"  테이블 생성: {build_seconds / runs * 1000:.1f} ms/build")
+
+    engine = FortuneEngine(algorithm_version=ALGORITHM_V2)
+    engine.get_daily_table(current_date)
+    iterations = args.iterations
+    birth_date = "1990-05-15"
+    _report(
+        "table.lookup",
+        timeit.timeit(lambda: table.lookup(birth_date), number=iterations),
+        iterations
+    )
+    _report(
+        "generate_category_scores (테이블 사용)",
+        timeit.timeit(lambda: engine.generate_category_scores(birth_date, current_date), number=iterations),
+        iterations
+    )
+    _report(
+        "generate_category_scores (과거 날짜, 커널)",
+        timeit.timeit(lambda: engine.generate_category_scores(birth_date, "2000-01-01"), number=iterations),
+        iterations
+    )
+
+
+def bench_fortune_cache(args: argparse.Namespace) -> None:
+    """개인 운세 메모이제이션: 캐시 미스 vs 히트"""
+    from fortune_engine import FortuneEngine, SUPPORTED_ALGORITHM_VERSIONS
+    from fortune_cache import estimate_fortune_size
+
+    current_date = "2024-01-01"
+    birth_dates = _sample_birth_dates(1000)
+
+    print("=== 개인 운세 캐시 벤치마크 ===")
+    for version in SUPPORTED_ALGORITHM_VERSIONS:
+        engine = FortuneEngine(algorithm_version=version)
+        rounds = max(1, args.iterations // len(birth_dates))
+
+        def miss_run() -> None:
+            engine.fortune_cache.clear()
+            for birth_date in birth_dates:
+                engine.generate_individual_fortune(birth_date, current_date)
+
+        def hit_run() -> None:
+            for birth_date in birth_dates:
+                engine.generate_individual_fortune(birth_date, current_date)
+
+        miss_seconds = timeit.timeit(miss_run, number=rounds)
+        hit_run()
+        hit_seconds = timeit.timeit(hit_run, number=rounds)
+        _report(f"{version} 캐시 미스", miss_seconds, rounds * len(birth_dates))
+        _report(f"{version} 캐시 히트", hit_seconds, rounds * len(birth_dates))
+
+    sample = engine.generate_individual_fortune(birth_dates[0], current_date)
+    print(f"  항목당 추정 크기: {estimate_fortune_size(sample):,} bytes")
+    print(f"  통계: {engine.fortune_cache.stats()}")
+
+
+def bench_large_group(args: argparse.Namespace) -> None:
+    """대규모 그룹: 세션 생성, 참석자 추가/삭제, 요약 (10 / 1k / 100k명)"""
+    import statistics
+    from datetime import datetime
+    from fortune_algorithms import ALGORITHM_V2
+    from fortune_engine import FortuneEngine
+
+    current_date = datetime.now().strftime("%Y-%m-%d")
+    engine = FortuneEngine(algorithm_version=ALGORITHM_V2)
+    engine.get_daily_table(current_date)  # 테이블 생성 시간은 측정에서 제외
+
+    print("=== 대규모 그룹 벤치마크 (알고리즘 v2) ===")
+    for size in (10, 1_000, 100_000):
+        birth_dates = _sample_birth_dates(size)
+
+        started = time.perf_counter()
+        summary, session = engine.generate_large_group_fortune(birth_dates, current_date)
+        build_seconds = time.perf_counter() - started
+
+        repeat = 1000
+        add_seconds = timeit.timeit(
+            lambda: session.remove_participant(session.add_participant("1990-05-15")),
+            number=repeat
+        )
+        summary_seconds = timeit.timeit(session.summary, number=repeat)
+
+        # 참고: 기존 방식의 정확한 분산 계산 (statistics.variance)
+        totals = [participant["total_score"] for participant in session.participants()]
+        variance_seconds = timeit.timeit(lambda: statistics.variance(totals), number=1)
+
+        print(f"  {size:>7,}명: 생성 {build_seconds * 1000:9.1f} ms | "
+              f"추가+삭제 {add_seconds / repeat * 1e6:6.1f} µs | "
+              f"요약 {summary_seconds / repeat * 1e6:6.1f} µs | "
+              f"statistics.variance {variance_seconds * 1000:8.2f} ms | "
+              f"화합 {summary.harmony_score:.1f}")
+
+
+def bench_forecast(args: argparse.Namespace) -> None:
+    """운세 예보: 배치 generate_forecast vs 날짜별 generate_individual_fortune 반복"""
+    from datetime import date, timedelta
+    from fortune_engine import FortuneEngine, SUPPORTED_ALGORITHM_VERSIONS
+
+    birth_date, start = "1990-05-15", "2024-01-01"
+    repeat = 20
+
+    print("=== 운세 예보 벤치마크 ===")
+    for version in SUPPORTED_ALGORITHM_VERSIONS:
+        engine = FortuneEngine(algorithm_version=version, cache_max_entries=1)
+        for days in (30, 365):
+            dates = [(date(2024, 1, 1) + timedelta(days=i)).isoformat() for i in range(days)]
+            loop_seconds = timeit.timeit(
+                lambda: [engine.generate_individual_fortune(birth_date, d) for d in dates],
+                number=repeat
+            )
+            batch_seconds = timeit.timeit(
+                lambda: engine.generate_forecast(birth_date, start, days),
+                number=repeat
+            )
+            print(f"  {version} {days:>3}일: 날짜별 반복 {loop_seconds / repeat * 1000:8.2f} ms | "
+                  f"배치 {batch_seconds / repeat * 1000:7.2f} ms | "
+                  f"{loop_seconds / batch_seconds:5.1f}x")
+
+
+def bench_flyweight(args: argparse.Namespace) -> None:
+    """tracemalloc: 요청당 할당 (요청마다 CategoryFortune 생성 vs 공유 플라이웨이트)"""
+    import tracemalloc
+    from fortune_engine import FortuneEngine
+    from models import CategoryFortune, Fortune
+
+    current_date = "2024-01-01"
+    birth_dates = _sample_birth_dates(2000)
+    engine = FortuneEngine(cache_max_entries=1)
+
+    def per_request(birth_date: str) -> Fortune:
+        # 플라이웨이트 도입 전 방식: 요청마다 메시지/키워드 조회 후 새 인스턴스 생성
+        category_scores = engine.generate_category_scores(birth_date, current_date)
+        categories = {}
+        for category, score in category_scores.items():
+            message, keywords = engine.get_fortune_message_and_keywords(category, score)
+            categories[category] = CategoryFortune(score=score, message=message, keywords=list(keywords))
+        return Fortune(
+            date=current_date,
+            birth_date=birth_date,
+            categories=categories,
+            total_score=engine.calculate_total_score(category_scores)
+        )
+
+    def pooled(birth_date: str) -> Fortune:
+        return engine.generate_individual_fortune(birth_date, current_date)
+
+    print("=== 플라이웨이트 할당 벤치마크 (tracemalloc) ===")
+    print(f"  풀 크기: CategoryFortune {len(engine.category_pool)}개, "
+          f"키워드 튜플 {len(engine.category_pool.keyword_sets)}개")
+    for label, generate in (("요청마다 생성", per_request), ("플라이웨이트", pooled)):
+        generate(birth_dates[0])
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        results = [generate(birth_date) for birth_date in birth_dates]
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        stats = after.compare_to(before, "filename")
+        blocks = sum(stat.count_diff for stat in stats) / len(results)
+        size = sum(stat.size_diff for stat in stats) / len(results)
+        elapsed = timeit.timeit(lambda: [generate(b) for b in birth_dates], number=3) / 3
+        print(f"  {label:<12} 요청당 유지 블록 {blocks:6.1f}개, {size:8.1f} bytes, "
+              f"{elapsed / len(birth_dates) * 1e6:6.1f} µs/request")
+        del results
+
+
+def bench_template_lookup(args: argparse.Namespace) -> None:
+    """템플릿 조회: 원본 JSON 경로(카테고리 확인 + 구간 if 체인 + 중첩 dict) vs 컴파일된 테이블"""
+    from fortune_template_loader import FortuneTemplateLoader, score_range_name, stable_index
+
+    loader = FortuneTemplateLoader()
+    templates = loader.templates
+    iterations = args.iterations
+
+    def category_info(category: str) -> dict:
+        if category not in templates['categories']:
+            raise ValueError(category)
+        return templates['categories'][category]
+
+    # 테이블 컴파일 전의 조회 경로
+    def legacy_message(category: str, score: int) -> str:
+        messages = category_info(category)['score_ranges'][score_range_name(score)]['messages']
+        return messages[stable_index(f"{category}:{score}", len(messages))]
+
+    def legacy_keywords(category: str, score: int) -> list:
+        return category_info(category)['score_ranges'][score_range_name(score)]['keywords']
+
+    def legacy_harmony(harmony_score: float) -> str:
+        harmony_range = f"harmony_{score_range_name(int(harmony_score))}"
+        if harmony_range not in templates['group_messages']:
+            raise ValueError(harmony_range)
+        messages = templates['group_messages'][harmony_range]['messages']
+        return messages[stable_index(f"harmony:{int(harmony_score * 100)}", len(messages))]
+
+    for category in loader.score_table:
+        for score in range(1, 101):
+            assert legacy_message(category, score) == loader.select_fortune_message(category, score)
+            assert tuple(legacy_keywords(category, score)) == loader.get_fortune_keywords(category, score)
+
+    print("=== 템플릿 조회 벤치마크 ===")
+    cases = (
+        ("select_fortune_message", lambda: legacy_message("wealth", 73),
+         lambda: loader.select_fortune_message("wealth", 73)),
+        ("get_fortune_keywords", lambda: legacy_keywords("wealth", 73),
+         lambda: loader.get_fortune_keywords("wealth", 73)),
+        ("select_group_harmony_message", lambda: legacy_harmony(87.5),
+         lambda: loader.select_group_harmony_message(87.5)),
+    )
+    for label, legacy, compiled in cases:
+        before = _report(f"{label} (JSON 경로)", timeit.timeit(legacy, number=iterations), iterations)
+        after = _report(f"{label} (컴파일 테이블)", timeit.timeit(compiled, number=iterations), iterations)
+        print(f"  속도 향상: {before / after:.1f}x")
+
+
+def bench_special_combination(args: argparse.Namespace) -> None:
+    """특별 조합 평가: 규칙 순차 검사 vs 컴파일된 결정 테이블 (규칙 4 / 64 / 1024개)"""
+    import random
+    from fortune_template_loader import (
+        DEFAULT_SPECIAL_CONDITIONS, FortuneTemplateLoader, compile_special_table, _special_ranges
+    )
+
+    templates = FortuneTemplateLoader().templates
+    categories = tuple(templates['categories'])
+    iterations = args.iterations
+    rng = random.Random(0)
+    rows = [{category: rng.randint(1, 100) for category in categories} for _ in range(365)]
+
+    print("=== 특별 조합 평가 벤치마크 ===")
+    for rule_count in (4, 64, 1024):
+        # 기존 규칙 뒤에 잘 일치하지 않는 임의 규칙을 덧붙여 규칙 수를 늘림
+        combos = dict(templates['special_combinations'])
+        for index in range(len(combos), rule_count):
+            chosen = rng.sample(categories, 2)
+            combos[f"rule_{index}"] = {
+                "message": f"rule {index}", "keywords": [],
+                "conditions": {chosen[0]: {"min": 95}, chosen[1]: {"max": 5}}
+            }
+        compiled_templates = dict(templates, special_combinations=combos)
+        table = compile_special_table(compiled_templates)
+        rule_ranges = [
+            (rule, _special_ranges(
+                rule.name,
+                combos[rule.name].get('conditions', DEFAULT_SPECIAL_CONDITIONS.get(rule.name)),
+                categories
+            ))
+            for rule in table.rules
+        ]
+
+        # 규칙마다 조건을 차례로 검사하는 경로 (규칙 수에 비례)
+        def sequential(scores: dict):
+            for rule, ranges in rule_ranges:
+                if all(low <= scores[category] <= high for category, (low, high) in ranges.items()):
+                    return rule
+            return None
+
+        miss = {category: 50 for category in categories}
+        assert all(sequential(row) is table.match(row) for row in rows)
+        print(f"--- 규칙 {rule_count}개 ---")
+        before = _report("match (순차 검사)", timeit.timeit(lambda: sequential(miss), number=iterations), iterations)
+        after = _report("match (결정 테이블)", timeit.timeit(lambda: table.match(miss), number=iterations), iterations)
+        print(f"  속도 향상: {before / after:.1f}x")
+        batch_iterations = max(1, iterations // 365)
+        _report("365일 match 반복", timeit.timeit(lambda: [table.match(row) for row in rows],
+                                                 number=batch_iterations), batch_iterations)
+        _report("365일 match_rows (일괄)", timeit.timeit(lambda: table.match_rows(rows),
+                                                         number=batch_iterations), batch_iterations)
+
+
+# 합성 메뉴 카탈로그 크기 (메뉴 인덱스 관련 벤치마크 공통)
+CATALOG_SIZES = (50, 10_000, 1_000_000)
+
+# 합성 메뉴에 사용할 운세 키워드
+_SYNTHETIC_KEYWORDS = (
+    "달콤한", "위로", "따뜻함", "건강", "활력", "에너지", "로맨틱", "사랑", "성공", "축하",
+    "안정적인", "편안한", "화려한", "고급스러운", "성취감", "행운", "도전", "신선한", "든든한", "상큼한",
+    "매콤한", "담백한", "여유", "휴식", "소박한", "풍성한", "특별한", "새로운", "전통", "정성"
+)
+
+
+def _synthetic_menus(count: int, seed: int = 0) -> List["Menu"]:
+    """
+    재현 가능한 합성 메뉴 목록 생성
+
+    Args:
+        count: 메뉴 수
+        seed: 난수 시드
+
+    Returns:
+        List[Menu]: 검증을 통과한 메뉴 목록
+    """
+    import random
+    from models import DifficultyLevel, Menu, MenuCategory, SharingType
+
+    rng = random.Random(seed)
+    categories = list(MenuCategory)
+    difficulties = list(DifficultyLevel)
+    sharing_types = list(SharingType)
+    menus = []
+    for index in range(count):
+        min_score = rng.randint(1, 80)
+        min_serving = rng.randint(1, 4)
+        menus.append(Menu(
+            id=f"menu_{index:07d}",
+            name=f"메뉴{index}",
+            category=categories[index % len(categories)],
+            score_range=(min_score, min(100, min_score + rng.randint(10, 40))),
+            fortune_keywords=rng.sample(_SYNTHETIC_KEYWORDS, 3),
+            ingredients=["재료1", "재료2"],
+            cooking_time="30분",
+            difficulty=rng.choice(difficulties),
+            description=f"합성 메뉴 {index}",
+            min_serving=min_serving,
+            max_serving=min_serving + rng.randint(0, 6),
+            sharing_type=rng.choice(sharing_types),
+            base_score=rng.randint(30, 70)
+        ))
+    return menus
+
+
+def _catalog_iterations(args: argparse.Namespace, size: int) -> int:
+    """카탈로그 크기에 맞춘 반복 횟수 (선형 스캔이 전체 실행 시간을 지배하지 않도록)"""
+    return max(3, min(args.iterations, 1_000_000 // size))
+
+
+def bench_menu_buckets(args: argparse.Namespace) -> None:
+    """메뉴 필터: 요청마다 선형 스캔 vs 미리 계산된 점수/인원수 버킷 (메뉴 50 / 10k / 1M개)"""
+    from menu_loader import MenuLoader
+    from models import SharingType
+
+    print("=== 메뉴 점수/인원수 버킷 벤치마크 ===")
+    for size in CATALOG_SIZES:
+        menus = _synthetic_menus(size)
+        started = time.perf_counter()
+        loader = MenuLoader(menus=menus)
+        build_seconds = time.perf_counter() - started
+        iterations = _catalog_iterations(args, size)
+
+        # 버킷 도입 전의 선형 스캔 경로
+        def scan_score(score: int) -> list:
+            return [menu for menu in menus if menu.is_suitable_for_score(score)]
+
+        def scan_serving(serving_size: int) -> list:
+            return [menu for menu in menus if menu.min_serving <= serving_size <= menu.max_serving]
+
+        def scan_group(group_size: int) -> list:
+            suitable = [menu for menu in menus if menu.is_suitable_for_group_size(group_size)]
+            shared = [menu for menu in suitable
+                      if menu.sharing_type in [SharingType.SHARED, SharingType.BOTH]]
+            return shared or suitable
+
+        assert list(loader.get_suitable_menus_for_score(63)) == scan_score(63)
+        assert list(loader.filter_by_serving_size(4)) == scan_serving(4)
+        assert list(loader.get_suitable_menus_for_group(4, prefer_shared=True)) == scan_group(4)
+
+        print(f"--- 메뉴 {size:,}개 (인덱스 생성 {build_seconds * 1000:.1f} ms) ---")
+        cases = (
+            ("get_suitable_menus_for_score", lambda: scan_score(63),
+             lambda: loader.get_suitable_menus_for_score(63)),
+            ("filter_by_serving_size", lambda: scan_serving(4),
+             lambda: loader.filter_by_serving_size(4)),
+            ("get_suitable_menus_for_group(shared)", lambda: scan_group(4),
+             lambda: loader.get_suitable_menus_for_group(4, prefer_shared=True)),
+        )
+        for label, scan, bucket in cases:
+            before = _report(f"{label} (스캔)", timeit.timeit(scan, number=iterations), iterations)
+            after = _report(f"{label} (버킷)", timeit.timeit(bucket, number=iterations), iterations)
+            print(f"  속도 향상: {before / after:.1f}x")
+        del loader, menus
+
+
+def bench_menu_lookup(args: argparse.Namespace) -> None:
+    """메뉴 ID 조회: 선형 탐색 vs ID 인덱스, 일괄 조회 (메뉴 50 / 10k / 1M개)"""
+    from menu_loader import MenuLoader
+
+    print("=== 메뉴 ID 조회 벤치마크 ===")
+    for size in CATALOG_SIZES:
+        menus = _synthetic_menus(size)
+        loader = MenuLoader(menus=menus)
+        iterations = _catalog_iterations(args, size)
+        # 카탈로그 끝쪽 ID (선형 탐색의 평균적인 경우보다 불리한 위치)
+        target_id = menus[size * 3 // 4].id
+        batch_ids = [menus[index * size // 20].id for index in range(20)]
+
+        # ID 인덱스 도입 전의 선형 탐색 경로
+        def scan(menu_id: str):
+            for menu in menus:
+                if menu.id == menu_id:
+                    return menu
+            return None
+
+        assert loader.get_menu_by_id(target_id) is scan(target_id)
+        print(f"--- 메뉴 {size:,}개 ---")
+        before = _report("get_menu_by_id (선형 탐색)", timeit.timeit(lambda: scan(target_id), number=iterations),
+                         iterations)
+        after = _report("get_menu_by_id (ID 인덱스)",
+                        timeit.timeit(lambda: loader.get_menu_by_id(target_id), number=iterations), iterations)
+        print(f"  속도 향상: {before / after:.1f}x")
+        _report("get_menus_by_ids (20개)",
+                timeit.timeit(lambda: loader.get_menus_by_ids(batch_ids), number=iterations), iterations)
+        del loader, menus
+
+
+def bench_keyword_index(args: argparse.Namespace) -> None:
+    """운세 키워드 매칭: 메뉴마다 set 교집합 vs 키워드 역색인 (메뉴 50 / 10k / 1M개)"""
+    from menu_loader import MenuLoader
+
+    # 개인 운세 하나의 키워드 수준 (카테고리 4개 x 구간 키워드 3개)
+    fortune_keywords = list(_SYNTHETIC_KEYWORDS[:12])
+    filter_keywords = list(_SYNTHETIC_KEYWORDS[:3])
+    # 메뉴 1%에만 붙이는 드문 키워드
+    rare_keywords = ["한정판"]
+
+    print("=== 운세 키워드 역색인 벤치마크 ===")
+    for size in CATALOG_SIZES:
+        menus = _synthetic_menus(size)
+        for menu in menus[::100]:
+            menu.fortune_keywords.append(rare_keywords[0])
+        loader = MenuLoader(menus=menus)
+        candidates = loader.get_suitable_menus_for_score(60)
+        iterations = _catalog_iterations(args, size)
+
+        # 역색인 도입 전: 후보 메뉴마다 키워드 set을 만들어 교집합
+        def scan_matches(keywords: list) -> list:
+            return [list(set(menu.fortune_keywords) & set(keywords)) for menu in candidates]
+
+        def indexed_matches(keywords: list) -> list:
+            return loader.match_keywords(keywords, candidates)
+
+        def scan_filter() -> list:
+            keyword_set = set(filter_keywords)
+            return [menu for menu in menus if keyword_set & set(menu.fortune_keywords)]
+
+        for keywords in (fortune_keywords, filter_keywords, rare_keywords):
+            assert ([sorted(matched) for matched in scan_matches(keywords)]
+                    == [sorted(matched) for matched in indexed_matches(keywords)])
+        assert list(loader.filter_by_keywords(filter_keywords)) == scan_filter()
+
+        print(f"--- 메뉴 {size:,}개 (60점 후보 {len(candidates):,}개) ---")
+        cases = (
+            ("후보 키워드 매칭 (흔한 키워드 12개)", lambda: scan_matches(fortune_keywords),
+             lambda: indexed_matches(fortune_keywords)),
+            ("후보 키워드 매칭 (드문 키워드 1개)", lambda: scan_matches(rare_keywords),
+             lambda: indexed_matches(rare_keywords)),
+            ("filter_by_keywords (3개)", scan_filter, lambda: loader.filter_by_keywords(filter_keywords)),
+        )
+        for label, scan, indexed in cases:
+            before = _report(f"{label} (스캔)", timeit.timeit(scan, number=iterations), iterations)
+            after = _report(f"{label} (색인)", timeit.timeit(indexed, number=iterations), iterations)
+            print(f"  속도 향상: {before / after:.1f}x")
+        del loader, menus, candidates
+
+
+def bench_menu_query(args: argparse.Namespace) -> None:
+    """복합 조건 조회: 필터마다 리스트 생성 vs 비트셋 교집합 query() (메뉴 50 / 10k / 1M개)"""
+    from menu_loader import MenuLoader
+    from models import DifficultyLevel, MenuCategory, SharingType
+
+    group_size, average_score = 4, 62.5
+
+    print("=== 메뉴 복합 조건 조회 벤치마크 ===")
+    for size in CATALOG_SIZES:
+        menus = _synthetic_menus(size)
+        loader = MenuLoader(menus=menus)
+        iterations = _catalog_iterations(args, size)
+
+        # query() 도입 전 그룹 추천 경로: 인원수 버킷 -> 공유 메뉴 리스트 -> 점수 리스트
+        def chained_group() -> list:
+            suitable = loader.get_suitable_menus_for_group(group_size)
+            shared = [menu for menu in suitable
+                      if menu.sharing_type in [SharingType.SHARED, SharingType.BOTH]]
+            suitable = shared or suitable
+            return [menu for menu in suitable if menu.is_suitable_for_score(average_score)] or list(suitable)
+
+        def query_group() -> tuple:
+            return loader.query(group_size=group_size, sharing=SharingType.SHARED, score=average_score).menus()
+
+        def chained_narrow() -> list:
+            suitable = loader.get_suitable_menus_for_score(60)
+            suitable = [menu for menu in suitable if menu.is_suitable_for_group_size(group_size)]
+            suitable = [menu for menu in suitable if menu.category == MenuCategory.KOREAN]
+            return [menu for menu in suitable if menu.difficulty == DifficultyLevel.EASY]
+
+        def query_narrow():
+            return loader.query(score=60, group_size=group_size, category=MenuCategory.KOREAN,
+                                difficulty=DifficultyLevel.EASY)
+
+        assert list(query_group()) == chained_group()
+        assert list(query_narrow().menus()) == chained_narrow()
+
+        plan = query_narrow().explain()
+        order = " -> ".join(f"{step['filter']}({step['cardinality']:,})" for step in plan["steps"])
+        print(f"--- 메뉴 {size:,}개 (4개 조건 계획: {order} = {plan['result']:,}개) ---")
+        cases = (
+            ("그룹 조건 3개 (메뉴 꺼내기 포함)", chained_group, query_group),
+            ("조건 4개 (메뉴 꺼내기 포함)", chained_narrow, lambda: query_narrow().menus()),
+            ("조건 4개 (개수만)", lambda: len(chained_narrow()), lambda: len(query_narrow())),
+        )
+        for label, chained, query in cases:
+            before = _report(f"{label} (리스트)", timeit.timeit(chained, number=iterations), iterations)
+            after = _report(f"{label} (비트셋)", timeit.timeit(query, number=iterations), iterations)
+            print(f"  속도 향상: {before / after:.1f}x")
+        del loader, menus
+
+
+def bench_catalog_snapshot(args: argparse.Namespace) -> None:
+    """전체 메뉴 조회: 호출마다 리스트 복사 vs 불변 카탈로그 스냅샷/뷰 (메뉴 50 / 10k / 1M개)"""
+    from menu_loader import MenuLoader
+    from models import DifficultyLevel, MenuCategory
+
+    print("=== 메뉴 카탈로그 스냅샷 벤치마크 ===")
+    for size in CATALOG_SIZES:
+        menus = _synthetic_menus(size)
+        loader = MenuLoader(menus=menus)
+        catalog = loader.catalog
+        iterations = _catalog_iterations(args, size)
+        first, last = size // 4, size // 4 + 20
+
+        # 스냅샷 도입 전: 내부 리스트를 호출마다 복사
+        assert list(catalog[first:last]) == menus[first:last]
+        print(f"--- 메뉴 {size:,}개 ---")
+        cases = (
+            ("get_all_menus", lambda: menus.copy(), loader.get_all_menus),
+            ("get_all_menus + 20개 슬라이스", lambda: menus.copy()[first:last],
+             lambda: loader.catalog[first:last]),
+            ("filter_by_category", lambda: list(catalog.by_category[MenuCategory.KOREAN]),
+             lambda: loader.filter_by_category(MenuCategory.KOREAN)),
+            ("filter_by_difficulty",
+             lambda: [menu for menu in menus if menu.difficulty == DifficultyLevel.EASY],
+             lambda: loader.filter_by_difficulty(DifficultyLevel.EASY)),
+        )
+        for label, copied, snapshot in cases:
+            before = _report(f"{label} (복사)", timeit.timeit(copied, number=iterations), iterations)
+            after = _report(f"{label} (스냅샷)", timeit.timeit(snapshot, number=iterations), iterations)
+            print(f"  속도 향상: {before / after:.1f}x")
+        del loader, menus, catalog
+
+
+def bench_menu_stats(args: argparse.Namespace) -> None:
+    """메뉴 통계: 호출마다 전체 메뉴 순회 vs 스냅샷마다 한 번 계산한 통계 (메뉴 50 / 10k / 1M개)"""
+    from menu_catalog import build_menu_statistics
+    from menu_loader import MenuLoader
+
+    print("=== 메뉴 카탈로그 통계 벤치마크 ===")
+    for size in CATALOG_SIZES:
+        menus = _synthetic_menus(size)
+        loader = MenuLoader(menus=menus)
+        bitsets = loader.catalog.bitsets
+        iterations = _catalog_iterations(args, size)
+
+        # 통계 사전 계산 도입 전: 호출마다 카운트 1회 + 최소/최대 4회 순회
+        def scan() -> dict:
+            categories, difficulties, sharing_types = {}, {}, {}
+            for menu in menus:
+                categories[menu.category.value] = categories.get(menu.category.value, 0) + 1
+                difficulties[menu.difficulty.value] = difficulties.get(menu.difficulty.value, 0) + 1
+                sharing_types[menu.sharing_type.value] = sharing_types.get(menu.sharing_type.value, 0) + 1
+            return {
+                "total": len(menus),
+                "categories": categories,
+                "difficulties": difficulties,
+                "sharing_types": sharing_types,
+                "score_ranges": {"min": min(menu.score_range[0] for menu in menus),
+                                 "max": max(menu.score_range[1] for menu in menus)},
+                "serving_sizes": {"min": min(menu.min_serving for menu in menus),
+                                  "max": max(menu.max_serving for menu in menus)}
+            }
+
+        assert loader.get_menu_statistics() == scan()
+        build_iterations = max(3, iterations // 10)
+        build_seconds = timeit.timeit(lambda: build_menu_statistics(bitsets),
+                                      number=build_iterations) / build_iterations
+        print(f"--- 메뉴 {size:,}개 (스냅샷당 통계 계산 {build_seconds * 1000:.2f} ms, "
+              f"키워드 {len(loader.get_catalog_statistics()['keywords'])}개) ---")
+        before = _report("get_menu_statistics (순회)", timeit.timeit(scan, number=iterations), iterations)
+        after = _report("get_menu_statistics (사전 계산)",
+                        timeit.timeit(loader.get_menu_statistics, number=iterations), iterations)
+        print(f"  속도 향상: {before / after:.1f}x")
+        _report("get_catalog_statistics (공유 사전)",
+                timeit.timeit(loader.get_catalog_statistics, number=iterations), iterations)
+        del loader, menus, bitsets
+
+
+# columnar-catalog 벤치마크의 하위 프로세스 코드 (인자: 모드, 메뉴 수, 컬럼형 파일 경로, 반복 횟수)
+_CATALOG_PROCESS_CODE = """
+import json, os, sys, time, timeit
+import benchmarks
+from fortune_engine import FortuneEngine
+from menu_loader import MenuLoader
+from menu_recommendation_engine import MenuRecommendationEngine
+mode, size, path, iterations = sys.argv[1], int(sys.argv[2]), sys.argv[3], int(sys.argv[4])
+fortune_engine = FortuneEngine()
+individual = fortune_engine.generate_individual_fortune("1990-05-15", "2024-05-01")
+group = fortune_engine.generate_group_fortune(["1990-05-15", "1985-12-03", "1992-08-20", "1988-03-10"], "2024-05-01")
+before = benchmarks._memory_kb(os.getpid())
+started = time.perf_counter()
+if mode == "columnar":
+    import menu_columns
+    loader = MenuLoader(menus=[])
+    loader.publish_catalog(menu_columns.ColumnarMenuCatalog(path, loader.catalog.version + 1))
+else:
+    loader = MenuLoader(menus=benchmarks._synthetic_menus(size))
+load_seconds = time.perf_counter() - started
+engine = MenuRecommendationEngine(loader)
+menu_id = loader.catalog[size // 2].id
+def uncached(recommend, fortune):
+    engine.recommendation_cache.clear()
+    return recommend(fortune)
+timings = {
+    "group": timeit.timeit(lambda: uncached(engine.recommend_for_group, group), number=iterations) / iterations,
+    "individual": timeit.timeit(lambda: uncached(engine.recommend_for_individual, individual), number=iterations) / iterations,
+    "by_id": timeit.timeit(lambda: loader.get_menu_by_id(menu_id), number=1000) / 1000,
+}
+after = benchmarks._memory_kb(os.getpid())
+print(json.dumps({
+    "load_seconds": load_seconds, "timings": timings,
+    "anonymous": after["anonymous"] - before["anonymous"], "rss": after["rss"] - before["rss"],
+    "recommendations": [rec.menu.id for rec in engine.recommend_for_group(group)]
+}))
+"""
+
+
+def bench_columnar_catalog(args: argparse.Namespace) -> None:
+    """
+    메뉴 카탈로그 메모리: Menu 객체 카탈로그 vs mmap 컬럼형 카탈로그 (새 프로세스, 메뉴 50 / 10k / 1M개)
+
+    힙은 프로세스마다 따로 쓰는 익명 메모리이고, RSS에는 워커끼리 공유되는 mmap 파일 페이지도 포함됩니다.
+    """
+    import tempfile
+    import menu_columns
+
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    print("=== 컬럼형 메뉴 카탈로그 벤치마크 (새 프로세스, 메모리는 로드와 추천 후 증가량 kB) ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in CATALOG_SIZES:
+            path = os.path.join(temp_dir, f"menu_columns_{size}.bin")
+            written = menu_columns.write_columnar_catalog(_synthetic_menus(size), path)
+            iterations = _catalog_iterations(args, size)
+
+            results = {}
+            for mode in ("memory", "columnar"):
+                completed = subprocess.run(
+                    [sys.executable, "-c", _CATALOG_PROCESS_CODE, mode, str(size), path, str(iterations)],
+                    cwd=backend_dir, capture_output=True, text=True, check=True
+                )
+                results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+            assert results["memory"]["recommendations"] == results["columnar"]["recommendations"]
+
+            print(f"--- 메뉴 {size:,}개 (컬럼형 파일 {written['bytes']:,} bytes) ---")
+            for mode, label in (("memory", "Menu 객체"), ("columnar", "컬럼형 mmap")):
+                result = results[mode]
+                timings = result["timings"]
+                print(f"  {label:<10} 로드 {result['load_seconds'] * 1000:9.1f} ms | "
+                      f"힙 +{result['anonymous']:10,} | RSS +{result['rss']:10,} | "
+                      f"그룹 추천 {timings['group'] * 1000:8.2f} ms | 개인 추천 {timings['individual'] * 1000:8.2f} ms | "
+                      f"ID 조회 {timings['by_id'] * 1_000_000:6.2f} µs")
+
+
+_STREAM_PROCESS_CODE = """
+import json, os, resource, sys, time
+import benchmarks, menu_stream
+from models import Menu
+mode, path, workers = sys.argv[1], sys.argv[2], int(sys.argv[3])
+before = benchmarks._memory_kb(os.getpid())["rss"]
+started = time.perf_counter()
+if mode == "json.load":
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    menus = [Menu.from_dict(record) for record in data["menus"]]
+    del data
+else:
+    menus, report = menu_stream.load_menu_file(path, workers)
+seconds = time.perf_counter() - started
+print(json.dumps({
+    "seconds": seconds, "count": len(menus), "last": menus[-1].id,
+    "peak": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before,
+    "retained": benchmarks._memory_kb(os.getpid())["rss"] - before,
+    "workers_peak": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+}))
+"""
+
+
+def bench_menu_stream(args: argparse.Namespace) -> None:
+    """
+    메뉴 파일 로드: json.load 후 검증 vs 스트리밍 청크 검증 (현재 프로세스 / 프로세스 풀, 새 프로세스, 메뉴 10k / 1M개)
+
+    최대 메모리에서 로드 후 남은 메모리(카탈로그 자체)를 뺀 값이 로드 중에만 쓰인 임시 메모리입니다.
+    """
+    import tempfile
+
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    workers = max(2, os.cpu_count() or 1)
+    print(f"=== 메뉴 스트리밍 로드 벤치마크 (새 프로세스, 메모리 kB, 프로세스 풀 워커 {workers}개, CPU {os.cpu_count()}개) ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in CATALOG_SIZES[1:]:
+            json_path = os.path.join(temp_dir, f"menus_{size}.json")
+            jsonl_path = os.path.join(temp_dir, f"menus_{size}.jsonl")
+            menus = _synthetic_menus(size)
+            with open(json_path, "w", encoding="utf-8") as json_file, \
+                    open(jsonl_path, "w", encoding="utf-8") as jsonl_file:
+                json_file.write('{"menus": [\n')
+                for index, menu in enumerate(menus):
+                    line = json.dumps(menu.to_dict(), ensure_ascii=False)
+                    json_file.write(f"{',' if index else ''}{line}\n")
+                    jsonl_file.write(f"{line}\n")
+                json_file.write("]}\n")
+            del menus
+
+            print(f"--- 메뉴 {size:,}개 (JSON {os.path.getsize(json_path):,} bytes) ---")
+            baseline = None
+            for label, mode, path, mode_workers in (
+                ("json.load + 검증", "json.load", json_path, 0),
+                ("JSON 스트리밍", "stream", json_path, 0),
+                ("JSON 스트리밍 + 풀", "stream", json_path, workers),
+                ("JSONL 스트리밍", "stream", jsonl_path, 0),
+                ("JSONL 스트리밍 + 풀", "stream", jsonl_path, workers),
+            ):
+                completed = subprocess.run(
+                    [sys.executable, "-c", _STREAM_PROCESS_CODE, mode, path, str(mode_workers)],
+                    cwd=backend_dir, capture_output=True, text=True, check=True
+                )
+                result = json.loads(completed.stdout.strip().splitlines()[-1])
+                assert result["count"] == size and result["last"] == f"menu_{size - 1:07d}"
+                baseline = baseline or result["seconds"]
+                pool = f" | 워커 최대 {result['workers_peak']:10,}" if mode_workers else ""
+                print(f"  {label:<16} {result['seconds'] * 1000:10.1f} ms ({baseline / result['seconds']:4.2f}x) | "
+                      f"최대 +{result['peak']:10,} | 유지 +{result['retained']:10,} | "
+                      f"임시 {result['peak'] - result['retained']:10,}{pool}")
+
+
+def bench_menu_reload(args: argparse.Namespace) -> Optional[int]:
+    """
+    메뉴 카탈로그 핫 리로드 중 추천 지연 시간과 스냅샷 일관성 (메뉴 10k개, 리더 스레드 8개)
+
+    리로드마다 메뉴 ID 접두사를 바꿔 파일을 다시 쓰고, 추천 한 번의 결과에 서로 다른
+    세대의 메뉴가 섞이지 않았는지 확인합니다. 추천 결과 캐시의 적중/미스 시간도 함께 측정합니다.
+    """
+    import tempfile
+    import threading
+    from fortune_engine import FortuneEngine
+    from menu_loader import MenuLoader
+    from menu_recommendation_engine import MenuRecommendationEngine
+
+    size = CATALOG_SIZES[1]
+    reloads = 5
+    records = [menu.to_dict() for menu in _synthetic_menus(size)]
+    fortune_engine = FortuneEngine()
+    fortunes = [fortune_engine.generate_individual_fortune(birth_date, "2024-05-01")
+                for birth_date in _sample_birth_dates(200)]
+
+    print(f"=== 메뉴 핫 리로드 벤치마크 (메뉴 {size:,}개, 리더 스레드 8개, 리로드 {reloads}회) ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "menus.json")
+
+        def write_catalog(prefix: str) -> None:
+            for record, menu_id in zip(records, (f"{prefix}{index:07d}" for index in range(size))):
+                record["id"] = menu_id
+            with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+                json.dump({"menus": records}, f, ensure_ascii=False)
+            os.replace(f"{path}.tmp", path)
+
+        write_catalog("g0_")
+        loader = MenuLoader(path, use_bundle=False)
+        engine = MenuRecommendationEngine(loader, cache_max_entries=1)
+        latencies: Dict[str, List[float]] = {"idle": [], "reload": []}
+        phase = "idle"
+        mixed = 0
+        stop = threading.Event()
+
+        def reader(offset: int) -> None:
+            nonlocal mixed
+            index = offset
+            while not stop.is_set():
+                started = time.perf_counter()
+                recommendations = engine.recommend_for_individual(fortunes[index % len(fortunes)], 5)
+                latencies[phase].append(time.perf_counter() - started)
+                if len({rec.menu.id.split("_")[0] for rec in recommendations}) > 1:
+                    mixed += 1
+                index += 8
+
+        threads = [threading.Thread(target=reader, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        time.sleep(3.0)
+        phase = "reload"
+        reload_seconds = []
+        for generation in range(1, reloads + 1):
+            write_catalog(f"g{generation}_")
+            started = time.perf_counter()
+            loader.reload()
+            reload_seconds.append(time.perf_counter() - started)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    def percentile(samples: List[float], ratio: float) -> float:
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+    print(f"  리로드 {sum(reload_seconds) / reloads * 1000:8.1f} ms/회 (세대 {loader.generation})")
+    for label, key in (("평상시", "idle"), ("리로드 중", "reload")):
+        samples = latencies[key]
+        print(f"  {label:<8} 추천 {len(samples):7,}회 | p50 {percentile(samples, 0.5) * 1000:7.2f} ms | "
+              f"p99 {percentile(samples, 0.99) * 1000:7.2f} ms | 최대 {max(samples) * 1000:8.2f} ms")
+
+    cached_engine = MenuRecommendationEngine(loader)
+    fortune = fortunes[0]
+    miss_iterations = max(10, min(args.iterations, 100))
+    miss = timeit.timeit(lambda: (cached_engine.recommendation_cache.clear(),
+                                  cached_engine.recommend_for_individual(fortune, 5)), number=miss_iterations)
+    _report("추천 (캐시 미스)", miss, miss_iterations)
+    hit_iterations = max(10, min(args.iterations, 10_000))
+    _report("추천 (캐시 적중)", timeit.timeit(lambda: cached_engine.recommend_for_individual(fortune, 5),
+                                         number=hit_iterations), hit_iterations)
+
+    if mixed:
+        print(f"❌ 세대가 섞인 추천 결과 {mixed}건")
+        return 1
+    print("✅ 모든 추천 결과가 하나의 카탈로그 세대에서 나왔습니다")
+    return 0
+
+
+def bench_menu_sqlite(args: argparse.Namespace) -> None:
+    """메뉴 조회: 메모리 카탈로그(MenuLoader) vs SQLite 인덱스 조회(SqliteMenuLoader) (메뉴 50 / 10k / 1M개)"""
+    import tempfile
+    from fortune_engine import FortuneEngine
+    from menu_loader import MenuLoader
+    from menu_recommendation_engine import MenuRecommendationEngine
+    from menu_sqlite import SqliteMenuLoader, write_database
+    from models import DifficultyLevel, MenuCategory, SharingType
+
+    fortune_engine = FortuneEngine()
+    group = fortune_engine.generate_group_fortune(["1990-05-15", "1985-12-03", "1992-08-20", "1988-03-10"],
+                                                  "2024-05-01")
+
+    print("=== SQLite 메뉴 카탈로그 벤치마크 ===")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in CATALOG_SIZES:
+            menus = _synthetic_menus(size)
+            path = os.path.join(temp_dir, f"menus_{size}.db")
+            started = time.perf_counter()
+            written = write_database(menus, path)
+            write_seconds = time.perf_counter() - started
+            loaders = {"메모리": MenuLoader(menus=menus), "SQLite": SqliteMenuLoader(path)}
+            engines = {label: MenuRecommendationEngine(loader) for label, loader in loaders.items()}
+            iterations = _catalog_iterations(args, size)
+            target_id = menus[size * 3 // 4].id
+            batch_ids = [menus[index * size // 20].id for index in range(20)]
+
+            def narrow(loader) -> tuple:
+                return loader.query(score=60, group_size=4, category=MenuCategory.KOREAN,
+                                    difficulty=DifficultyLevel.EASY).menus()
+
+            def uncached_group(engine) -> list:
+                engine.recommendation_cache.clear()
+                return engine.recommend_for_group(group)
+
+            memory, sqlite = loaders["메모리"], loaders["SQLite"]
+            assert narrow(memory) == narrow(sqlite)
+            assert memory.get_suitable_menus_for_group(4, True) == sqlite.get_suitable_menus_for_group(4, True)
+            assert memory.get_menu_statistics() == sqlite.get_menu_statistics()
+            assert ([rec.menu.id for rec in uncached_group(engines["메모리"])]
+                    == [rec.menu.id for rec in uncached_group(engines["SQLite"])])
+
+            print(f"--- 메뉴 {size:,}개 (데이터베이스 생성 {write_seconds * 1000:.1f} ms, "
+                  f"{written['bytes']:,} bytes) ---")
+            cases = (
+                ("get_menu_by_id", lambda loader, engine: loader.get_menu_by_id(target_id)),
+                ("get_menus_by_ids (20개)", lambda loader, engine: loader.get_menus_by_ids(batch_ids)),
+                ("조건 4개 (메뉴 꺼내기 포함)", lambda loader, engine: narrow(loader)),
+                ("조건 4개 (개수만)", lambda loader, engine: len(loader.query(
+                    score=60, group_size=4, category=MenuCategory.KOREAN, difficulty=DifficultyLevel.EASY))),
+                ("get_suitable_menus_for_group(shared)",
+                 lambda loader, engine: loader.get_suitable_menus_for_group(4, prefer_shared=True)),
+                ("filter_by_sharing_type", lambda loader, engine: loader.filter_by_sharing_type(SharingType.SHARED)),
+                ("get_menu_statistics", lambda loader, engine: loader.get_menu_statistics()),
+                ("그룹 추천 (캐시 미스)", lambda loader, engine: uncached_group(engine)),
+            )
+            for label, case in cases:
+                before = after = 0.0
+                for loader_label, loader in loaders.items():
+                    engine = engines[loader_label]
+                    per_call = _report(f"{label} ({loader_label})",
+                                       timeit.timeit(lambda: case(loader, engine), number=iterations), iterations)
+                    if loader_label == "메모리":
+                        before = per_call
+                    else:
+                        after = per_call
+                print(f"  SQLite / 메모리: {after / before:.1f}x")
+            del loaders, engines, memory, sqlite, menus
+
+
+def bench_cold_start(args: argparse.Namespace) -> None:
+    """새 프로세스에서 메뉴/템플릿 로더 초기화 시간: JSON 파싱 + 검증 vs 데이터 번들"""
+    import tempfile
+    import data_bundle
+
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    # 표준 라이브러리/모델 import 시간은 두 경우가 같으므로 측정에서 제외
+    code = (
+        "import time, json, pickle, models, data_bundle, fortune_template_loader; "
+        "started = time.perf_counter(); "
+        "import menu_loader; fortune_template_loader.FortuneTemplateLoader(); "
+        "print(time.perf_counter() - started)"
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "data_bundle.bin")
+        result = data_bundle.build_bundle(output_path=path)
+        print("=== 콜드 스타트 벤치마크 (새 프로세스, 5회 중 최솟값) ===")
+        print(f"  메뉴 {result['menus']}개, 번들 {result['bytes']:,} bytes")
+
+        timings = {}
+        for label, bundle in (("JSON", ""), ("데이터 번들", path)):
+            env = dict(os.environ, FORTUNE_DATA_BUNDLE=bundle)
+            samples = []
+            for _ in range(5):
+                completed = subprocess.run(
+                    [sys.executable, "-c", code], cwd=backend_dir, env=env,
+                    capture_output=True, text=True, check=True
+                )
+                samples.append(float(completed.stdout.strip().splitlines()[-1]))
+            timings[label] = min(samples)
+            print(f"  {label:<10} {timings[label] * 1000:8.2f} ms")
+        print(f"  속도 향상: {timings['JSON'] / timings['데이터 번들']:.1f}x")
+
+
+def _memory_kb(pid: int) -> Dict[str, int]:
+    """/proc/<pid>/smaps_rollup의 Rss, Pss, 전용 메모리(USS), 익명(힙) 메모리 (kB)"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                values[parts[0][:-1]] = int(parts[1])
+    return {
+        "rss": values.get("Rss", 0),
+        "pss": values.get("Pss", 0),
+        "uss": values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+        "anonymous": values.get("Anonymous", 0)
+    }
+
+
+def bench_worker_memory(args: argparse.Namespace) -> Optional[int]:
+    """gunicorn 워커별 메모리: 워커마다 로드 vs --preload (마스터에서 한 번 로드 후 copy-on-write 공유)"""
+    import socket
+    import urllib.request
+
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        print("gunicorn이 설치되어 있지 않습니다 (pip install gunicorn)")
+        return 1
+
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, FLASK_ENV="production")
+    fortune_request = json.dumps({
+        "mode": "individual", "participants": [{"birth_date": "1990-05-15"}]
+    }).encode()
+    menu_request = json.dumps({
+        "mode": "individual",
+        "fortune_data": {
+            "individual_score": 75,
+            "categories": {
+                category: {"score": 75, "message": "-", "keywords": []}
+                for category in ("love", "health", "wealth", "career")
+            }
+        }
+    }).encode()
+
+    def post(url: str, body: bytes) -> None:
+        request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+        urllib.request.urlopen(request, timeout=30).read()
+
+    print(f"=== gunicorn 워커 메모리 벤치마크 (워커 {args.workers}개, kB) ===")
+    # 워커마다 로드: 저장소의 gunicorn.conf.py(preload_app = True) 대신 빈 설정 사용
+    for label, extra in (("워커마다 로드", ["--config", os.devnull]), ("--preload", ["--preload"])):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        base_url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "--workers", str(args.workers),
+             "--bind", f"127.0.0.1:{port}", *extra, "app:app"],
+            cwd=backend_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            for _ in range(300):
+                try:
+                    urllib.request.urlopen(f"{base_url}/api/status", timeout=1).read()
+                    break
+                except OSError:
+                    time.sleep(0.1)
+
+            # 요청을 여러 번 보내 모든 워커가 운세/메뉴 데이터를 사용하도록 함
+            for _ in range(args.workers * 10):
+                post(f"{base_url}/api/fortune", fortune_request)
+                post(f"{base_url}/api/menu-recommendation", menu_request)
+            time.sleep(1)
+
+            with open(f"/proc/{server.pid}/task/{server.pid}/children") as f:
+                workers = [int(pid) for pid in f.read().split()]
+            samples = [_memory_kb(pid) for pid in workers]
+            master = _memory_kb(server.pid)
+        finally:
+            server.terminate()
+            server.wait()
+
+        average = {key: sum(sample[key] for sample in samples) / len(samples) for key in ("rss", "pss", "uss")}
+        total_pss = master["pss"] + sum(sample["pss"] for sample in samples)
+        print(f"  {label:<12} 워커당 RSS {average['rss']:9,.0f} | PSS {average['pss']:9,.0f} | "
+              f"USS {average['uss']:9,.0f} | 전체 PSS(마스터 포함) {total_pss:10,.0f}")
+    return 0
+
+
+def _sample_birth_dates(count: int) -> List[str]:
+    """1900-01-01부터 일정 간격으로 떨어진 생년월일 샘플 생성"""
+    from datetime import date, timedelta
+
+    start = date(1900, 1, 1)
+    step = max(1, 45000 // max(1, count))
+    return [(start + timedelta(days=i * step % 45000)).isoformat() for i in range(count)]
+
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], Optional[int]]] = {
+    "score-kernel": bench_score_kernel,
+    "daily-table": bench_daily_table,
+    "fortune-cache": bench_fortune_cache,
+    "large-group": bench_large_group,
+    "forecast": bench_forecast,
+    "flyweight": bench_flyweight,
+    "template-lookup": bench_template_lookup,
+    "special-combination": bench_special_combination,
+    "menu-buckets": bench_menu_buckets,
+    "menu-lookup": bench_menu_lookup,
+    "keyword-index": bench_keyword_index,
+    "menu-query": bench_menu_query,
+    "catalog-snapshot": bench_catalog_snapshot,
+    "menu-stats": bench_menu_stats,
+    "columnar-catalog": bench_columnar_catalog,
+    "menu-stream": bench_menu_stream,
+    "menu-reload": bench_menu_reload,
+    "menu-sqlite": bench_menu_sqlite,
+    "cold-start": bench_cold_start,
+    "worker-memory": bench_worker_memory,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fortune Dinner Recommender 벤치마크")
+    parser.add_argument("name", choices=sorted(BENCHMARKS), help="실행할 벤치마크")
+    parser.add_argument("--iterations", type=int, default=100_000, help="반복 횟수")
+    parser.add_argument("--workers", type=int, default=8, help="gunicorn 워커 수")
+    args = parser.parse_args()
+
+    return BENCHMARKS[args.name](args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
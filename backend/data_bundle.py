@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+사전 컴파일된 데이터 번들
+menus.json과 fortune_templates.json을 검증/컴파일한 결과(파생 인덱스 포함)를
+체크섬이 붙은 하나의 바이너리 파일로 저장하고, 부팅 시 한 번의 읽기로 로드
+
+사용법 (배포 빌드 단계): python data_bundle.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# 파일 형식 식별자 (형식이 바뀌면 숫자를 올려 이전 번들을 무효화)
+BUNDLE_MAGIC = b"FDRBNDL2"
+_CHECKSUM_SIZE = 32
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_BUNDLE_PATH = os.path.join(_DATA_DIR, 'data_bundle.bin')
+DEFAULT_MENUS_PATH = os.path.join(_DATA_DIR, 'menus.json')
+DEFAULT_TEMPLATES_PATH = os.path.join(_DATA_DIR, 'fortune_templates.json')
+
+
+def bundle_path() -> Optional[str]:
+    """
+    사용할 번들 경로 (FORTUNE_DATA_BUNDLE 환경 변수로 변경, 빈 문자열이면 번들 비활성화)
+
+    Returns:
+        Optional[str]: 번들 파일 경로 또는 None
+    """
+    return os.environ.get('FORTUNE_DATA_BUNDLE', DEFAULT_BUNDLE_PATH) or None
+
+
+def _sha256_file(path: str) -> str:
+    """파일 내용의 SHA-256 16진수 다이제스트"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_info(path: str) -> Dict[str, Any]:
+    """원본 파일의 경로, 크기, 수정 시각, 체크섬"""
+    stat = os.stat(path)
+    return {
+        "path": os.path.abspath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _sha256_file(path)
+    }
+
+
+def is_source_fresh(info: Dict[str, Any]) -> bool:
+    """
+    번들을 만든 뒤 원본 파일이 바뀌지 않았는지 확인
+
+    크기와 수정 시각이 같으면 stat 한 번으로 판단하고, 수정 시각만 다르면
+    (체크아웃, touch 등) 내용의 체크섬을 비교합니다.
+    """
+    try:
+        stat = os.stat(info["path"])
+        if stat.st_size != info["size"]:
+            return False
+        if stat.st_mtime_ns == info["mtime_ns"]:
+            return True
+        return _sha256_file(info["path"]) == info["sha256"]
+    except OSError:
+        return False
+
+
+class DataBundle:
+    """로드된 데이터 번들 (섹션별 원본 파일 정보와 컴파일된 데이터)"""
+
+    def __init__(self, path: str, sources: Dict[str, Dict[str, Any]], sections: Dict[str, Any]):
+        """
+        Args:
+            path: 번들 파일 경로
+            sources: 섹션별 원본 파일 정보
+            sections: 섹션별 컴파일된 데이터
+        """
+        self.path = path
+        self.sources = sources
+        self.sections = sections
+
+    def source_path(self, name: str) -> Optional[str]:
+        """섹션 원본 파일의 절대 경로"""
+        info = self.sources.get(name)
+        return info["path"] if info else None
+
+    def fresh_section(self, name: str) -> Optional[Any]:
+        """
+        원본 파일이 바뀌지 않은 섹션 데이터 반환
+
+        Args:
+            name: 섹션 이름 ("menus" 또는 "templates")
+
+        Returns:
+            섹션 데이터, 번들에 없거나 원본이 바뀌었으면 None (JSON으로 로드해야 함)
+        """
+        info = self.sources.get(name)
+        if info is None or name not in self.sections or not is_source_fresh(info):
+            return None
+        return self.sections[name]
+
+
+def load_source_menus(menus_path: str, workers: int = 0) -> Tuple[List[Any], Any]:
+    """
+    빌드 단계에서 원본 메뉴 JSON을 로드
+
+    MenuLoader는 로드 실패를 빈 카탈로그로 대신하므로, 빌드 도구가 빈 산출물을
+    만들지 않도록 menu_stream으로 직접 읽고 실패하면 예외를 그대로 전달합니다.
+
+    Args:
+        menus_path: 메뉴 데이터 JSON 경로
+        workers: 메뉴 검증에 사용할 워커 프로세스 수 (0이면 현재 프로세스)
+
+    Returns:
+        Tuple[List[Menu], MenuLoadReport]: (검증된 메뉴, 로드 리포트)
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        ValueError: JSON 문법 오류 등 파일 형식이 잘못된 경우
+    """
+    import menu_stream
+
+    menus, report = menu_stream.load_menu_file(menus_path, workers)
+    if report.rejected:
+        print(f"검증에 실패한 메뉴 {report.rejected}개를 건너뛰었습니다.", file=sys.stderr)
+    return menus, report
+
+
+def build_bundle(menus_path: str = DEFAULT_MENUS_PATH,
+                 templates_path: str = DEFAULT_TEMPLATES_PATH,
+                 output_path: str = DEFAULT_BUNDLE_PATH, workers: int = 0) -> Dict[str, Any]:
+    """
+    JSON 데이터 파일을 검증/컴파일해 번들 파일 생성
+
+    Args:
+        menus_path: 메뉴 데이터 JSON 경로
+        templates_path: 운세 템플릿 JSON 경로
+        output_path: 생성할 번들 경로
+        workers: 메뉴 검증에 사용할 워커 프로세스 수 (0이면 현재 프로세스)
+
+    Returns:
+        Dict[str, Any]: 빌드 결과 요약
+
+    Raises:
+        OSError: 원본 파일을 읽을 수 없는 경우
+        ValueError: 원본 파일 형식이 잘못된 경우
+    """
+    from menu_catalog import build_menu_indexes
+    from fortune_template_loader import FortuneTemplateLoader
+
+    sources = {
+        "menus": source_info(menus_path),
+        "templates": source_info(templates_path)
+    }
+
+    menus, report = load_source_menus(menus_path, workers)
+    template_snapshot = FortuneTemplateLoader(templates_path, use_bundle=False).snapshot
+
+    sections = {
+        "menus": {
+            "menus": menus,
+            "indexes": build_menu_indexes(menus)
+        },
+        "templates": {
+            "templates": template_snapshot.templates,
+            "score_table": template_snapshot.score_table,
+            "harmony_table": template_snapshot.harmony_table,
+            "special_table": template_snapshot.special_table
+        }
+    }
+
+    payload = pickle.dumps({"sources": sources, "sections": sections}, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # 쓰는 도중의 번들을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(BUNDLE_MAGIC + hashlib.sha256(payload).digest() + payload)
+    os.replace(temp_path, output_path)
+
+    return {
+        "path": os.path.abspath(output_path),
+        "bytes": len(BUNDLE_MAGIC) + _CHECKSUM_SIZE + len(payload),
+        "menus": len(menus),
+        "rejected_menus": report.rejected,
+        "sources": {name: info["path"] for name, info in sources.items()}
+    }
+
+
+def read_bundle(path: str) -> DataBundle:
+    """
+    번들 파일을 한 번에 읽어 체크섬을 확인한 뒤 로드
+
+    번들은 배포 빌드 단계에서 만든 신뢰할 수 있는 파일이어야 합니다 (pickle 형식).
+
+    Args:
+        path: 번들 파일 경로
+
+    Returns:
+        DataBundle: 로드된 번들
+
+    Raises:
+        ValueError: 형식이 다르거나 체크섬이 맞지 않는 경우
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    header_size = len(BUNDLE_MAGIC) + _CHECKSUM_SIZE
+    if len(data) < header_size or not data.startswith(BUNDLE_MAGIC):
+        raise ValueError(f"데이터 번들 형식이 올바르지 않습니다: {path}")
+
+    payload = memoryview(data)[header_size:]
+    if hashlib.sha256(payload).digest() != data[len(BUNDLE_MAGIC):header_size]:
+        raise ValueError(f"데이터 번들 체크섬이 맞지 않습니다: {path}")
+
+    content = pickle.loads(payload)
+    return DataBundle(path, content["sources"], content["sections"])
+
+
+# 프로세스당 한 번만 읽는 번들 (_bundle_loaded가 False면 아직 읽지 않음)
+_bundle: Optional[DataBundle] = None
+_bundle_loaded = False
+
+
+def get_bundle() -> Optional[DataBundle]:
+    """
+    프로세스 전역 번들 반환 (처음 호출될 때 한 번 읽음)
+
+    Returns:
+        Optional[DataBundle]: 번들, 비활성화되었거나 없거나 손상되었으면 None
+    """
+    global _bundle, _bundle_loaded
+    if not _bundle_loaded:
+        path = bundle_path()
+        if path is not None and os.path.exists(path):
+            try:
+                _bundle = read_bundle(path)
+            except (OSError, ValueError, pickle.UnpicklingError, EOFError, KeyError, AttributeError):
+                # 손상되었거나 형식이 다른 번들은 무시하고 JSON으로 로드
+                _bundle = None
+        _bundle_loaded = True
+    return _bundle
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점 (배포 빌드 단계에서 실행)"""
+    parser = argparse.ArgumentParser(description="메뉴/운세 템플릿 데이터 번들 생성")
+    parser.add_argument("--menus", default=DEFAULT_MENUS_PATH, help="메뉴 데이터 JSON 경로")
+    parser.add_argument("--templates", default=DEFAULT_TEMPLATES_PATH, help="운세 템플릿 JSON 경로")
+    parser.add_argument("--output", default=DEFAULT_BUNDLE_PATH, help="생성할 번들 경로")
+    parser.add_argument("--workers", type=int, default=0, help="메뉴 검증 워커 프로세스 수 (0이면 현재 프로세스)")
+    args = parser.parse_args(argv)
+
+    try:
+        result = build_bundle(args.menus, args.templates, args.output, args.workers)
+    except (OSError, ValueError) as e:
+        print(f"번들을 만들지 못했습니다: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+운세 점수 알고리즘 레지스트리
+이름과 버전이 붙은 점수 알고리즘을 등록하고 버전 문자열로 조회
+"""
+
+import abc
+import hashlib
+import random
+from datetime import date
+from typing import Dict, List
+
+import fortune_kernel
+
+# 점수 알고리즘 버전
+ALGORITHM_V1 = "v1"  # MD5 시드 + random.normalvariate (기존 알고리즘)
+ALGORITHM_V2 = "v2"  # 상태 없는 해시 커널 + 분위수 테이블
+DEFAULT_ALGORITHM_VERSION = ALGORITHM_V1
+
+
+class FortuneAlgorithm(abc.ABC):
+    """
+    점수 알고리즘 기본 클래스 (category_scores를 구현하지 않은 하위 클래스는 인스턴스를 만들 수 없음)
+
+    같은 버전은 같은 입력에 대해 영원히 같은 점수를 내야 합니다. 점수 계산 방식을
+    바꿀 때는 기존 알고리즘을 고치지 말고 새 버전으로 등록하세요. 버전은 캐시 키와
+    응답에 함께 실리므로 이전 버전으로 만든 결과와 섞이지 않습니다.
+    """
+
+    version: str = ""
+    description: str = ""
+
+    # DailyFortuneTable(상태 없는 커널 기반)로 하루치 점수를 미리 계산할 수 있는지 여부
+    supports_daily_table: bool = False
+
+    @abc.abstractmethod
+    def category_scores(self, birth_date: str, current_date: str,
+                        categories: List[str]) -> Dict[str, int]:
+        """
+        모든 카테고리 점수 계산
+
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            current_date: 운세 날짜 (YYYY-MM-DD)
+            categories: 카테고리 이름 리스트
+
+        Returns:
+            Dict[str, int]: 카테고리별 1-100 점수
+        """
+
+    def date_range_scores(self, birth_date: str, first_date_ordinal: int, days: int,
+                          categories: List[str]) -> List[Dict[str, int]]:
+        """
+        연속된 날짜 구간의 카테고리 점수 계산 (기본 구현은 날짜별 반복)
+
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            first_date_ordinal: 첫 운세 날짜 서수
+            days: 날짜 수
+            categories: 카테고리 이름 리스트
+
+        Returns:
+            List[Dict[str, int]]: 날짜별 카테고리 점수
+        """
+        return [
+            self.category_scores(birth_date, date.fromordinal(first_date_ordinal + offset).isoformat(), categories)
+            for offset in range(days)
+        ]
+
+
+class SeededNormalAlgorithm(FortuneAlgorithm):
+    """v1: 생년월일+날짜 MD5 시드로 카테고리별 정규분포 점수 생성"""
+
+    version = ALGORITHM_V1
+    description = "MD5 시드 + random.normalvariate (평균 60, 표준편차 20)"
+
+    def generate_seed(self, birth_date: str, current_date: str) -> int:
+        """
+        생년월일과 현재 날짜를 조합하여 일관된 시드 생성
+
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            current_date: 현재 날짜 (YYYY-MM-DD)
+
+        Returns:
+            int: 생성된 시드값
+        """
+        # 문자열을 조합하여 해시 생성
+        combined_string = f"{birth_date}_{current_date}"
+        hash_object = hashlib.md5(combined_string.encode())
+        # 해시를 정수로 변환 (32비트 범위 내)
+        return int(hash_object.hexdigest(), 16) % (2**31)
+
+    def generate_category_score(self, seed: int, category: str) -> int:
+        """
+        카테고리별 운세 점수 생성 (정규분포 기반)
+
+        Args:
+            seed: 기본 시드값
+            category: 카테고리 이름
+
+        Returns:
+            int: 1-100 사이의 점수
+        """
+        # 카테고리별로 다른 시드 생성
+        category_hash = hashlib.md5(category.encode()).hexdigest()
+        category_seed = seed + int(category_hash[:8], 16)
+
+        # 호출마다 독립된 난수 생성기 사용 (전역 random 상태를 건드리지 않음)
+        rng = random.Random(category_seed)
+
+        # 정규분포를 따르는 점수 생성 (평균 60, 표준편차 20)
+        score = rng.normalvariate(60, 20)
+
+        # 1-100 범위로 제한
+        return max(1, min(100, int(round(score))))
+
+    def category_scores(self, birth_date: str, current_date: str,
+                        categories: List[str]) -> Dict[str, int]:
+        seed = self.generate_seed(birth_date, current_date)
+        return {category: self.generate_category_score(seed, category) for category in categories}
+
+
+class HashKernelAlgorithm(FortuneAlgorithm):
+    """v2: 상태 없는 SplitMix64 해시 커널 + 정규분포 분위수 테이블"""
+
+    version = ALGORITHM_V2
+    description = "SplitMix64 해시 커널 + 2^16 분위수 테이블 (평균 60, 표준편차 20)"
+    supports_daily_table = True
+
+    def category_scores(self, birth_date: str, current_date: str,
+                        categories: List[str]) -> Dict[str, int]:
+        birth_ordinal = fortune_kernel.date_ordinal(birth_date)
+        date_ordinal = fortune_kernel.date_ordinal(current_date)
+        return {
+            category: fortune_kernel.score_from_ordinals(
+                birth_ordinal, date_ordinal, fortune_kernel.category_key(category)
+            )
+            for category in categories
+        }
+
+    def date_range_scores(self, birth_date: str, first_date_ordinal: int, days: int,
+                          categories: List[str]) -> List[Dict[str, int]]:
+        # 날짜 축 전체를 하나의 배치로 계산
+        width = len(categories)
+        scores = fortune_kernel.scores_for_date_range(
+            fortune_kernel.date_ordinal(birth_date),
+            first_date_ordinal,
+            days,
+            [fortune_kernel.category_key(category) for category in categories]
+        )
+        return [
+            dict(zip(categories, scores[offset * width:(offset + 1) * width]))
+            for offset in range(days)
+        ]
+
+
+# 버전별 등록된 알고리즘
+_algorithms: Dict[str, FortuneAlgorithm] = {}
+
+
+def register_algorithm(algorithm: FortuneAlgorithm) -> FortuneAlgorithm:
+    """
+    알고리즘 등록
+
+    Args:
+        algorithm: 등록할 알고리즘 인스턴스
+
+    Returns:
+        FortuneAlgorithm: 등록된 알고리즘
+
+    Raises:
+        ValueError: 버전이 비어있거나 다른 알고리즘이 같은 버전으로 이미 등록된 경우
+    """
+    if not algorithm.version:
+        raise ValueError("알고리즘 버전은 비어있을 수 없습니다")
+    registered = _algorithms.get(algorithm.version)
+    if registered is not None and registered is not algorithm:
+        raise ValueError(f"이미 등록된 알고리즘 버전입니다: {algorithm.version}")
+    _algorithms[algorithm.version] = algorithm
+    return algorithm
+
+
+def get_algorithm(version: str) -> FortuneAlgorithm:
+    """
+    버전 문자열로 알고리즘 조회
+
+    Args:
+        version: 알고리즘 버전 (예: "v1")
+
+    Returns:
+        FortuneAlgorithm: 등록된 알고리즘
+
+    Raises:
+        ValueError: 등록되지 않은 버전인 경우
+    """
+    algorithm = _algorithms.get(version)
+    if algorithm is None:
+        raise ValueError(f"지원하지 않는 알고리즘 버전입니다: {version}")
+    return algorithm
+
+
+def available_versions() -> List[str]:
+    """등록된 알고리즘 버전 리스트 (등록 순서)"""
+    return list(_algorithms)
+
+
+register_algorithm(SeededNormalAlgorithm())
+register_algorithm(HashKernelAlgorithm())
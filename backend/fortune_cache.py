@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+운세 메모이제이션 캐시
+항목 수와 바이트 수로 제한되는 스레드 안전 LRU 캐시 (세대 단위로 관리)
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from models import Fortune
+
+
+def estimate_fortune_size(fortune: Fortune) -> int:
+    """
+    Fortune 객체가 캐시에 추가로 차지하는 대략적인 메모리 크기(바이트) 추정
+
+    카테고리 운세는 CategoryFortunePool의 공유 인스턴스이므로 포함하지 않습니다.
+
+    Args:
+        fortune: 운세 객체
+
+    Returns:
+        int: 추정 바이트 수
+    """
+    size = sys.getsizeof(fortune) + sys.getsizeof(fortune.__dict__)
+    size += sys.getsizeof(fortune.categories)
+    size += sys.getsizeof(fortune.date) + sys.getsizeof(fortune.birth_date)
+    return size
+
+
+class FortuneCache:
+    """
+    날짜 세대별 LRU 캐시
+
+    모든 항목은 하나의 세대 키(운세 날짜)에 속합니다. 더 최신 세대 키로
+    저장이 들어오면 이전 세대 전체를 한 번에 비우고, 이전 세대 키의
+    조회/저장은 캐시를 건드리지 않고 미스로 처리합니다.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 32 * 1024 * 1024):
+        """
+        캐시 초기화
+
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 추정 바이트 수
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("캐시 크기는 1 이상이어야 합니다")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._generation: Optional[Hashable] = None
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.generation_drops = 0
+
+    def get(self, generation: Hashable, key: Hashable) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Args:
+            generation: 세대 키 (순서 비교가 가능해야 함)
+            key: 항목 키
+
+        Returns:
+            캐시된 값 또는 None
+        """
+        with self._lock:
+            if generation == self._generation:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def put(self, generation: Hashable, key: Hashable, value: Any, size: int) -> None:
+        """
+        캐시 저장
+
+        Args:
+            generation: 세대 키 (순서 비교가 가능해야 함)
+            key: 항목 키
+            value: 저장할 값
+            size: 값의 추정 바이트 수
+        """
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                if self._generation is not None and generation < self._generation:
+                    # 지난 세대의 값은 현재 세대를 밀어내지 않음
+                    return
+                if self._entries:
+                    self.generation_drops += 1
+                self._entries.clear()
+                self._sizes.clear()
+                self._bytes = 0
+                self._generation = generation
+
+            if key in self._entries:
+                self._bytes -= self._sizes[key]
+                self._entries.move_to_end(key)
+
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._bytes -= self._sizes.pop(evicted_key)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """모든 항목 삭제 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+            self._generation = None
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "generation": self._generation,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "generation_drops": self.generation_drops
+            }
@@ -4,28 +4,79 @@
 개인 및 그룹 운세 생성 알고리즘 구현
 """
 
-import hashlib
-import random
-import statistics
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
-from collections import defaultdict
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, List, Tuple, Optional
 
-from models import Fortune, CategoryFortune, GroupFortune
-from fortune_template_loader import FortuneTemplateLoader
+from models import Fortune, GroupFortune, LargeGroupFortune
+from fortune_template_loader import FortuneTemplateLoader, get_template_loader
+from fortune_table import DailyFortuneTable
+from fortune_cache import FortuneCache, estimate_fortune_size
+from fortune_flyweight import CategoryFortunePool
+from group_aggregate import GroupAggregate, LargeGroupSession
+from fortune_algorithms import (
+    ALGORITHM_V1, DEFAULT_ALGORITHM_VERSION,
+    FortuneAlgorithm, available_versions, get_algorithm
+)
+import fortune_kernel
+
+# 기본 등록된 점수 알고리즘 버전
+SUPPORTED_ALGORITHM_VERSIONS = available_versions()
+
+# 운세 예보 최대 일수
+FORECAST_MAX_DAYS = 365
 
 
 class FortuneEngine:
     """운세 생성 엔진 클래스"""
     
-    def __init__(self):
-        """초기화"""
-        self.template_loader = FortuneTemplateLoader()
+    def __init__(self, algorithm_version: str = DEFAULT_ALGORITHM_VERSION,
+                 cache_max_entries: int = 10000,
+                 cache_max_bytes: int = 32 * 1024 * 1024,
+                 template_loader: Optional[FortuneTemplateLoader] = None):
+        """
+        초기화
+        
+        Args:
+            algorithm_version: fortune_algorithms 레지스트리에 등록된 점수 알고리즘 버전
+            cache_max_entries: 개인 운세 캐시 최대 항목 수
+            cache_max_bytes: 개인 운세 캐시 최대 추정 바이트 수
+            template_loader: 사용할 템플릿 로더 (None이면 공유 템플릿 로더)
+        """
+        self.algorithm: FortuneAlgorithm = get_algorithm(algorithm_version)
+        self.algorithm_version = self.algorithm.version
+        
+        self.template_loader = template_loader or get_template_loader()
         self.categories = ["love", "health", "wealth", "career"]
+        
+        # (카테고리, 점수)별 공유 CategoryFortune 인스턴스 (템플릿 리로드 시 다시 생성)
+        self._category_pool = CategoryFortunePool(self.template_loader.snapshot, self.categories)
+        
+        # 해시 커널 알고리즘 전용 일일 점수 테이블 (날짜가 바뀌면 다시 생성)
+        self._daily_table: Optional[DailyFortuneTable] = None
+        self._daily_table_lock = threading.Lock()
+        
+        # 개인 운세 캐시 (개인/그룹 경로 공유, 날짜나 템플릿 버전이 바뀌면 전체 폐기)
+        self.fortune_cache = FortuneCache(cache_max_entries, cache_max_bytes)
+    
+    @property
+    def category_pool(self) -> CategoryFortunePool:
+        """
+        현재 템플릿 버전의 CategoryFortune 풀
+        
+        템플릿이 리로드되었으면 새 스냅샷으로 풀을 다시 만듭니다. 동시에 여러 스레드가
+        다시 만들어도 결과가 같으므로 잠금 없이 마지막 것을 사용합니다.
+        """
+        pool = self._category_pool
+        snapshot = self.template_loader.snapshot
+        if pool.template_version != snapshot.version:
+            pool = CategoryFortunePool(snapshot, self.categories)
+            self._category_pool = pool
+        return pool
     
     def generate_seed(self, birth_date: str, current_date: str) -> int:
         """
-        생년월일과 현재 날짜를 조합하여 일관된 시드 생성
+        생년월일과 현재 날짜를 조합하여 일관된 시드 생성 (v1 알고리즘)
         
         Args:
             birth_date: 생년월일 (YYYY-MM-DD)
@@ -34,16 +85,11 @@ class FortuneEngine:
         Returns:
             int: 생성된 시드값
         """
-        # 문자열을 조합하여 해시 생성
-        combined_string = f"{birth_date}_{current_date}"
-        hash_object = hashlib.md5(combined_string.encode())
-        # 해시를 정수로 변환 (32비트 범위 내)
-        seed = int(hash_object.hexdigest(), 16) % (2**31)
-        return seed
+        return get_algorithm(ALGORITHM_V1).generate_seed(birth_date, current_date)
     
     def generate_category_score(self, seed: int, category: str) -> int:
         """
-        카테고리별 운세 점수 생성 (정규분포 기반)
+        카테고리별 운세 점수 생성 (v1 알고리즘, 정규분포 기반)
         
         Args:
             seed: 기본 시드값
@@ -52,39 +98,116 @@ class FortuneEngine:
         Returns:
             int: 1-100 사이의 점수
         """
-        # 카테고리별로 다른 시드 생성
-        category_hash = hashlib.md5(category.encode()).hexdigest()
-        category_seed = seed + int(category_hash[:8], 16)
+        return get_algorithm(ALGORITHM_V1).generate_category_score(seed, category)
+    
+    def get_daily_table(self, current_date: str) -> Optional[DailyFortuneTable]:
+        """
+        현재 날짜의 일일 점수 테이블 반환 (필요 시 생성)
+        
+        테이블은 실제 오늘 날짜에 대해서만 만들며, 자정이 지나 오늘 날짜가
+        바뀌면 새로 생성합니다. 다른 날짜(과거/미래) 요청은 테이블을 교체하지
+        않고 None을 반환하므로 예보처럼 여러 날짜를 훑는 호출이 테이블을
+        반복해서 다시 만들지 않습니다.
+        
+        Args:
+            current_date: 현재 날짜 (YYYY-MM-DD)
+            
+        Returns:
+            Optional[DailyFortuneTable]: 해당 날짜의 테이블 (테이블을 지원하지 않는 알고리즘이면 None)
+        """
+        if not self.algorithm.supports_daily_table:
+            return None
         
-        # 시드 설정
-        random.seed(category_seed)
+        table = self._daily_table
+        if table is not None and table.date == current_date:
+            return table
         
-        # 정규분포를 따르는 점수 생성 (평균 60, 표준편차 20)
-        score = random.normalvariate(60, 20)
+        if current_date != datetime.now().strftime("%Y-%m-%d"):
+            return None
         
-        # 1-100 범위로 제한
-        score = max(1, min(100, int(round(score))))
+        with self._daily_table_lock:
+            table = self._daily_table
+            if table is None or table.date != current_date:
+                table = DailyFortuneTable(current_date, self.categories)
+                self._daily_table = table
         
-        return score
+        return table
+    
+    def _lookup_daily_scores(self, birth_date: str, current_date: str) -> Optional[List[int]]:
+        """일일 테이블에서 카테고리 순서의 점수 리스트 조회, 불가능하면 None"""
+        table = self.get_daily_table(current_date)
+        if table is None:
+            return None
+        return table.lookup(birth_date)
     
-    def get_fortune_message_and_keywords(self, category: str, score: int) -> Tuple[str, List[str]]:
+    def generate_category_scores(self, birth_date: str, current_date: str) -> Dict[str, int]:
+        """
+        설정된 알고리즘 버전으로 모든 카테고리 점수 생성
+        
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            current_date: 현재 날짜 (YYYY-MM-DD)
+            
+        Returns:
+            Dict[str, int]: 카테고리별 1-100 점수
+        """
+        cached = self._lookup_daily_scores(birth_date, current_date)
+        if cached is not None:
+            return dict(zip(self.categories, cached))
+        
+        return self.algorithm.category_scores(birth_date, current_date, self.categories)
+    
+    def generate_forecast(self, birth_date: str, start: str, days: int) -> List[Dict[str, Any]]:
+        """
+        여러 날짜의 운세 점수 예보를 한 번에 생성
+        
+        해시 커널 알고리즘(v2)은 날짜 축 전체를 하나의 배치로 계산합니다.
+        
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            start: 첫 날짜 (YYYY-MM-DD)
+            days: 날짜 수 (1-365)
+            
+        Returns:
+            List[Dict[str, Any]]: 날짜별 {"date", "categories", "total_score", "special_combination"} 리스트
+        """
+        if not 1 <= days <= FORECAST_MAX_DAYS:
+            raise ValueError(f"예보 기간은 1-{FORECAST_MAX_DAYS}일 사이여야 합니다")
+        
+        first_ordinal = fortune_kernel.date_ordinal(start)
+        dates = [date.fromordinal(first_ordinal + offset).isoformat() for offset in range(days)]
+        
+        daily_scores = self.algorithm.date_range_scores(birth_date, first_ordinal, days, self.categories)
+        
+        # 특별 조합은 날짜 축 전체를 한 번에 평가
+        specials = self.category_pool.special_table.match_rows(daily_scores)
+        
+        return [
+            {
+                "date": current_date,
+                "categories": category_scores,
+                "total_score": self.calculate_total_score(category_scores),
+                "special_combination": special.to_dict() if special is not None else None
+            }
+            for current_date, category_scores, special in zip(dates, daily_scores, specials)
+        ]
+    
+    def get_fortune_message_and_keywords(self, category: str, score: int,
+                                         range_name: Optional[str] = None) -> Tuple[str, Tuple[str, ...]]:
         """
         점수에 따른 운세 메시지와 키워드 가져오기
         
         Args:
             category: 카테고리 이름
             score: 운세 점수
+            range_name: 미리 계산된 점수 구간 이름 (선택사항)
             
         Returns:
-            Tuple[str, List[str]]: (메시지, 키워드 리스트)
+            Tuple[str, Tuple[str, ...]]: (메시지, 키워드 튜플)
         """
-        # 일관된 메시지 선택을 위해 시드 설정
-        message_seed = score + hash(category)
-        random.seed(message_seed)
-        
-        # FortuneTemplateLoader의 메서드 사용
-        message = self.template_loader.get_fortune_message(category, score)
-        keywords = self.template_loader.get_fortune_keywords(category, score)
+        # 워커/재시작과 무관한 안정적인 다이제스트로 메시지 선택
+        message = self.template_loader.select_fortune_message(category, score, range_name)
+        keywords = self.template_loader.get_fortune_keywords(category, score, range_name)
         
         return message, keywords
     
@@ -117,37 +240,42 @@ class FortuneEngine:
             name: 참석자 이름 (선택사항)
             
         Returns:
-            Fortune: 생성된 개인 운세
+            Fortune: 생성된 개인 운세 (캐시에서 공유되므로 수정하지 마세요)
         """
-        # 시드 생성
-        seed = self.generate_seed(birth_date, current_date)
+        # 템플릿 버전이 바뀌면 캐시 세대가 바뀌어 이전 메시지가 섞이지 않음
+        category_pool = self.category_pool
+        generation = (current_date, category_pool.template_version)
         
-        # 카테고리별 점수 및 운세 생성
-        categories = {}
-        category_scores = {}
+        # 캐시 키에 알고리즘 버전을 포함해 버전이 다른 결과가 섞이지 않도록 함
+        cache_key = (self.algorithm_version, birth_date)
+        cached_fortune = self.fortune_cache.get(generation, cache_key)
+        if cached_fortune is not None:
+            return cached_fortune
         
-        for category in self.categories:
-            score = self.generate_category_score(seed, category)
-            message, keywords = self.get_fortune_message_and_keywords(category, score)
-            
-            categories[category] = CategoryFortune(
-                score=score,
-                message=message,
-                keywords=keywords
-            )
-            category_scores[category] = score
+        # 카테고리별 점수 생성
+        category_scores = self.generate_category_scores(birth_date, current_date)
+        
+        # 카테고리별 운세 (미리 만들어 둔 공유 인스턴스 사용)
+        categories = {
+            category: category_pool.get(category, score)
+            for category, score in category_scores.items()
+        }
         
         # 전체 점수 계산
         total_score = self.calculate_total_score(category_scores)
         
-        # Fortune 객체 생성
+        # Fortune 객체 생성 (특별 조합은 컴파일된 결정 테이블에서 조회)
         fortune = Fortune(
             date=current_date,
             birth_date=birth_date,
             categories=categories,
-            total_score=total_score
+            total_score=total_score,
+            algorithm_version=self.algorithm_version,
+            special_combination=category_pool.special_table.match(category_scores)
         )
         
+        self.fortune_cache.put(generation, cache_key, fortune, estimate_fortune_size(fortune))
+        
         return fortune
     
     def calculate_group_harmony_score(self, individual_fortunes: List[Fortune]) -> float:
@@ -160,20 +288,8 @@ class FortuneEngine:
         Returns:
             float: 화합 점수 (0-100)
         """
-        if len(individual_fortunes) < 2:
-            return 100.0
-        
-        # 전체 점수들 수집
-        total_scores = [fortune.total_score for fortune in individual_fortunes]
-        
-        # 분산 계산
-        variance = statistics.variance(total_scores)
-        
-        # 화합 점수 계산 (분산이 작을수록 높은 점수)
-        # 최대 분산을 1000으로 가정하고 역비례 관계로 계산
-        harmony_score = max(0, 100 - (variance / 10))
-        
-        return min(100, harmony_score)
+        # 분산이 작을수록 높은 점수 (최대 분산을 1000으로 가정한 역비례 관계)
+        return self._aggregate(individual_fortunes).harmony_score()
     
     def find_dominant_categories(self, individual_fortunes: List[Fortune]) -> List[str]:
         """
@@ -185,31 +301,15 @@ class FortuneEngine:
         Returns:
             List[str]: 주요 카테고리 리스트
         """
-        # 카테고리별 점수 수집
-        category_scores = defaultdict(list)
-        
+        # 평균 75점 이상인 카테고리를 점수 순으로 선정
+        return self._aggregate(individual_fortunes).dominant_categories()
+    
+    def _aggregate(self, individual_fortunes: List[Fortune]) -> GroupAggregate:
+        """개별 운세 리스트를 한 번의 순회로 집계"""
+        aggregate = GroupAggregate(self.categories)
         for fortune in individual_fortunes:
-            for category, category_fortune in fortune.categories.items():
-                category_scores[category].append(category_fortune.score)
-        
-        # 카테고리별 평균 점수 계산
-        category_averages = {}
-        for category, scores in category_scores.items():
-            category_averages[category] = sum(scores) / len(scores)
-        
-        # 평균 75점 이상인 카테고리를 주요 카테고리로 선정
-        dominant_categories = []
-        for category, avg_score in category_averages.items():
-            if avg_score >= 75:
-                dominant_categories.append(category)
-        
-        # 점수 순으로 정렬
-        dominant_categories.sort(
-            key=lambda cat: category_averages[cat], 
-            reverse=True
-        )
-        
-        return dominant_categories
+            aggregate.add_fortune(fortune)
+        return aggregate
     
     def generate_group_message(self, harmony_score: float) -> str:
         """
@@ -221,12 +321,9 @@ class FortuneEngine:
         Returns:
             str: 그룹 메시지
         """
-        # 일관된 메시지 선택을 위해 시드 설정
-        message_seed = int(harmony_score * 100)
-        random.seed(message_seed)
-        
-        # FortuneTemplateLoader의 메서드 사용
-        return self.template_loader.get_group_harmony_message(int(harmony_score))
+        # 워커/재시작과 무관한 안정적인 다이제스트로 메시지 선택
+        # (화합 점수가 1 미만이면 가장 낮은 구간 메시지 사용)
+        return self.template_loader.select_group_harmony_message(max(1.0, harmony_score))
     
     def generate_group_fortune(self, birth_dates: List[str], current_date: str, names: List[str] = None) -> GroupFortune:
         """
@@ -257,15 +354,11 @@ class FortuneEngine:
             fortune = self.generate_individual_fortune(birth_date, current_date, name)
             individual_fortunes.append(fortune)
         
-        # 그룹 평균 점수 계산
-        total_scores = [fortune.total_score for fortune in individual_fortunes]
-        average_score = sum(total_scores) / len(total_scores)
-        
-        # 화합 점수 계산
-        harmony_score = self.calculate_group_harmony_score(individual_fortunes)
-        
-        # 주요 카테고리 분석
-        dominant_categories = self.find_dominant_categories(individual_fortunes)
+        # 평균, 화합 점수, 주요 카테고리를 한 번의 집계로 계산
+        aggregate = self._aggregate(individual_fortunes)
+        average_score = aggregate.average_score()
+        harmony_score = aggregate.harmony_score()
+        dominant_categories = aggregate.dominant_categories()
         
         # 그룹 메시지 생성
         group_message = self.generate_group_message(harmony_score)
@@ -277,7 +370,50 @@ class FortuneEngine:
             dominant_categories=dominant_categories,
             group_message=group_message,
             participant_count=len(birth_dates),
-            individual_fortunes=individual_fortunes
+            individual_fortunes=individual_fortunes,
+            algorithm_version=self.algorithm_version
         )
         
-        return group_fortune
\ No newline at end of file
+        return group_fortune
+    
+    def create_large_group_session(self, current_date: str) -> LargeGroupSession:
+        """
+        대규모 그룹 세션 생성 (참석자 수 제한 없음, 추가/삭제 O(1))
+        
+        Args:
+            current_date: 현재 날짜 (YYYY-MM-DD)
+            
+        Returns:
+            LargeGroupSession: 빈 그룹 세션
+        """
+        return LargeGroupSession(self, current_date)
+    
+    def generate_large_group_fortune(self, birth_dates: List[str], current_date: str,
+                                     names: List[str] = None) -> Tuple[LargeGroupFortune, LargeGroupSession]:
+        """
+        대규모 그룹 운세 생성 (스트리밍 집계, O(n))
+        
+        Args:
+            birth_dates: 참석자들의 생년월일 리스트
+            current_date: 현재 날짜 (YYYY-MM-DD)
+            names: 참석자 이름 리스트 (선택사항)
+            
+        Returns:
+            Tuple[LargeGroupFortune, LargeGroupSession]: (그룹 운세 요약, 이후 추가/삭제용 세션)
+        """
+        if len(birth_dates) < 2:
+            raise ValueError("그룹은 최소 2명 이상이어야 합니다")
+        
+        session = self.create_large_group_session(current_date)
+        for i, birth_date in enumerate(birth_dates):
+            name = names[i] if names is not None and i < len(names) else None
+            session.add_participant(birth_date, name)
+        
+        return session.summary(), session
+
+
+if __name__ == "__main__":
+    # 명령행 도구 (예: python -m fortune_engine batch --input rows.csv --output out.jsonl)
+    import sys
+    from batch_runner import main
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+카테고리 운세 플라이웨이트 풀
+(카테고리, 점수)마다 하나뿐인 불변 CategoryFortune 인스턴스를 미리 만들어 공유
+"""
+
+from typing import Dict, List, Tuple
+
+from models import CategoryFortune
+from fortune_template_loader import TemplateSnapshot, score_range_name
+
+
+class CategoryFortunePool:
+    """
+    불변 CategoryFortune 인스턴스 풀
+    
+    메시지는 (카테고리, 점수)로 결정적으로 선택되고 키워드는 (카테고리, 점수 구간)에만
+    의존하므로, 카테고리당 100개의 인스턴스로 모든 운세를 표현할 수 있습니다.
+    키워드는 구간별로 하나의 튜플을 공유합니다.
+    
+    풀은 하나의 템플릿 스냅샷으로 만들어지며, 템플릿이 리로드되면 새 풀을 만듭니다.
+    """
+    
+    def __init__(self, template_snapshot: TemplateSnapshot, categories: List[str]):
+        """
+        풀 생성 (카테고리 x 100점 전체를 미리 생성)
+        
+        Args:
+            template_snapshot: 메시지/키워드를 제공하는 템플릿 스냅샷
+            categories: 카테고리 이름 리스트
+        """
+        self.template_version = template_snapshot.version
+        # 같은 스냅샷의 특별 조합 테이블 (카테고리 운세와 항상 같은 버전을 사용)
+        self.special_table = template_snapshot.special_table
+        self.keyword_sets: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._fortunes: Dict[str, Tuple[CategoryFortune, ...]] = {}
+        
+        for category in categories:
+            fortunes = [None]  # 인덱스 0은 사용하지 않음 (점수는 1-100)
+            for score in range(1, 101):
+                # 컴파일된 템플릿의 키워드 튜플은 같은 점수 구간에서 이미 공유됨
+                template = template_snapshot.score_table[category][score]
+                self.keyword_sets.setdefault((category, score_range_name(score)), template.keywords)
+                fortunes.append(CategoryFortune(
+                    score=score,
+                    message=template.message,
+                    keywords=template.keywords
+                ))
+            self._fortunes[category] = tuple(fortunes)
+    
+    def get(self, category: str, score: int) -> CategoryFortune:
+        """
+        공유 CategoryFortune 인스턴스 반환
+        
+        Args:
+            category: 카테고리 이름
+            score: 운세 점수 (1-100)
+            
+        Returns:
+            CategoryFortune: 공유 불변 인스턴스
+        """
+        if not 1 <= score <= 100:
+            raise ValueError(f"점수는 1-100 사이여야 합니다: {score}")
+        return self._fortunes[category][score]
+    
+    def __len__(self) -> int:
+        return sum(len(fortunes) - 1 for fortunes in self._fortunes.values())
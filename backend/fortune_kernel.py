@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+상태 없는(stateless) 운세 점수 커널
+(생년월일, 날짜, 카테고리)를 전역 난수 상태 없이 1-100 점수로 직접 변환
+"""
+
+import hashlib
+import math
+from datetime import date
+from statistics import NormalDist
+from typing import Dict, Iterable, List
+
+# 점수 분포 (기존 정규분포 알고리즘과 동일: 평균 60, 표준편차 20)
+SCORE_MEAN = 60
+SCORE_STDDEV = 20
+
+# 분위수 테이블 크기 (2^16 구간)
+QUANTILE_BITS = 16
+
+# 카운터 = 생년월일 서수 << DATE_ORDINAL_BITS | 날짜 서수
+# 날짜 서수가 2^20 미만이어야 두 필드가 겹치지 않으므로 그 이후 날짜는 거부
+DATE_ORDINAL_BITS = 20
+MAX_DATE_ORDINAL = (1 << DATE_ORDINAL_BITS) - 1
+MAX_FORTUNE_DATE = date.fromordinal(MAX_DATE_ORDINAL).isoformat()
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _build_quantile_table() -> bytes:
+    """
+    균등 분포 인덱스를 정규분포 점수로 변환하는 분위수 테이블 생성
+
+    인덱스 i는 구간 중앙값 (i + 0.5) / 2^16 의 정규분포 분위수를
+    반올림하고 1-100으로 제한한 점수에 대응합니다.
+
+    Returns:
+        bytes: 길이 2^16의 점수 테이블
+    """
+    size = 1 << QUANTILE_BITS
+    dist = NormalDist(SCORE_MEAN, SCORE_STDDEV)
+    table = bytearray(size)
+
+    start = 0
+    for score in range(1, 101):
+        if score == 100:
+            end = size
+        else:
+            # (i + 0.5) / size < cdf(score + 0.5) 를 만족하는 마지막 인덱스 다음 위치
+            end = math.ceil(dist.cdf(score + 0.5) * size - 0.5)
+            end = max(start, min(size, end))
+        table[start:end] = bytes([score]) * (end - start)
+        start = end
+
+    return bytes(table)
+
+
+SCORE_QUANTILE_TABLE = _build_quantile_table()
+
+# 카테고리 이름별 64비트 키 캐시
+_category_keys: Dict[str, int] = {}
+
+
+def category_key(category: str) -> int:
+    """
+    카테고리 이름에 대한 안정적인 64비트 키 반환
+
+    Args:
+        category: 카테고리 이름
+
+    Returns:
+        int: 프로세스와 무관하게 동일한 64비트 정수
+    """
+    key = _category_keys.get(category)
+    if key is None:
+        digest = hashlib.md5(category.encode()).digest()
+        key = int.from_bytes(digest[:8], "big")
+        _category_keys[category] = key
+    return key
+
+
+def date_ordinal(date_string: str) -> int:
+    """YYYY-MM-DD 문자열을 날짜 서수(ordinal)로 변환"""
+    return date.fromisoformat(date_string).toordinal()
+
+
+def check_date_ordinals(first_date_ordinal: int, count: int = 1) -> None:
+    """
+    운세 날짜 서수가 카운터의 날짜 필드에 들어가는지 확인
+
+    Args:
+        first_date_ordinal: 첫 운세 날짜 서수
+        count: 연속된 날짜 수
+
+    Raises:
+        ValueError: 마지막 날짜가 MAX_FORTUNE_DATE 이후인 경우 (생년월일 필드와 겹침)
+    """
+    if first_date_ordinal < 1 or first_date_ordinal + count - 1 > MAX_DATE_ORDINAL:
+        raise ValueError(f"운세 날짜는 {MAX_FORTUNE_DATE} 이전이어야 합니다")
+
+
+def mix64(value: int) -> int:
+    """
+    SplitMix64 종결 함수로 64비트 정수를 섞습니다.
+
+    Args:
+        value: 입력 정수 (64비트로 잘림)
+
+    Returns:
+        int: 섞인 64비트 정수
+    """
+    value &= _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def score_from_ordinals(birth_ordinal: int, date_ordinal_value: int, cat_key: int) -> int:
+    """
+    날짜 서수와 카테고리 키로 점수 계산 (커널 본체)
+
+    Args:
+        birth_ordinal: 생년월일 서수
+        date_ordinal_value: 운세 날짜 서수
+        cat_key: category_key()로 얻은 카테고리 키
+
+    Returns:
+        int: 1-100 사이의 점수
+
+    Raises:
+        ValueError: 운세 날짜가 MAX_FORTUNE_DATE 이후인 경우
+    """
+    if not 0 < date_ordinal_value <= MAX_DATE_ORDINAL:
+        check_date_ordinals(date_ordinal_value)
+    counter = (birth_ordinal << DATE_ORDINAL_BITS) | date_ordinal_value
+    hashed = mix64(counter * _GOLDEN_GAMMA + cat_key)
+    return SCORE_QUANTILE_TABLE[hashed >> (64 - QUANTILE_BITS)]
+
+
+def category_score(birth_date: str, current_date: str, category: str) -> int:
+    """
+    (생년월일, 날짜, 카테고리)에 대한 운세 점수 계산
+
+    Args:
+        birth_date: 생년월일 (YYYY-MM-DD)
+        current_date: 운세 날짜 (YYYY-MM-DD)
+        category: 카테고리 이름
+
+    Returns:
+        int: 1-100 사이의 점수
+    """
+    return score_from_ordinals(
+        date_ordinal(birth_date),
+        date_ordinal(current_date),
+        category_key(category)
+    )
+
+
+def _scores_for_counters(counters: Iterable[int], count: int, cat_keys: List[int]) -> bytearray:
+    """
+    카운터(생년월일 서수 << DATE_ORDINAL_BITS | 날짜 서수) 목록 전체의 점수를 한 번에 계산
+
+    score_from_ordinals()와 동일한 결과를 내며, 함수 호출 비용을 줄이기 위해
+    해시 계산을 루프 안에 풀어 썼습니다. 날짜 서수는 호출하는 쪽에서
+    check_date_ordinals()로 확인해야 합니다 (넘치면 다른 생년월일의 카운터와 겹침).
+    """
+    scores = bytearray(count * len(cat_keys))
+    table = SCORE_QUANTILE_TABLE
+    shift = 64 - QUANTILE_BITS
+    mask = _MASK64
+
+    position = 0
+    for counter in counters:
+        base = counter * _GOLDEN_GAMMA
+        for key in cat_keys:
+            value = (base + key) & mask
+            value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & mask
+            value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & mask
+            scores[position] = table[(value ^ (value >> 31)) >> shift]
+            position += 1
+
+    return scores
+
+
+def scores_for_birth_range(first_birth_ordinal: int, count: int,
+                           date_ordinal_value: int, cat_keys: List[int]) -> bytearray:
+    """
+    연속된 생년월일 구간 전체의 점수를 한 번에 계산 (날짜 고정)
+
+    Args:
+        first_birth_ordinal: 첫 생년월일 서수
+        count: 생년월일 개수
+        date_ordinal_value: 운세 날짜 서수
+        cat_keys: 카테고리 키 리스트
+
+    Returns:
+        bytearray: [생년월일][카테고리] 순서의 점수 배열 (길이 count * len(cat_keys))
+
+    Raises:
+        ValueError: 운세 날짜가 MAX_FORTUNE_DATE 이후인 경우
+    """
+    check_date_ordinals(date_ordinal_value)
+    counters = (
+        (birth_ordinal << DATE_ORDINAL_BITS) | date_ordinal_value
+        for birth_ordinal in range(first_birth_ordinal, first_birth_ordinal + count)
+    )
+    return _scores_for_counters(counters, count, cat_keys)
+
+
+def scores_for_date_range(birth_ordinal: int, first_date_ordinal: int,
+                          days: int, cat_keys: List[int]) -> bytearray:
+    """
+    한 생년월일의 연속된 날짜 구간 전체의 점수를 한 번에 계산 (생년월일 고정)
+
+    Args:
+        birth_ordinal: 생년월일 서수
+        first_date_ordinal: 첫 운세 날짜 서수
+        days: 날짜 개수
+        cat_keys: 카테고리 키 리스트
+
+    Returns:
+        bytearray: [날짜][카테고리] 순서의 점수 배열 (길이 days * len(cat_keys))
+
+    Raises:
+        ValueError: 마지막 날짜가 MAX_FORTUNE_DATE 이후인 경우
+    """
+    check_date_ordinals(first_date_ordinal, days)
+    prefix = birth_ordinal << DATE_ORDINAL_BITS
+    counters = (
+        prefix | date_ordinal_value
+        for date_ordinal_value in range(first_date_ordinal, first_date_ordinal + days)
+    )
+    return _scores_for_counters(counters, days, cat_keys)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+일일 운세 점수 테이블
+하루 동안 유효한 모든 생년월일(1900-01-01 ~ 당일)의 카테고리 점수를 미리 계산
+"""
+
+from typing import List, Optional
+
+import fortune_kernel
+
+# 검증 로직(validate_fortune_request)이 허용하는 가장 이른 생년월일
+MIN_BIRTH_DATE = "1900-01-01"
+
+
+class DailyFortuneTable:
+    """
+    특정 날짜의 생년월일별 운세 점수 테이블
+    
+    점수는 [생년월일][카테고리] 순서의 uint8 배열에 저장되어 조회가 O(1) 인덱싱으로 끝납니다.
+    점수 구간(키워드)은 카테고리 운세 풀이 점수로 바로 찾으므로 따로 저장하지 않습니다.
+    상태 없는 점수 커널(알고리즘 v2)의 결과와 동일합니다.
+    """
+    
+    def __init__(self, current_date: str, categories: List[str],
+                 min_birth_date: str = MIN_BIRTH_DATE):
+        """
+        테이블 생성
+        
+        Args:
+            current_date: 운세 날짜 (YYYY-MM-DD), 생년월일 상한이기도 함
+            categories: 카테고리 이름 리스트 (점수 배열의 열 순서)
+            min_birth_date: 테이블에 포함할 가장 이른 생년월일
+        """
+        self.date = current_date
+        self.categories = list(categories)
+        self.first_birth_ordinal = fortune_kernel.date_ordinal(min_birth_date)
+        
+        date_ordinal = fortune_kernel.date_ordinal(current_date)
+        self.birth_date_count = max(0, date_ordinal - self.first_birth_ordinal + 1)
+        
+        cat_keys = [fortune_kernel.category_key(category) for category in self.categories]
+        self.scores = fortune_kernel.scores_for_birth_range(
+            self.first_birth_ordinal, self.birth_date_count, date_ordinal, cat_keys
+        )
+    
+    def lookup(self, birth_date: str) -> Optional[List[int]]:
+        """
+        생년월일의 카테고리별 점수 조회
+        
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            
+        Returns:
+            카테고리 순서의 점수 리스트, 테이블 범위 밖이면 None
+        """
+        row = fortune_kernel.date_ordinal(birth_date) - self.first_birth_ordinal
+        if not 0 <= row < self.birth_date_count:
+            return None
+        
+        width = len(self.categories)
+        start = row * width
+        return list(self.scores[start:start + width])
+    
+    def size_in_bytes(self) -> int:
+        """점수 배열이 차지하는 바이트 수"""
+        return len(self.scores)
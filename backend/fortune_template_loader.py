@@ -4,21 +4,383 @@
 운세 템플릿 로더 유틸리티
 """
 
+import hashlib
 import json
 import os
 import random
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import data_bundle
+from models import SpecialCombination
+
+# 점수 구간 이름 (높은 점수 순)
+SCORE_RANGE_NAMES = ("excellent", "good", "average", "poor", "bad")
+
+# 특별 조합 조건에서 모든 카테고리를 뜻하는 키
+ALL_CATEGORIES_KEY = "*"
+
+# conditions 항목이 없는 기존 특별 조합의 조건 (이전 하드코딩 규칙과 동일)
+DEFAULT_SPECIAL_CONDITIONS = {
+    "all_excellent": {ALL_CATEGORIES_KEY: {"min": 90}},
+    "love_wealth_high": {"love": {"min": 80}, "wealth": {"min": 80}},
+    "health_career_high": {"health": {"min": 80}, "career": {"min": 80}},
+    "all_low": {ALL_CATEGORIES_KEY: {"max": 30}},
+}
+
+
+def score_range_name(score: int) -> str:
+    """
+    점수에 해당하는 구간 이름을 반환합니다.
+    
+    Args:
+        score: 운세 점수 (1-100)
+        
+    Returns:
+        구간 이름 (excellent, good, average, poor, bad)
+    """
+    if not 1 <= score <= 100:
+        raise ValueError(f"점수는 1-100 사이여야 합니다: {score}")
+    
+    if score >= 90:
+        return "excellent"
+    elif score >= 70:
+        return "good"
+    elif score >= 50:
+        return "average"
+    elif score >= 30:
+        return "poor"
+    else:
+        return "bad"
+
+
+def stable_index(key: str, size: int) -> int:
+    """
+    문자열 키로부터 프로세스와 무관하게 항상 같은 인덱스를 계산합니다.
+    
+    내장 hash()는 PYTHONHASHSEED에 따라 워커마다 값이 달라지므로
+    메시지 선택에는 이 함수를 사용합니다.
+    
+    Args:
+        key: 선택 키
+        size: 후보 개수
+        
+    Returns:
+        0 이상 size 미만의 인덱스
+    """
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % size
+
+
+class ScoreTemplate(NamedTuple):
+    """(카테고리, 점수) 하나에 대한 컴파일된 템플릿"""
+    messages: Tuple[str, ...]  # 점수 구간의 메시지 후보
+    keywords: Tuple[str, ...]  # 점수 구간의 키워드
+    message: str  # select_fortune_message가 결정적으로 고르는 메시지
+
+
+def _is_string_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def validate_template_structure(templates: Any) -> None:
+    """
+    템플릿 JSON의 객체/배열 구조 검증 (컴파일 함수가 인덱싱하기 전에 호출)
+
+    필수 항목이 빠진 경우는 컴파일 함수가 항목 이름과 함께 알려주므로, 여기서는
+    있는 항목의 타입만 확인합니다.
+
+    Args:
+        templates: fortune_templates.json 내용
+
+    Raises:
+        ValueError: 객체여야 할 항목이 객체가 아니거나 메시지/키워드가 문자열 배열이 아닌 경우
+    """
+    if not isinstance(templates, dict):
+        raise ValueError("운세 템플릿 파일의 최상위는 객체여야 합니다")
+    for section in ('categories', 'group_messages', 'special_combinations'):
+        if not isinstance(templates.get(section, {}), dict):
+            raise ValueError(f"운세 템플릿의 '{section}' 항목은 객체여야 합니다")
+
+    for category, category_data in templates.get('categories', {}).items():
+        if not isinstance(category_data, dict):
+            raise ValueError(f"'{category}' 카테고리는 객체여야 합니다")
+        score_ranges = category_data.get('score_ranges', {})
+        if not isinstance(score_ranges, dict):
+            raise ValueError(f"'{category}' 카테고리의 score_ranges는 객체여야 합니다")
+        for range_name, range_data in score_ranges.items():
+            if not isinstance(range_data, dict):
+                raise ValueError(f"'{category}' 카테고리의 '{range_name}' 구간은 객체여야 합니다")
+            for field in ('messages', 'keywords'):
+                if field in range_data and not _is_string_list(range_data[field]):
+                    raise ValueError(
+                        f"'{category}' 카테고리의 '{range_name}' 구간 {field}는 문자열 배열이어야 합니다"
+                    )
+
+    for range_name, range_data in templates.get('group_messages', {}).items():
+        if not isinstance(range_data, dict):
+            raise ValueError(f"'{range_name}' 그룹 메시지 구간은 객체여야 합니다")
+        if 'messages' in range_data and not _is_string_list(range_data['messages']):
+            raise ValueError(f"'{range_name}' 그룹 메시지 구간 messages는 문자열 배열이어야 합니다")
+
+    for name, combo in templates.get('special_combinations', {}).items():
+        if not isinstance(combo, dict):
+            raise ValueError(f"'{name}' 특별 조합은 객체여야 합니다")
+        if 'keywords' in combo and not _is_string_list(combo['keywords']):
+            raise ValueError(f"'{name}' 특별 조합의 keywords는 문자열 배열이어야 합니다")
+
+
+def compile_score_table(templates: Dict) -> Dict[str, Tuple[Optional[ScoreTemplate], ...]]:
+    """
+    카테고리별 점수 템플릿 테이블 생성
+
+    각 카테고리는 길이 101의 튜플(인덱스 0은 None, 1-100은 점수)이며, 같은 점수
+    구간의 항목은 메시지/키워드 튜플을 공유합니다.
+
+    Args:
+        templates: fortune_templates.json 내용
+
+    Returns:
+        Dict[str, Tuple[Optional[ScoreTemplate], ...]]: {카테고리: 점수별 템플릿}
+    """
+    score_table = {}
+    for category, category_data in templates['categories'].items():
+        ranges = {}
+        for range_name in SCORE_RANGE_NAMES:
+            try:
+                range_data = category_data['score_ranges'][range_name]
+                ranges[range_name] = (tuple(range_data['messages']), tuple(range_data['keywords']))
+            except KeyError as e:
+                raise ValueError(f"'{category}' 카테고리의 '{range_name}' 구간 템플릿에 {e} 항목이 없습니다")
+            if not ranges[range_name][0]:
+                raise ValueError(f"'{category}' 카테고리의 '{range_name}' 구간에 메시지가 없습니다")
+
+        entries: List[Optional[ScoreTemplate]] = [None]
+        for score in range(1, 101):
+            messages, keywords = ranges[score_range_name(score)]
+            entries.append(ScoreTemplate(
+                messages=messages,
+                keywords=keywords,
+                message=messages[stable_index(f"{category}:{score}", len(messages))]
+            ))
+        score_table[category] = tuple(entries)
+    return score_table
+
+
+def compile_harmony_table(templates: Dict) -> Tuple[Optional[Tuple[str, ...]], ...]:
+    """
+    화합 점수별 그룹 메시지 후보 테이블 생성
+
+    Args:
+        templates: fortune_templates.json 내용
+
+    Returns:
+        Tuple[Optional[Tuple[str, ...]], ...]: 길이 101 (인덱스 0은 None, 1-100은 점수)
+    """
+    ranges = {}
+    for range_name in SCORE_RANGE_NAMES:
+        harmony_range = f"harmony_{range_name}"
+        if harmony_range not in templates['group_messages']:
+            raise ValueError(f"존재하지 않는 그룹 메시지 구간입니다: {harmony_range}")
+        messages = tuple(templates['group_messages'][harmony_range]['messages'])
+        if not messages:
+            raise ValueError(f"'{harmony_range}' 구간에 메시지가 없습니다")
+        ranges[range_name] = messages
+
+    return (None,) + tuple(ranges[score_range_name(score)] for score in range(1, 101))
+
+
+class SpecialCombinationTable:
+    """
+    특별 조합 규칙을 컴파일한 결정 테이블
+
+    카테고리마다 길이 101의 비트마스크 튜플을 두고, 점수 s의 마스크에는 그 카테고리
+    조건을 s가 만족하는 규칙의 비트가 켜져 있습니다 (비트 번호 = 우선순위).
+    점수 벡터 하나의 평가는 카테고리 수만큼의 조회와 AND로 끝나며, 가장 낮은
+    켜진 비트가 일치한 규칙입니다. 따라서 규칙이 늘어나도 요청당 연산 수는
+    그대로입니다. 점수가 없는 카테고리는 인덱스 0(그 카테고리 조건이 없는 규칙)으로
+    평가합니다.
+    """
+
+    def __init__(self, rules: Tuple[SpecialCombination, ...], masks: Dict[str, Tuple[int, ...]]):
+        """
+        Args:
+            rules: 우선순위 순 특별 조합 (인덱스가 비트 번호)
+            masks: {카테고리: 점수별 규칙 비트마스크 (길이 101)}
+        """
+        self.rules = rules
+        self.masks = masks
+        self._all_rules_mask = (1 << len(rules)) - 1
+
+    def match(self, scores: Dict[str, int]) -> Optional[SpecialCombination]:
+        """
+        점수 벡터 하나에 일치하는 가장 우선순위가 높은 특별 조합
+
+        Args:
+            scores: 카테고리별 점수 딕셔너리
+
+        Returns:
+            Optional[SpecialCombination]: 일치한 조합 (공유 인스턴스) 또는 None
+        """
+        matched = self._all_rules_mask
+        for category, masks in self.masks.items():
+            matched &= masks[scores.get(category, 0)]
+            if not matched:
+                return None
+        return self.rules[(matched & -matched).bit_length() - 1]
+
+    def match_rows(self, rows: Iterable[Dict[str, int]]) -> List[Optional[SpecialCombination]]:
+        """
+        여러 점수 벡터를 한 번에 평가 (예보, 배치용)
+
+        테이블과 규칙을 지역 변수로 묶어 행마다 메서드 호출 없이 평가합니다.
+
+        Args:
+            rows: 카테고리별 점수 딕셔너리들
+
+        Returns:
+            List[Optional[SpecialCombination]]: 행별 일치한 조합 또는 None
+        """
+        mask_items = tuple(self.masks.items())
+        rules = self.rules
+        all_rules_mask = self._all_rules_mask
+
+        results: List[Optional[SpecialCombination]] = []
+        append = results.append
+        for scores in rows:
+            matched = all_rules_mask
+            for category, masks in mask_items:
+                matched &= masks[scores.get(category, 0)]
+                if not matched:
+                    break
+            append(rules[(matched & -matched).bit_length() - 1] if matched else None)
+        return results
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+
+def _special_ranges(name: str, conditions: Dict, categories: Tuple[str, ...]) -> Dict[str, Tuple[int, int]]:
+    """특별 조합 조건을 {카테고리: (최소, 최대)} 점수 범위로 변환"""
+    if not isinstance(conditions, dict) or not conditions:
+        raise ValueError(f"'{name}' 특별 조합의 conditions는 비어있지 않은 객체여야 합니다")
+
+    ranges: Dict[str, Tuple[int, int]] = {}
+    for key, bound in conditions.items():
+        if key == ALL_CATEGORIES_KEY:
+            targets = categories
+        elif key in categories:
+            targets = (key,)
+        else:
+            raise ValueError(f"'{name}' 특별 조합에 존재하지 않는 카테고리 조건이 있습니다: {key}")
+
+        if not isinstance(bound, dict) or not set(bound) <= {"min", "max"}:
+            raise ValueError(f"'{name}' 특별 조합의 '{key}' 조건은 min/max 항목만 가질 수 있습니다")
+        low, high = bound.get("min", 1), bound.get("max", 100)
+        if not (isinstance(low, int) and isinstance(high, int) and 1 <= low <= high <= 100):
+            raise ValueError(f"'{name}' 특별 조합의 '{key}' 조건 범위가 올바르지 않습니다: {bound}")
+
+        for category in targets:
+            current_low, current_high = ranges.get(category, (1, 100))
+            ranges[category] = (max(current_low, low), min(current_high, high))
+            if ranges[category][0] > ranges[category][1]:
+                raise ValueError(f"'{name}' 특별 조합의 '{category}' 조건을 만족하는 점수가 없습니다")
+    return ranges
+
+
+def compile_special_table(templates: Dict) -> SpecialCombinationTable:
+    """
+    특별 조합 규칙을 결정 테이블로 컴파일
+
+    special_combinations의 각 항목은 message, keywords와 선택적인 conditions를 가집니다.
+    conditions는 {카테고리 또는 "*": {"min": 점수, "max": 점수}} 형식이며 모든 조건을
+    만족해야 일치합니다. 파일에 적힌 순서가 우선순위입니다. conditions가 없는 기존
+    조합(all_excellent 등)은 DEFAULT_SPECIAL_CONDITIONS를 사용합니다.
+
+    Args:
+        templates: fortune_templates.json 내용
+
+    Returns:
+        SpecialCombinationTable: 컴파일된 결정 테이블
+    """
+    categories = tuple(templates['categories'])
+    rules: List[SpecialCombination] = []
+    rule_ranges: List[Dict[str, Tuple[int, int]]] = []
+
+    for name, combo in templates['special_combinations'].items():
+        conditions = combo.get('conditions', DEFAULT_SPECIAL_CONDITIONS.get(name))
+        if conditions is None:
+            raise ValueError(f"'{name}' 특별 조합에 conditions 항목이 없습니다")
+        message = combo.get('message', '')
+        if not isinstance(message, str) or not message.strip():
+            raise ValueError(f"'{name}' 특별 조합에 메시지가 없습니다")
+
+        rule_ranges.append(_special_ranges(name, conditions, categories))
+        rules.append(SpecialCombination(
+            name=name,
+            message=message,
+            keywords=tuple(combo.get('keywords', ()))
+        ))
+
+    masks = {}
+    for category in categories:
+        category_masks = [0] * 101
+        for bit, ranges in enumerate(rule_ranges):
+            low, high = ranges.get(category, (0, 100))
+            for score in range(low, high + 1):
+                category_masks[score] |= 1 << bit
+        masks[category] = tuple(category_masks)
+
+    return SpecialCombinationTable(tuple(rules), masks)
+
+
+class TemplateSnapshot(NamedTuple):
+    """
+    한 시점의 템플릿 파일을 컴파일한 불변 스냅샷
+
+    핫 리로드는 새 스냅샷을 만들어 참조 하나를 교체하므로, 스냅샷을 한 번 읽은
+    요청은 리로드와 관계없이 끝까지 같은 버전의 템플릿을 봅니다.
+    templates(원본 JSON)는 공유되므로 수정하지 마세요.
+    """
+    version: int  # 리로드 버전 (최초 로드 1, 리로드마다 1씩 증가)
+    file_stamp: Tuple[int, int]  # 로드한 파일의 (mtime_ns, 크기)
+    templates: Dict  # 원본 템플릿 데이터
+    score_table: Dict[str, Tuple[Optional[ScoreTemplate], ...]]
+    harmony_table: Tuple[Optional[Tuple[str, ...]], ...]
+    special_table: SpecialCombinationTable
+
+
+def _file_stamp(path: str) -> Tuple[int, int]:
+    """파일 변경 감지용 (mtime_ns, 크기)"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
 
 class FortuneTemplateLoader:
-    """운세 템플릿 데이터를 로드하고 관리하는 클래스"""
+    """
+    운세 템플릿 데이터를 로드하고 관리하는 클래스
+
+    조회 메서드는 현재 스냅샷 참조를 한 번 읽어 사용하므로 잠금이 없습니다.
+    reload()나 start_watcher()로 파일 변경을 반영하며, 새 파일은 요청 경로 밖에서
+    파싱/검증/컴파일한 뒤 스냅샷 참조만 원자적으로 교체합니다.
+    """
     
-    def __init__(self, template_path: Optional[str] = None):
+    def __init__(self, template_path: Optional[str] = None, use_bundle: bool = True):
         """
         운세 템플릿 로더 초기화
         
         Args:
             template_path: 템플릿 파일 경로 (기본값: data/fortune_templates.json)
+            use_bundle: 기본 경로를 사용할 때 원본과 일치하는 데이터 번들이 있으면 번들에서 로드
         """
+        bundle_section = None
+        if template_path is None and use_bundle:
+            bundle = data_bundle.get_bundle()
+            if bundle is not None and bundle.source_path("templates") == data_bundle.DEFAULT_TEMPLATES_PATH:
+                bundle_section = bundle.fresh_section("templates")
+                if bundle_section is not None:
+                    template_path = data_bundle.DEFAULT_TEMPLATES_PATH
+        
         if template_path is None:
             # 여러 경로를 시도해서 파일을 찾습니다
             possible_paths = [
@@ -46,16 +408,21 @@ class FortuneTemplateLoader:
                 raise FileNotFoundError(f"운세 템플릿 파일을 찾을 수 없습니다. 시도한 경로들: {possible_paths}")
         
         self.template_path = template_path
-        self.templates = self._load_templates()
+        
+        # 리로드(쓰기 경로)끼리만 직렬화, 조회 경로는 잠금 없음
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+        self.last_reload_error: Optional[str] = None
+        
+        if bundle_section is not None:
+            self._snapshot = self._snapshot_from_bundle(bundle_section)
+        else:
+            self._snapshot = self._build_snapshot(version=1)
     
     def _load_templates(self) -> Dict:
         """템플릿 파일을 로드합니다."""
         try:
-            # 디버깅을 위한 경로 정보 출력
-            print(f"템플릿 파일 경로: {self.template_path}")
-            print(f"파일 존재 여부: {os.path.exists(self.template_path)}")
-            print(f"현재 작업 디렉토리: {os.getcwd()}")
-            
             with open(self.template_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except FileNotFoundError:
@@ -63,6 +430,138 @@ class FortuneTemplateLoader:
         except json.JSONDecodeError as e:
             raise ValueError(f"운세 템플릿 파일의 JSON 형식이 올바르지 않습니다: {e}")
     
+    def _build_snapshot(self, version: int,
+                        required_categories: Tuple[str, ...] = ()) -> TemplateSnapshot:
+        """템플릿 파일을 읽고 검증/컴파일해 새 스냅샷 생성"""
+        file_stamp = _file_stamp(self.template_path)
+        templates = self._load_templates()
+        validate_template_structure(templates)
+        
+        for section in ('categories', 'group_messages', 'special_combinations'):
+            if section not in templates:
+                raise ValueError(f"운세 템플릿에 '{section}' 항목이 없습니다")
+        missing = [category for category in required_categories if category not in templates['categories']]
+        if missing:
+            raise ValueError(f"운세 템플릿에서 기존 카테고리가 빠졌습니다: {missing}")
+        
+        return TemplateSnapshot(
+            version=version,
+            file_stamp=file_stamp,
+            templates=templates,
+            score_table=compile_score_table(templates),
+            harmony_table=compile_harmony_table(templates),
+            special_table=compile_special_table(templates)
+        )
+    
+    def _snapshot_from_bundle(self, section: Dict[str, Any]) -> TemplateSnapshot:
+        """데이터 번들에 미리 컴파일된 템플릿으로 첫 스냅샷 생성"""
+        return TemplateSnapshot(
+            version=1,
+            file_stamp=_file_stamp(self.template_path),
+            templates=section['templates'],
+            score_table=section['score_table'],
+            harmony_table=section['harmony_table'],
+            special_table=section['special_table']
+        )
+    
+    @property
+    def snapshot(self) -> TemplateSnapshot:
+        """현재 템플릿 스냅샷 (한 요청 안에서 일관된 조회가 필요하면 한 번 읽어 사용)"""
+        return self._snapshot
+    
+    @property
+    def reload_version(self) -> int:
+        """현재 템플릿 리로드 버전 (의존하는 캐시의 키로 사용)"""
+        return self._snapshot.version
+    
+    @property
+    def templates(self) -> Dict:
+        """현재 스냅샷의 원본 템플릿 데이터"""
+        return self._snapshot.templates
+    
+    @property
+    def score_table(self) -> Dict[str, Tuple[Optional[ScoreTemplate], ...]]:
+        """현재 스냅샷의 [카테고리][점수] 템플릿 테이블"""
+        return self._snapshot.score_table
+    
+    @property
+    def harmony_table(self) -> Tuple[Optional[Tuple[str, ...]], ...]:
+        """현재 스냅샷의 [화합 점수] 그룹 메시지 테이블"""
+        return self._snapshot.harmony_table
+    
+    @property
+    def special_table(self) -> SpecialCombinationTable:
+        """현재 스냅샷의 특별 조합 결정 테이블"""
+        return self._snapshot.special_table
+    
+    def reload(self, force: bool = False) -> bool:
+        """
+        템플릿 파일이 바뀌었으면 다시 로드해 스냅샷을 교체합니다.
+        
+        새 파일이 잘못되었으면 기존 스냅샷을 유지하고 예외를 그대로 전달합니다.
+        
+        Args:
+            force: True면 파일 변경 여부와 관계없이 다시 로드
+            
+        Returns:
+            bool: 스냅샷을 교체했으면 True
+        """
+        with self._reload_lock:
+            current = self._snapshot
+            if not force and _file_stamp(self.template_path) == current.file_stamp:
+                return False
+            
+            snapshot = self._build_snapshot(
+                version=current.version + 1,
+                required_categories=tuple(current.score_table)
+            )
+            self._snapshot = snapshot
+            self.last_reload_error = None
+            return True
+    
+    def start_watcher(self, interval: float = 2.0) -> None:
+        """
+        백그라운드 스레드에서 템플릿 파일의 변경을 주기적으로 확인해 리로드합니다.
+        
+        Args:
+            interval: 확인 주기 (초)
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="fortune-template-watcher", daemon=True
+        )
+        self._watcher.start()
+    
+    def stop_watcher(self) -> None:
+        """변경 감지 스레드를 중지합니다."""
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+    
+    def _watch(self, interval: float) -> None:
+        """변경 감지 루프 (실패한 리로드는 last_reload_error에 기록하고 다음 변경을 기다림)"""
+        failed_stamp = None
+        while not self._watcher_stop.wait(interval):
+            try:
+                stamp = _file_stamp(self.template_path)
+            except OSError as e:
+                self.last_reload_error = str(e)
+                continue
+            
+            # 실패했던 파일이 다시 바뀌기 전까지는 재시도하지 않음
+            if stamp == failed_stamp:
+                continue
+            try:
+                self.reload()
+            except Exception as e:
+                # 예상하지 못한 오류도 기록만 하고 감지를 계속 (스레드가 끝나면 핫 리로드가 멈춤)
+                failed_stamp = stamp
+                self.last_reload_error = str(e)
+    
     def get_category_info(self, category: str) -> Dict:
         """
         카테고리 정보를 반환합니다.
@@ -73,10 +572,11 @@ class FortuneTemplateLoader:
         Returns:
             카테고리 정보 딕셔너리
         """
-        if category not in self.templates['categories']:
+        categories = self._snapshot.templates['categories']
+        if category not in categories:
             raise ValueError(f"존재하지 않는 카테고리입니다: {category}")
         
-        return self.templates['categories'][category]
+        return categories[category]
     
     def get_score_range_name(self, score: int) -> str:
         """
@@ -88,71 +588,107 @@ class FortuneTemplateLoader:
         Returns:
             구간 이름 (excellent, good, average, poor, bad)
         """
+        return score_range_name(score)
+    
+    def get_score_template(self, category: str, score: int) -> ScoreTemplate:
+        """
+        컴파일된 (카테고리, 점수) 템플릿을 반환합니다.
+        
+        Args:
+            category: 카테고리 이름
+            score: 운세 점수 (1-100)
+            
+        Returns:
+            ScoreTemplate: 메시지 후보, 키워드, 결정적으로 선택된 메시지
+        """
         if not 1 <= score <= 100:
             raise ValueError(f"점수는 1-100 사이여야 합니다: {score}")
-        
-        if score >= 90:
-            return "excellent"
-        elif score >= 70:
-            return "good"
-        elif score >= 50:
-            return "average"
-        elif score >= 30:
-            return "poor"
-        else:
-            return "bad"
+        try:
+            return self._snapshot.score_table[category][score]
+        except KeyError:
+            raise ValueError(f"존재하지 않는 카테고리입니다: {category}")
     
-    def get_fortune_message(self, category: str, score: int) -> str:
+    def get_fortune_message(self, category: str, score: int,
+                            range_name: Optional[str] = None,
+                            rng: Optional[random.Random] = None) -> str:
         """
         카테고리와 점수에 맞는 운세 메시지를 반환합니다.
         
         Args:
             category: 카테고리 이름
             score: 운세 점수
+            range_name: 사용하지 않음 (점수 구간은 컴파일된 테이블에 포함됨, 호환용)
+            rng: 메시지 선택에 사용할 난수 생성기 (None이면 전역 random 모듈)
             
         Returns:
             운세 메시지
         """
-        category_data = self.get_category_info(category)
-        range_name = self.get_score_range_name(score)
+        return (rng or random).choice(self.get_score_template(category, score).messages)
+    
+    def select_fortune_message(self, category: str, score: int,
+                               range_name: Optional[str] = None) -> str:
+        """
+        카테고리와 점수에 맞는 운세 메시지를 결정적으로 선택합니다.
         
-        messages = category_data['score_ranges'][range_name]['messages']
-        return random.choice(messages)
+        같은 (카테고리, 점수)에는 워커나 재시작과 관계없이 항상 같은 메시지를 반환합니다.
+        
+        Args:
+            category: 카테고리 이름
+            score: 운세 점수
+            range_name: 사용하지 않음 (점수 구간은 컴파일된 테이블에 포함됨, 호환용)
+            
+        Returns:
+            운세 메시지
+        """
+        return self.get_score_template(category, score).message
     
-    def get_fortune_keywords(self, category: str, score: int) -> List[str]:
+    def get_fortune_keywords(self, category: str, score: int,
+                             range_name: Optional[str] = None) -> Tuple[str, ...]:
         """
         카테고리와 점수에 맞는 키워드 목록을 반환합니다.
         
         Args:
             category: 카테고리 이름
             score: 운세 점수
+            range_name: 사용하지 않음 (점수 구간은 컴파일된 테이블에 포함됨, 호환용)
             
         Returns:
-            키워드 목록
+            키워드 튜플 (같은 점수 구간에서 공유됨)
         """
-        category_data = self.get_category_info(category)
-        range_name = self.get_score_range_name(score)
-        
-        return category_data['score_ranges'][range_name]['keywords']
+        return self.get_score_template(category, score).keywords
     
-    def get_group_harmony_message(self, harmony_score: int) -> str:
+    def _harmony_messages(self, harmony_score: int) -> Tuple[str, ...]:
+        """화합 점수(1-100)에 해당하는 그룹 메시지 후보"""
+        if not 1 <= harmony_score <= 100:
+            raise ValueError(f"점수는 1-100 사이여야 합니다: {harmony_score}")
+        return self._snapshot.harmony_table[harmony_score]
+    
+    def get_group_harmony_message(self, harmony_score: int,
+                                  rng: Optional[random.Random] = None) -> str:
         """
         그룹 화합 점수에 맞는 메시지를 반환합니다.
         
         Args:
             harmony_score: 그룹 화합 점수 (1-100)
+            rng: 메시지 선택에 사용할 난수 생성기 (None이면 전역 random 모듈)
             
         Returns:
             그룹 화합 메시지
         """
-        range_name = self.get_score_range_name(harmony_score)
-        harmony_range = f"harmony_{range_name}"
-        
-        if harmony_range not in self.templates['group_messages']:
-            raise ValueError(f"존재하지 않는 그룹 메시지 구간입니다: {harmony_range}")
+        return (rng or random).choice(self._harmony_messages(harmony_score))
+    
+    def select_group_harmony_message(self, harmony_score: float) -> str:
+        """
+        그룹 화합 점수에 맞는 메시지를 결정적으로 선택합니다.
         
-        messages = self.templates['group_messages'][harmony_range]['messages']
-        return random.choice(messages)
+        Args:
+            harmony_score: 그룹 화합 점수 (1-100)
+            
+        Returns:
+            그룹 화합 메시지
+        """
+        messages = self._harmony_messages(int(harmony_score))
+        return messages[stable_index(f"harmony:{int(harmony_score * 100)}", len(messages))]
     
     def check_special_combination(self, scores: Dict[str, int]) -> Optional[Tuple[str, str, List[str]]]:
         """
@@ -164,27 +700,10 @@ class FortuneTemplateLoader:
         Returns:
             (조합명, 메시지, 키워드) 튜플 또는 None
         """
-        # 모든 카테고리가 90점 이상인지 확인
-        if all(score >= 90 for score in scores.values()):
-            combo = self.templates['special_combinations']['all_excellent']
-            return ('all_excellent', combo['message'], combo['keywords'])
-        
-        # 사랑운과 재물운이 모두 80점 이상인지 확인
-        if scores.get('love', 0) >= 80 and scores.get('wealth', 0) >= 80:
-            combo = self.templates['special_combinations']['love_wealth_high']
-            return ('love_wealth_high', combo['message'], combo['keywords'])
-        
-        # 건강운과 학업/직장운이 모두 80점 이상인지 확인
-        if scores.get('health', 0) >= 80 and scores.get('career', 0) >= 80:
-            combo = self.templates['special_combinations']['health_career_high']
-            return ('health_career_high', combo['message'], combo['keywords'])
-        
-        # 모든 카테고리가 30점 이하인지 확인
-        if all(score <= 30 for score in scores.values()):
-            combo = self.templates['special_combinations']['all_low']
-            return ('all_low', combo['message'], combo['keywords'])
-        
-        return None
+        combo = self._snapshot.special_table.match(scores)
+        if combo is None:
+            return None
+        return (combo.name, combo.message, list(combo.keywords))
     
     def get_all_categories(self) -> List[str]:
         """모든 카테고리 이름을 반환합니다."""
@@ -200,22 +719,17 @@ class FortuneTemplateLoader:
         category_data = self.get_category_info(category)
         return category_data['icon']
 
-# 전역 인스턴스 (싱글톤 패턴)
-_template_loader = None
-
 def get_template_loader() -> FortuneTemplateLoader:
-    """전역 템플릿 로더 인스턴스를 반환합니다."""
-    global _template_loader
-    if _template_loader is None:
-        _template_loader = FortuneTemplateLoader()
-    return _template_loader
+    """공유 템플릿 로더 인스턴스를 반환합니다 (리소스 레지스트리가 처음 요청될 때 생성)."""
+    from resources import registry
+    return registry.get("template_loader")
 
 # 편의 함수들
 def get_fortune_message(category: str, score: int) -> str:
     """운세 메시지를 반환하는 편의 함수"""
     return get_template_loader().get_fortune_message(category, score)
 
-def get_fortune_keywords(category: str, score: int) -> List[str]:
+def get_fortune_keywords(category: str, score: int) -> Tuple[str, ...]:
     """운세 키워드를 반환하는 편의 함수"""
     return get_template_loader().get_fortune_keywords(category, score)
 
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+그룹 운세 스트리밍 집계
+참석자 추가/삭제를 O(1)로 반영하는 평균, 화합 점수, 주요 카테고리 집계
+"""
+
+from itertools import count
+from typing import Dict, List, Optional, Tuple
+
+from models import Fortune, LargeGroupFortune
+
+# 주요 카테고리 판정 기준 (카테고리 평균 점수)
+DOMINANT_CATEGORY_THRESHOLD = 75
+
+
+class GroupAggregate:
+    """
+    그룹 점수의 스트리밍 집계
+
+    점수는 모두 정수이므로 Welford 방식의 실수 누적 대신 정확한 정수 거듭제곱 합
+    (개수, 합, 제곱합)을 유지합니다. 추가와 삭제가 모두 O(1)이고 반올림 오차가
+    쌓이지 않으며, statistics.variance와 비트 단위로 같은 분산을 얻습니다.
+    """
+
+    def __init__(self, categories: List[str]):
+        """
+        집계 초기화
+
+        Args:
+            categories: 카테고리 이름 리스트
+        """
+        self.categories = list(categories)
+        self.count = 0
+        self.total_sum = 0
+        self.total_square_sum = 0
+        self.category_sums: Dict[str, int] = {category: 0 for category in self.categories}
+
+    def add(self, total_score: int, category_scores: Dict[str, int]) -> None:
+        """참석자 점수 추가"""
+        self.count += 1
+        self.total_sum += total_score
+        self.total_square_sum += total_score * total_score
+        for category in self.categories:
+            self.category_sums[category] += category_scores[category]
+
+    def remove(self, total_score: int, category_scores: Dict[str, int]) -> None:
+        """참석자 점수 제거 (add()로 추가했던 값과 같아야 함)"""
+        if self.count == 0:
+            raise ValueError("집계에서 제거할 참석자가 없습니다")
+        self.count -= 1
+        self.total_sum -= total_score
+        self.total_square_sum -= total_score * total_score
+        for category in self.categories:
+            self.category_sums[category] -= category_scores[category]
+
+    def add_fortune(self, fortune: Fortune) -> None:
+        """Fortune 객체의 점수 추가"""
+        self.add(fortune.total_score, {
+            category: category_fortune.score
+            for category, category_fortune in fortune.categories.items()
+        })
+
+    def average_score(self) -> float:
+        """전체 점수 평균"""
+        if self.count == 0:
+            return 0.0
+        return self.total_sum / self.count
+
+    def variance(self) -> float:
+        """전체 점수의 표본 분산 (참석자 2명 미만이면 0)"""
+        if self.count < 2:
+            return 0.0
+        numerator = self.count * self.total_square_sum - self.total_sum * self.total_sum
+        return numerator / (self.count * (self.count - 1))
+
+    def harmony_score(self) -> float:
+        """
+        화합 점수 계산 (점수 편차 기반, 0-100)
+
+        FortuneEngine.calculate_group_harmony_score와 같은 공식을 사용합니다.
+        """
+        if self.count < 2:
+            return 100.0
+        harmony_score = max(0, 100 - (self.variance() / 10))
+        return min(100, harmony_score)
+
+    def category_average(self, category: str) -> float:
+        """카테고리 평균 점수"""
+        if self.count == 0:
+            return 0.0
+        return self.category_sums[category] / self.count
+
+    def dominant_categories(self) -> List[str]:
+        """평균 75점 이상인 카테고리를 평균 점수 내림차순으로 반환"""
+        if self.count == 0:
+            return []
+        averages = {category: self.category_average(category) for category in self.categories}
+        dominant = [
+            category for category, average in averages.items()
+            if average >= DOMINANT_CATEGORY_THRESHOLD
+        ]
+        dominant.sort(key=lambda category: averages[category], reverse=True)
+        return dominant
+
+
+class LargeGroupSession:
+    """
+    대규모 그룹 운세 세션
+
+    참석자별로 점수만 보관하고 메시지가 포함된 Fortune 객체는 만들지 않으므로
+    수백~수십만 명 규모에서도 참석자 추가/삭제가 O(1)입니다.
+    """
+
+    def __init__(self, engine, current_date: str):
+        """
+        세션 초기화
+
+        Args:
+            engine: 점수 생성에 사용할 FortuneEngine
+            current_date: 운세 날짜 (YYYY-MM-DD)
+        """
+        self.engine = engine
+        self.current_date = current_date
+        self.aggregate = GroupAggregate(engine.categories)
+        self._participants: Dict[int, Tuple[str, str, int, Dict[str, int]]] = {}
+        self._ids = count(1)
+
+    def __len__(self) -> int:
+        return len(self._participants)
+
+    def add_participant(self, birth_date: str, name: Optional[str] = None) -> int:
+        """
+        참석자 추가
+
+        Args:
+            birth_date: 생년월일 (YYYY-MM-DD)
+            name: 참석자 이름 (선택사항)
+
+        Returns:
+            int: 참석자 ID (remove_participant에 사용)
+        """
+        category_scores = self.engine.generate_category_scores(birth_date, self.current_date)
+        total_score = self.engine.calculate_total_score(category_scores)
+
+        participant_id = next(self._ids)
+        if name is None:
+            name = f"참석자{participant_id}"
+        self._participants[participant_id] = (name, birth_date, total_score, category_scores)
+        self.aggregate.add(total_score, category_scores)
+        return participant_id
+
+    def remove_participant(self, participant_id: int) -> None:
+        """
+        참석자 제거
+
+        Args:
+            participant_id: add_participant가 반환한 참석자 ID
+        """
+        if participant_id not in self._participants:
+            raise ValueError(f"존재하지 않는 참석자입니다: {participant_id}")
+        _, _, total_score, category_scores = self._participants.pop(participant_id)
+        self.aggregate.remove(total_score, category_scores)
+
+    def participants(self) -> List[Dict[str, object]]:
+        """참석자별 요약 (이름, 생년월일, 전체 점수) 리스트"""
+        return [
+            {"id": participant_id, "name": name, "birth_date": birth_date, "total_score": total_score}
+            for participant_id, (name, birth_date, total_score, _) in self._participants.items()
+        ]
+
+    def summary(self) -> LargeGroupFortune:
+        """
+        현재 참석자 기준 그룹 운세 요약
+
+        Returns:
+            LargeGroupFortune: 그룹 운세 요약
+        """
+        if self.aggregate.count < 2:
+            raise ValueError("그룹은 최소 2명 이상이어야 합니다")
+
+        harmony_score = self.aggregate.harmony_score()
+        return LargeGroupFortune(
+            average_score=self.aggregate.average_score(),
+            harmony_score=harmony_score,
+            dominant_categories=self.aggregate.dominant_categories(),
+            group_message=self.engine.generate_group_message(harmony_score),
+            participant_count=self.aggregate.count,
+            algorithm_version=self.engine.algorithm_version
+        )
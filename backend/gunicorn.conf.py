@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+"""
+gunicorn 설정
+마스터에서 앱과 데이터를 한 번 로드(preload)한 뒤 워커를 fork해
+메뉴 카탈로그/운세 템플릿 메모리를 copy-on-write로 공유
+"""
+
+import os
+
+preload_app = True
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+
+
+def post_fork(server, worker):
+    """워커별 백그라운드 작업 재시작 (스레드는 fork로 복제되지 않음)"""
+    import resources
+    resources.start_background_tasks(
+        float(os.environ.get('FORTUNE_TEMPLATE_RELOAD_INTERVAL', resources.DEFAULT_TEMPLATE_RELOAD_INTERVAL)),
+        float(os.environ.get('FORTUNE_MENU_RELOAD_INTERVAL', resources.DEFAULT_MENU_RELOAD_INTERVAL))
+    )
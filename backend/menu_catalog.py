@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+불변 메뉴 카탈로그 스냅샷
+메뉴 튜플과 파생 인덱스를 한 번에 묶은 버전 있는 스냅샷과 복사 없는 위치 뷰 제공
+"""
+
+from collections.abc import Sequence as SequenceABC
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from models import Menu, MenuCategory, SharingType
+from menu_query import build_menu_bitsets
+
+# 파생 인덱스 형식 버전 (인덱스 구성이 바뀌면 올려서 이전 번들의 인덱스를 다시 생성)
+MENU_INDEX_VERSION = 5
+
+# 점수 버킷 수 (인덱스 0은 사용하지 않음, 1-100은 점수)
+SCORE_BUCKETS = 101
+
+
+def build_menu_indexes(menus: Sequence[Menu]) -> Dict[str, Any]:
+    """
+    메뉴 목록에서 파생 인덱스 생성 (데이터 번들에도 함께 저장됨)
+
+    모든 버킷은 원래 메뉴 순서를 유지하는 불변 튜플입니다.
+
+    Args:
+        menus: 메뉴 목록
+
+    Returns:
+        Dict[str, Any]: {
+            "version": 인덱스 형식 버전,
+            "by_id": {메뉴 ID: 메뉴} (ID가 중복되면 먼저 나온 메뉴),
+            "by_category": {MenuCategory: 메뉴 튜플},
+            "by_score": 점수(1-100)별 적합한 메뉴 튜플 (길이 101),
+            "by_serving_size": {인원수: 메뉴 튜플},
+            "shared_by_serving_size": {인원수: 공유 가능한 메뉴 튜플},
+            "keyword_postings": {운세 키워드: 키워드를 가진 메뉴 위치 튜플 (오름차순)},
+            "bitsets": 속성 값별 메뉴 위치 비트셋 (menu_query.build_menu_bitsets)
+        }
+    """
+    by_id: Dict[str, Menu] = {}
+    by_category: Dict[MenuCategory, List[Menu]] = {}
+    by_score: List[List[Menu]] = [[] for _ in range(SCORE_BUCKETS)]
+    by_serving_size: Dict[int, List[Menu]] = {}
+    shared_by_serving_size: Dict[int, List[Menu]] = {}
+    keyword_postings: Dict[str, List[int]] = {}
+
+    for position, menu in enumerate(menus):
+        by_id.setdefault(menu.id, menu)
+        by_category.setdefault(menu.category, []).append(menu)
+
+        min_score, max_score = menu.score_range
+        for score in range(min_score, max_score + 1):
+            by_score[score].append(menu)
+
+        shared = menu.sharing_type in (SharingType.SHARED, SharingType.BOTH)
+        for serving_size in range(menu.min_serving, menu.max_serving + 1):
+            by_serving_size.setdefault(serving_size, []).append(menu)
+            if shared:
+                shared_by_serving_size.setdefault(serving_size, []).append(menu)
+
+        for keyword in dict.fromkeys(menu.fortune_keywords):
+            keyword_postings.setdefault(keyword, []).append(position)
+
+    return {
+        "version": MENU_INDEX_VERSION,
+        "by_id": by_id,
+        "by_category": {category: tuple(items) for category, items in by_category.items()},
+        "by_score": tuple(tuple(items) for items in by_score),
+        "by_serving_size": {size: tuple(items) for size, items in by_serving_size.items()},
+        "shared_by_serving_size": {size: tuple(items) for size, items in shared_by_serving_size.items()},
+        "keyword_postings": {keyword: tuple(positions) for keyword, positions in keyword_postings.items()},
+        "bitsets": build_menu_bitsets(menus)
+    }
+
+
+def build_menu_statistics(bitsets: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    속성 값별 비트셋에서 카탈로그 통계 생성 (스냅샷마다 한 번, 메뉴를 다시 순회하지 않음)
+
+    값별 메뉴 수는 비트 수로 세고, 값의 순서는 처음 나온 메뉴 위치(가장 낮은 비트) 순서입니다.
+    점수는 1-100 안의 정수 범위이므로 최소/최대 점수는 비어 있지 않은 첫/마지막 점수 버킷입니다.
+
+    Args:
+        bitsets: menu_query.build_menu_bitsets() 결과 (또는 같은 접근 방식의 컬럼형 비트셋)
+
+    Returns:
+        Dict[str, Any]: {
+            "total": 메뉴 수,
+            "categories" / "difficulties" / "sharing_types": {값: 메뉴 수},
+            "score_ranges": {"min", "max"} (메뉴가 없으면 None),
+            "serving_sizes": {"min", "max"} (메뉴가 없으면 None),
+            "keywords": {운세 키워드: 키워드를 가진 메뉴 수},
+            "score_buckets": {점수(1-100): 적합한 메뉴 수}
+        }
+    """
+    def counts(values: Any) -> Dict[Any, int]:
+        items = [(value, values[value]) for value in values.keys()]
+        items = [(value, bits) for value, bits in items if bits]
+        items.sort(key=lambda item: (item[1] & -item[1]).bit_length())
+        return {getattr(value, "value", value): bits.bit_count() for value, bits in items}
+
+    score_bitsets = bitsets["score"]
+    if not hasattr(score_bitsets, "keys"):
+        score_bitsets = dict(enumerate(score_bitsets))
+    score_buckets = {score: score_bitsets.get(score, 0).bit_count() for score in range(1, SCORE_BUCKETS)}
+    scores = [score for score, count in score_buckets.items() if count]
+    serving_sizes = [size for size in bitsets["group_size"].keys() if bitsets["group_size"][size]]
+
+    categories = counts(bitsets["category"])
+    return {
+        "total": sum(categories.values()),
+        "categories": categories,
+        "difficulties": counts(bitsets["difficulty"]),
+        "sharing_types": counts(bitsets["sharing"]),
+        "score_ranges": {"min": scores[0], "max": scores[-1]} if scores else None,
+        "serving_sizes": {"min": min(serving_sizes), "max": max(serving_sizes)} if serving_sizes else None,
+        "keywords": counts(bitsets["keywords"]),
+        "score_buckets": score_buckets
+    }
+
+
+def summarize_menu_statistics(statistics: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    카탈로그 통계에서 MenuLoader.get_menu_statistics() 형식의 요약 (호출자가 수정해도 되는 복사본)
+
+    Args:
+        statistics: build_menu_statistics() 결과
+
+    Returns:
+        Dict[str, Any]: 메뉴 수, 카테고리/난이도/공유 타입별 메뉴 수, 점수/인원수 범위 (메뉴가 없으면 {"total": 0})
+    """
+    if not statistics["total"]:
+        return {"total": 0}
+    return {
+        "total": statistics["total"],
+        "categories": dict(statistics["categories"]),
+        "difficulties": dict(statistics["difficulties"]),
+        "sharing_types": dict(statistics["sharing_types"]),
+        "score_ranges": dict(statistics["score_ranges"]),
+        "serving_sizes": dict(statistics["serving_sizes"])
+    }
+
+
+class CatalogView(SequenceABC):
+    """
+    카탈로그 메뉴 튜플의 일부를 가리키는 읽기 전용 뷰
+
+    메뉴를 복사하지 않고 위치(range 또는 위치 시퀀스)만 가지며, 뷰를 다시 슬라이스해도
+    위치만 잘라냅니다.
+    """
+
+    __slots__ = ("_menus", "_positions")
+
+    def __init__(self, menus: Tuple[Menu, ...], positions: Sequence[int]):
+        """
+        Args:
+            menus: 카탈로그 메뉴 튜플
+            positions: 뷰에 포함할 메뉴 위치
+        """
+        self._menus = menus
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Menu, 'CatalogView']:
+        if isinstance(index, slice):
+            return CatalogView(self._menus, self._positions[index])
+        return self._menus[self._positions[index]]
+
+    def __iter__(self) -> Iterator[Menu]:
+        return map(self._menus.__getitem__, self._positions)
+
+    def __repr__(self) -> str:
+        return f"CatalogView({len(self)}개 메뉴)"
+
+
+@dataclass(frozen=True, eq=False, repr=False)
+class MenuCatalog(SequenceABC):
+    """
+    메뉴 카탈로그의 불변 스냅샷 (메뉴 튜플 + 파생 인덱스 + 통계 + 버전)
+
+    스냅샷은 만든 뒤 바뀌지 않으므로 호출자는 복사 없이 순회/인덱싱/슬라이스할 수
+    있습니다. 카탈로그를 바꾸려면 새 스냅샷을 만들어 MenuLoader.publish()로 교체합니다.
+    메뉴 객체도 공유되므로 수정하지 않아야 합니다.
+    """
+
+    version: int
+    menus: Tuple[Menu, ...]
+    by_id: Dict[str, Menu]
+    by_category: Dict[MenuCategory, Tuple[Menu, ...]]
+    by_score: Tuple[Tuple[Menu, ...], ...]
+    by_serving_size: Dict[int, Tuple[Menu, ...]]
+    shared_by_serving_size: Dict[int, Tuple[Menu, ...]]
+    keyword_postings: Dict[str, Tuple[int, ...]]
+    bitsets: Dict[str, Any]
+    statistics: Dict[str, Any]
+
+    @classmethod
+    def build(cls, menus: Sequence[Menu], version: int,
+              indexes: Optional[Dict[str, Any]] = None) -> 'MenuCatalog':
+        """
+        메뉴 목록으로 스냅샷 생성
+
+        Args:
+            menus: 검증된 메뉴 목록
+            version: 스냅샷 버전
+            indexes: 미리 만든 파생 인덱스 (None이거나 형식 버전이 다르면 새로 생성)
+
+        Returns:
+            MenuCatalog: 새 스냅샷
+        """
+        menus = tuple(menus)
+        if indexes is None or indexes.get("version") != MENU_INDEX_VERSION:
+            indexes = build_menu_indexes(menus)
+        return cls(
+            version=version,
+            menus=menus,
+            by_id=indexes["by_id"],
+            by_category=indexes["by_category"],
+            by_score=indexes["by_score"],
+            by_serving_size=indexes["by_serving_size"],
+            shared_by_serving_size=indexes["shared_by_serving_size"],
+            keyword_postings=indexes["keyword_postings"],
+            bitsets=indexes["bitsets"],
+            statistics=build_menu_statistics(indexes["bitsets"])
+        )
+
+    def __len__(self) -> int:
+        return len(self.menus)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Menu, CatalogView]:
+        if isinstance(index, slice):
+            return CatalogView(self.menus, range(len(self.menus))[index])
+        return self.menus[index]
+
+    def __iter__(self) -> Iterator[Menu]:
+        return iter(self.menus)
+
+    def __repr__(self) -> str:
+        return f"MenuCatalog(version={self.version}, {len(self.menus)}개 메뉴)"
+
+    def view(self, positions: Sequence[int]) -> CatalogView:
+        """
+        지정한 위치의 메뉴 뷰 (MenuSelection.positions(), keyword_postings 등)
+
+        Args:
+            positions: 메뉴 위치
+
+        Returns:
+            CatalogView: 복사 없는 읽기 전용 뷰
+        """
+        return CatalogView(self.menus, positions)
@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메모리 매핑 컬럼형 메뉴 카탈로그
+추천에 쓰이는 메뉴 속성을 고정 폭 컬럼으로, 문자열은 중복 없는 문자열 풀로 한 파일에
+저장하고 mmap으로 열어 필요한 메뉴만 지연 생성 (메뉴 수십만-수백만 개 규모용)
+
+사용법 (배포 빌드 단계): python menu_columns.py --output data/menu_columns.bin
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from models import Menu, MenuCategory, DifficultyLevel, SharingType
+from menu_catalog import CatalogView, build_menu_statistics
+from menu_query import bitset_positions, build_menu_bitsets
+import data_bundle
+
+# 파일 형식 식별자 (형식이 바뀌면 숫자를 올려 이전 파일을 무효화)
+COLUMNS_MAGIC = b"FDRCOLS1"
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGNMENT = 8
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_COLUMNS_PATH = os.path.join(_DATA_DIR, 'menu_columns.bin')
+
+# 메뉴별 고정 폭 컬럼 (이름: array 타입 코드)
+_MENU_COLUMNS = {
+    "min_score": "B",
+    "max_score": "B",
+    "min_serving": "I",
+    "max_serving": "I",
+    "base_score": "B",
+    "recommendation_score": "i",
+    "category": "B",
+    "difficulty": "B",
+    "sharing_type": "B",
+    "id_ref": "I",
+    "name_ref": "I",
+    "cooking_time_ref": "I",
+    "description_ref": "I"
+}
+
+# 지연 로드하는 필드 (Menu 속성 이름: 문자열 풀 참조 컬럼)
+_COLD_STRING_FIELDS = {
+    "id": "id_ref",
+    "name": "name_ref",
+    "cooking_time": "cooking_time_ref",
+    "description": "description_ref"
+}
+
+_CATEGORIES = tuple(MenuCategory)
+_DIFFICULTIES = tuple(DifficultyLevel)
+_SHARING_TYPES = tuple(SharingType)
+
+
+def columns_path() -> Optional[str]:
+    """
+    사용할 컬럼형 카탈로그 경로 (FORTUNE_MENU_COLUMNS 환경 변수, 없거나 빈 문자열이면 비활성화)
+
+    Returns:
+        Optional[str]: 컬럼형 카탈로그 파일 경로 또는 None
+    """
+    return os.environ.get('FORTUNE_MENU_COLUMNS') or None
+
+
+class _StringPool:
+    """중복 없는 문자열 목록을 만드는 빌더 (문자열 -> 참조 번호)"""
+
+    def __init__(self):
+        self.refs: Dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        ref = self.refs.get(value)
+        if ref is None:
+            ref = self.refs[value] = len(self.refs)
+        return ref
+
+
+def write_columnar_catalog(menus: Sequence[Menu], output_path: str,
+                           source: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    검증된 메뉴 목록을 컬럼형 카탈로그 파일로 저장
+
+    Args:
+        menus: 검증된 메뉴 목록
+        output_path: 생성할 파일 경로
+        source: 원본 메뉴 파일 정보 (data_bundle.source_info, 열 때 최신 여부 확인에 사용)
+
+    Returns:
+        Dict[str, Any]: 생성 결과 요약
+    """
+    pool = _StringPool()
+    columns = {name: array(typecode) for name, typecode in _MENU_COLUMNS.items()}
+    keyword_offsets = array("I", [0])
+    keyword_refs = array("I")
+    ingredient_offsets = array("I", [0])
+    ingredient_refs = array("I")
+    keyword_vocabulary: Dict[str, int] = {}
+    category_codes = {value: code for code, value in enumerate(_CATEGORIES)}
+    difficulty_codes = {value: code for code, value in enumerate(_DIFFICULTIES)}
+    sharing_codes = {value: code for code, value in enumerate(_SHARING_TYPES)}
+
+    for menu in menus:
+        columns["min_score"].append(menu.score_range[0])
+        columns["max_score"].append(menu.score_range[1])
+        columns["min_serving"].append(menu.min_serving)
+        columns["max_serving"].append(menu.max_serving)
+        columns["base_score"].append(menu.base_score)
+        columns["recommendation_score"].append(menu.recommendation_score)
+        columns["category"].append(category_codes[menu.category])
+        columns["difficulty"].append(difficulty_codes[menu.difficulty])
+        columns["sharing_type"].append(sharing_codes[menu.sharing_type])
+        for field_name, column_name in _COLD_STRING_FIELDS.items():
+            columns[column_name].append(pool.add(getattr(menu, field_name)))
+        for keyword in menu.fortune_keywords:
+            ref = keyword_vocabulary.get(keyword)
+            if ref is None:
+                ref = keyword_vocabulary[keyword] = pool.add(keyword)
+            keyword_refs.append(ref)
+        keyword_offsets.append(len(keyword_refs))
+        ingredient_refs.extend(pool.add(ingredient) for ingredient in menu.ingredients)
+        ingredient_offsets.append(len(ingredient_refs))
+
+    # ID 조회용 정렬 순서 (ID가 중복되면 먼저 나온 메뉴가 앞)
+    ids = [menu.id for menu in menus]
+    columns["id_order"] = array("I", sorted(range(len(ids)), key=ids.__getitem__))
+    columns["keyword_offsets"] = keyword_offsets
+    columns["keyword_refs"] = keyword_refs
+    columns["ingredient_offsets"] = ingredient_offsets
+    columns["ingredient_refs"] = ingredient_refs
+
+    pool_data = bytearray()
+    pool_offsets = array("Q", [0])
+    for value in pool.refs:
+        pool_data += value.encode("utf-8")
+        pool_offsets.append(len(pool_data))
+    columns["pool_offsets"] = pool_offsets
+    columns["pool_data"] = array("B", pool_data)
+
+    # 속성 값별 비트셋을 같은 크기의 슬롯으로 저장 (menu_query.build_menu_bitsets)
+    bitset_bytes = (len(menus) + 7) // 8
+    bitsets = build_menu_bitsets(menus)
+    slot_data = bytearray()
+    slots: Dict[str, Dict[str, int]] = {}
+
+    def add_slot(bits: int) -> int:
+        slot_data.extend(bits.to_bytes(bitset_bytes, "little"))
+        return len(slot_data) // bitset_bytes - 1 if bitset_bytes else 0
+
+    slots["score"] = {str(score): add_slot(bits) for score, bits in enumerate(bitsets["score"]) if score}
+    for name in ("group_size", "sharing", "category", "difficulty", "keywords"):
+        slots[name] = {
+            str(value.value if hasattr(value, "value") else value): add_slot(bits)
+            for value, bits in bitsets[name].items()
+        }
+    columns["bitset_data"] = array("B", slot_data)
+
+    layout: Dict[str, List[Any]] = {}
+    offset = 0
+    for name, column in columns.items():
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+        size = len(column) * column.itemsize
+        layout[name] = [offset, size, column.typecode]
+        offset += size
+
+    header = json.dumps({
+        "count": len(menus),
+        "byteorder": sys.byteorder,
+        "source": source,
+        "columns": layout,
+        "keyword_vocabulary": keyword_vocabulary,
+        "bitset_bytes": bitset_bytes,
+        "bitset_slots": slots
+    }, ensure_ascii=False).encode("utf-8")
+    data_start = -(-(len(COLUMNS_MAGIC) + _HEADER_LENGTH.size + len(header)) // _ALIGNMENT) * _ALIGNMENT
+
+    # 쓰는 도중의 파일을 열지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(COLUMNS_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+        for name, column in columns.items():
+            f.write(b"\0" * (data_start + layout[name][0] - f.tell()))
+            column.tofile(f)
+    os.replace(temp_path, output_path)
+
+    return {
+        "path": os.path.abspath(output_path),
+        "bytes": os.path.getsize(output_path),
+        "menus": len(menus),
+        "strings": len(pool.refs)
+    }
+
+
+class LazyMenu(Menu):
+    """
+    컬럼형 카탈로그의 메뉴 하나
+
+    추천 점수 계산에 쓰이는 속성(점수 범위, 인원수, 공유 타입, 카테고리, 난이도,
+    기본 점수, 키워드)만 만들 때 읽고, 이름/설명/재료 등은 처음 접근할 때 문자열
+    풀에서 읽습니다. 파일은 쓰기 전에 검증되었으므로 Menu 검증은 다시 하지 않습니다.
+    """
+
+    def __init__(self, catalog: 'ColumnarMenuCatalog', position: int):
+        (min_score, max_score, min_serving, max_serving, base_score,
+         category, difficulty, sharing_type) = catalog.hot_columns
+        self._catalog = catalog
+        self._position = position
+        self.score_range = (min_score[position], max_score[position])
+        self.min_serving = min_serving[position]
+        self.max_serving = max_serving[position]
+        self.base_score = base_score[position]
+        self.category = _CATEGORIES[category[position]]
+        self.difficulty = _DIFFICULTIES[difficulty[position]]
+        self.sharing_type = _SHARING_TYPES[sharing_type[position]]
+        self.fortune_keywords = catalog.keywords_at(position)
+
+    def __getattr__(self, name: str) -> Any:
+        # 인스턴스에 없는 속성만 여기로 옴: 지연 필드를 읽어 인스턴스에 저장
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = self._catalog.cold_field(self._position, name)
+        setattr(self, name, value)
+        return value
+
+    def __reduce__(self):
+        # 프로세스 간 전달 시 mmap 대신 일반 Menu로 직렬화
+        return (Menu.from_dict, (self.to_dict(),))
+
+    def to_menu(self) -> Menu:
+        """모든 필드를 읽은 일반 Menu 객체"""
+        return Menu.from_dict(self.to_dict())
+
+
+class _SlotBitsets:
+    """값 -> 비트셋 슬롯 매핑 (dict처럼 get/[]로 비트셋 정수를 반환)"""
+
+    def __init__(self, catalog: 'ColumnarMenuCatalog', slots: Dict[Any, int]):
+        self._catalog = catalog
+        self._slots = slots
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        slot = self._slots.get(key)
+        return default if slot is None else self._catalog.bitset(slot)
+
+    def __getitem__(self, key: Any) -> int:
+        slot = self._slots.get(key)
+        if slot is None:
+            raise KeyError(key)
+        return self._catalog.bitset(slot)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._slots
+
+    def keys(self):
+        return self._slots.keys()
+
+
+class _BitsetBuckets:
+    """값 -> 메뉴 뷰 매핑 (MenuCatalog의 by_category/by_score 등과 같은 접근 방식)"""
+
+    def __init__(self, catalog: 'ColumnarMenuCatalog', bitsets: _SlotBitsets, mask: Optional[int] = None):
+        self._catalog = catalog
+        self._bitsets = bitsets
+        self._mask = mask
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        bits = self._bitsets.get(key, 0)
+        if self._mask is not None:
+            bits &= self._mask
+        if not bits:
+            return default
+        return self._catalog.view(bitset_positions(bits))
+
+    def __getitem__(self, key: Any) -> CatalogView:
+        return self.get(key, self._catalog.view(()))
+
+
+class _BitsetPostings:
+    """키워드 -> 메뉴 위치 (len은 비트 수만 세고, 위치는 순회할 때 계산)"""
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: int):
+        self.bits = bits
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(bitset_positions(self.bits))
+
+
+class _KeywordPostings:
+    """키워드 -> _BitsetPostings 매핑 (MenuCatalog.keyword_postings 대체)"""
+
+    def __init__(self, bitsets: _SlotBitsets):
+        self._bitsets = bitsets
+
+    def get(self, keyword: str, default: Any = None) -> Any:
+        bits = self._bitsets.get(keyword)
+        return default if bits is None else _BitsetPostings(bits)
+
+
+class _IdIndex:
+    """정렬된 ID 순서 컬럼에서 이진 탐색하는 ID 조회 (MenuCatalog.by_id 대체)"""
+
+    def __init__(self, catalog: 'ColumnarMenuCatalog'):
+        self._catalog = catalog
+
+    def get(self, menu_id: str, default: Any = None) -> Any:
+        catalog = self._catalog
+        order = catalog.columns["id_order"]
+        id_refs = catalog.columns["id_ref"]
+        index = bisect_left(order, menu_id, key=lambda position: catalog.string(id_refs[position]))
+        if index < len(order) and catalog.string(id_refs[order[index]]) == menu_id:
+            return catalog[order[index]]
+        return default
+
+    def __contains__(self, menu_id: str) -> bool:
+        return self.get(menu_id) is not None
+
+
+class ColumnarMenuCatalog(SequenceABC):
+    """
+    mmap으로 연 컬럼형 메뉴 카탈로그 (MenuCatalog와 같은 속성으로 MenuLoader에서 사용)
+
+    파일은 읽기 전용으로 매핑되므로 gunicorn --preload 마스터에서 열면 모든 워커가
+    같은 페이지 캐시를 공유하고, 프로세스에는 요청에서 만든 LazyMenu만 남습니다.
+    인덱스는 파일에 저장된 비트셋에서 요청마다 계산합니다.
+    """
+
+    def __init__(self, path: str, version: int):
+        """
+        Args:
+            path: write_columnar_catalog()로 만든 파일 경로
+            version: 스냅샷 버전
+
+        Raises:
+            ValueError: 형식이 다르거나 다른 바이트 순서로 만든 파일인 경우
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        prefix = len(COLUMNS_MAGIC) + _HEADER_LENGTH.size
+        if self._mmap[:len(COLUMNS_MAGIC)] != COLUMNS_MAGIC:
+            raise ValueError(f"컬럼형 카탈로그 형식이 올바르지 않습니다: {path}")
+        (header_length,) = _HEADER_LENGTH.unpack(self._mmap[len(COLUMNS_MAGIC):prefix])
+        header = json.loads(self._mmap[prefix:prefix + header_length].decode("utf-8"))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"다른 바이트 순서로 만든 컬럼형 카탈로그입니다: {path}")
+
+        data_start = -(-(prefix + header_length) // _ALIGNMENT) * _ALIGNMENT
+        buffer = memoryview(self._mmap)
+        self.columns: Dict[str, memoryview] = {
+            name: buffer[data_start + offset:data_start + offset + size].cast(typecode)
+            for name, (offset, size, typecode) in header["columns"].items()
+        }
+
+        self.path = path
+        self.version = version
+        self.source: Optional[Dict[str, Any]] = header["source"]
+        self._count = header["count"]
+        self._bitset_bytes = header["bitset_bytes"]
+        self.hot_columns = tuple(self.columns[name] for name in (
+            "min_score", "max_score", "min_serving", "max_serving", "base_score",
+            "category", "difficulty", "sharing_type"
+        ))
+        self._keyword_offsets = self.columns["keyword_offsets"]
+        self._keyword_refs = self.columns["keyword_refs"]
+        self._keyword_strings = {ref: keyword for keyword, ref in header["keyword_vocabulary"].items()}
+
+        slots = header["bitset_slots"]
+        self.bitsets = {
+            "score": _SlotBitsets(self, {int(score): slot for score, slot in slots["score"].items()}),
+            "group_size": _SlotBitsets(self, {int(size): slot for size, slot in slots["group_size"].items()}),
+            "sharing": _SlotBitsets(self, {SharingType(value): slot for value, slot in slots["sharing"].items()}),
+            "category": _SlotBitsets(self, {MenuCategory(value): slot for value, slot in slots["category"].items()}),
+            "difficulty": _SlotBitsets(self, {DifficultyLevel(value): slot
+                                              for value, slot in slots["difficulty"].items()}),
+            "keywords": _SlotBitsets(self, slots["keywords"])
+        }
+        shared_mask = (self.bitsets["sharing"].get(SharingType.SHARED, 0)
+                       | self.bitsets["sharing"].get(SharingType.BOTH, 0))
+        self.by_id = _IdIndex(self)
+        self.by_category = _BitsetBuckets(self, self.bitsets["category"])
+        self.by_score = _BitsetBuckets(self, self.bitsets["score"])
+        self.by_serving_size = _BitsetBuckets(self, self.bitsets["group_size"])
+        self.shared_by_serving_size = _BitsetBuckets(self, self.bitsets["group_size"], shared_mask)
+        self.keyword_postings = _KeywordPostings(self.bitsets["keywords"])
+        self.statistics = build_menu_statistics(self.bitsets)
+
+    @property
+    def menus(self) -> 'ColumnarMenuCatalog':
+        """메뉴 시퀀스 (MenuCatalog.menus와 같은 용도, 접근할 때 LazyMenu 생성)"""
+        return self
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Menu, CatalogView]:
+        if isinstance(index, slice):
+            return CatalogView(self, range(self._count)[index])
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("메뉴 위치가 범위를 벗어났습니다")
+        return LazyMenu(self, index)
+
+    def __iter__(self) -> Iterator[Menu]:
+        for position in range(self._count):
+            yield LazyMenu(self, position)
+
+    def __repr__(self) -> str:
+        return f"ColumnarMenuCatalog(version={self.version}, {self._count}개 메뉴, {self.path})"
+
+    def view(self, positions: Sequence[int]) -> CatalogView:
+        """지정한 위치의 메뉴 뷰"""
+        return CatalogView(self, positions)
+
+    def string(self, ref: int) -> str:
+        """문자열 풀의 참조 번호에 해당하는 문자열"""
+        offsets = self.columns["pool_offsets"]
+        return str(self.columns["pool_data"][offsets[ref]:offsets[ref + 1]], "utf-8")
+
+    def bitset(self, slot: int) -> int:
+        """저장된 비트셋 슬롯을 정수로 변환"""
+        size = self._bitset_bytes
+        return int.from_bytes(self.columns["bitset_data"][slot * size:(slot + 1) * size], "little")
+
+    def keywords_at(self, position: int) -> List[str]:
+        """메뉴의 운세 키워드 (키워드 문자열은 열 때 한 번만 디코딩)"""
+        offsets = self._keyword_offsets
+        refs = self._keyword_refs[offsets[position]:offsets[position + 1]]
+        return list(map(self._keyword_strings.__getitem__, refs))
+
+    def cold_field(self, position: int, name: str) -> Any:
+        """
+        지연 로드 필드 값
+
+        Raises:
+            AttributeError: Menu에 없는 필드인 경우
+        """
+        columns = self.columns
+        if name in _COLD_STRING_FIELDS:
+            return self.string(columns[_COLD_STRING_FIELDS[name]][position])
+        if name == "ingredients":
+            refs = columns["ingredient_refs"][columns["ingredient_offsets"][position]:
+                                              columns["ingredient_offsets"][position + 1]]
+            return [self.string(ref) for ref in refs]
+        if name == "recommendation_score":
+            return columns["recommendation_score"][position]
+        raise AttributeError(name)
+
+    def is_fresh(self, source_path: str) -> bool:
+        """파일을 만든 원본 메뉴 파일이 source_path이고 그 뒤로 바뀌지 않았는지 여부"""
+        source = self.source
+        return (source is not None
+                and source["path"] == os.path.abspath(source_path)
+                and data_bundle.is_source_fresh(source))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점 (배포 빌드 단계에서 실행)"""
+    parser = argparse.ArgumentParser(description="컬럼형 메뉴 카탈로그 생성")
+    parser.add_argument("--menus", default=data_bundle.DEFAULT_MENUS_PATH, help="메뉴 데이터 JSON 경로")
+    parser.add_argument("--output", default=DEFAULT_COLUMNS_PATH, help="생성할 파일 경로")
+    parser.add_argument("--workers", type=int, default=0, help="메뉴 검증 워커 프로세스 수 (0이면 현재 프로세스)")
+    args = parser.parse_args(argv)
+
+    try:
+        menus, _ = data_bundle.load_source_menus(args.menus, args.workers)
+    except (OSError, ValueError) as e:
+        print(f"메뉴 데이터를 읽지 못했습니다: {e}", file=sys.stderr)
+        return 1
+    result = write_columnar_catalog(menus, args.output, data_bundle.source_info(args.menus))
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,227 +4,601 @@
 JSON 파일에서 메뉴 데이터를 로드하고 필터링하는 기능 제공
 """
 
+import copy
 import json
 import os
-from typing import List, Dict, Any, Optional
+import threading
+from operator import attrgetter
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
 from models import Menu, MenuCategory, DifficultyLevel, SharingType
+from menu_catalog import SCORE_BUCKETS, MenuCatalog, summarize_menu_statistics
+from menu_query import MenuSelection, run_query, score_range_bits
+import data_bundle
+import menu_columns
+import menu_stream
+
+# 기본 메뉴 데이터 파일 경로 (backend 디렉토리 기준)
+DEFAULT_MENU_DATA_FILE = "data/menus.json"
+
+
+# 키워드 포스팅 항목 하나를 처리하는 비용 / 후보 메뉴 하나의 키워드를 비교하는 비용 (측정값 약 3-4)
+POSTING_WALK_COST = 4
+
+
+def _file_stamp(path: str) -> Tuple[int, int]:
+    """파일 변경 감지용 (mtime_ns, 크기)"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
 
 
 class MenuLoader:
-    """메뉴 데이터 로더 클래스"""
+    """
+    메뉴 데이터 로더 클래스
     
-    def __init__(self, data_file_path: str = "data/menus.json"):
+    조회 메서드는 현재 카탈로그 스냅샷 참조를 읽어 사용하므로 잠금이 없습니다.
+    reload()나 start_watcher()로 파일 변경을 반영하며, 새 카탈로그와 인덱스를
+    요청 경로 밖에서 모두 만든 뒤 스냅샷 참조만 원자적으로 교체합니다.
+    """
+    
+    def __init__(self, data_file_path: str = DEFAULT_MENU_DATA_FILE, use_bundle: bool = True,
+                 menus: Optional[Sequence[Menu]] = None, workers: Optional[int] = None):
         """
         메뉴 로더 초기화
         
         Args:
             data_file_path: 메뉴 데이터 JSON 파일 경로
+            use_bundle: 원본과 일치하는 데이터 번들이 있으면 JSON 대신 번들에서 로드
+            menus: 이미 검증된 메뉴 목록 (주어지면 파일을 읽지 않고 이 목록으로 인덱스 생성)
+            workers: 메뉴 파일 검증에 사용할 워커 프로세스 수 (None이면 FORTUNE_MENU_LOAD_WORKERS, 0이면 현재 프로세스)
         """
         self.data_file_path = data_file_path
-        self._menus: List[Menu] = []
-        self._load_menus()
+        self.use_bundle = use_bundle
+        self.workers = menu_stream.load_workers() if workers is None else workers
+        # 마지막으로 메뉴 파일을 읽은 결과 (번들/컬럼형 카탈로그에서 로드했으면 None)
+        self.last_load_report: Optional[menu_stream.MenuLoadReport] = None
+        
+        # 게시/리로드(쓰기 경로)끼리만 직렬화, 조회 경로는 잠금 없음
+        self._reload_lock = threading.RLock()
+        self._background_reload = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+        self._file_stamp: Optional[Tuple[int, int]] = None
+        self.last_reload_error: Optional[str] = None
+        
+        self._catalog = MenuCatalog.build((), version=0)
+        if menus is not None:
+            self.publish(menus)
+        else:
+            self._load_menus()
     
-    def _load_menus(self) -> None:
-        """JSON 파일에서 메뉴 데이터를 로드"""
+    @property
+    def catalog(self) -> MenuCatalog:
+        """현재 카탈로그 스냅샷 (요청 하나에서 여러 번 조회할 때는 한 번 받아 두고 사용)"""
+        return self._catalog
+    
+    @property
+    def generation(self) -> int:
+        """현재 카탈로그 세대 (게시할 때마다 증가, 카탈로그에 의존하는 캐시의 키로 사용)"""
+        return self._catalog.version
+    
+    @property
+    def menu_count(self) -> int:
+        """현재 스냅샷의 메뉴 수"""
+        return len(self._catalog)
+    
+    def pinned(self) -> 'MenuLoader':
+        """
+        현재 스냅샷에 고정된 로더 (조회 메서드 전용)
+        
+        요청 하나에서 조회 메서드를 여러 번 호출할 때 사용하면, 도중에 리로드되어도
+        모든 조회가 같은 스냅샷을 봅니다 (한 스냅샷의 위치/버킷이 다른 스냅샷과 섞이지 않음).
+        
+        Returns:
+            MenuLoader: 현재 스냅샷을 가리키는 얕은 복사본
+        """
+        return copy.copy(self)
+    
+    def publish(self, menus: Sequence[Menu], indexes: Optional[Dict[str, Any]] = None) -> MenuCatalog:
+        """
+        새 카탈로그 스냅샷을 만들어 현재 스냅샷과 교체
+        
+        스냅샷과 인덱스를 모두 만든 뒤 참조 하나만 바꾸므로, 다른 스레드는 이전
+        스냅샷이나 새 스냅샷 중 하나를 온전히 봅니다. 카탈로그를 바꾸는 유일한 방법입니다.
+        
+        Args:
+            menus: 검증된 메뉴 목록
+            indexes: 미리 만든 파생 인덱스 (None이면 생성)
+            
+        Returns:
+            MenuCatalog: 게시된 스냅샷 (버전은 이전 스냅샷 + 1)
+        """
+        with self._reload_lock:
+            return self.publish_catalog(MenuCatalog.build(menus, self._catalog.version + 1, indexes))
+    
+    def publish_catalog(self, catalog: MenuCatalog) -> MenuCatalog:
+        """
+        이미 만든 카탈로그 스냅샷(MenuCatalog 또는 ColumnarMenuCatalog)으로 교체
+        
+        Args:
+            catalog: 게시할 스냅샷 (버전은 현재 스냅샷보다 커야 함)
+            
+        Returns:
+            MenuCatalog: 게시된 스냅샷
+        """
+        with self._reload_lock:
+            if catalog.version <= self._catalog.version:
+                raise ValueError(f"스냅샷 버전은 현재 버전({self._catalog.version})보다 커야 합니다")
+            self._catalog = catalog
+            return catalog
+    
+    def _default_source_path(self) -> str:
+        """이 로더의 기본 위치 메뉴 파일 절대 경로 (번들/컬럼형 카탈로그의 원본 확인용)"""
+        return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), self.data_file_path))
+    
+    def _open_columns(self, version: int) -> Optional[menu_columns.ColumnarMenuCatalog]:
+        """
+        컬럼형 카탈로그(FORTUNE_MENU_COLUMNS)를 mmap으로 열기
+        
+        Args:
+            version: 스냅샷 버전
+            
+        Returns:
+            Optional[ColumnarMenuCatalog]: 열린 카탈로그 (설정되지 않았거나 원본이 바뀌었으면 None)
+        """
+        path = menu_columns.columns_path()
+        if not self.use_bundle or path is None or not os.path.exists(path):
+            return None
+        
         try:
-            # 여러 경로를 시도해서 파일을 찾습니다
-            possible_paths = [
-                # 현재 파일 기준 상대 경로
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), self.data_file_path),
-                # 프로젝트 루트 기준 경로
-                os.path.join(os.getcwd(), 'backend', self.data_file_path),
-                # Render 배포 환경 경로
-                os.path.join('/opt/render/project/src', 'backend', self.data_file_path),
-                # 작업 디렉토리 기준 경로
-                os.path.join(os.getcwd(), self.data_file_path),
-                # 상대 경로
-                self.data_file_path,
-                f'backend/{self.data_file_path}'
-            ]
+            catalog = menu_columns.ColumnarMenuCatalog(path, version)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"컬럼형 카탈로그를 열 수 없습니다: {e}")
+            return None
+        if not catalog.is_fresh(self._default_source_path()):
+            return None
+        
+        print(f"컬럼형 카탈로그에서 {len(catalog)}개의 메뉴를 열었습니다.")
+        return catalog
+    
+    def _catalog_from_bundle(self, version: int) -> Optional[MenuCatalog]:
+        """
+        데이터 번들에서 검증/인덱스가 끝난 메뉴로 스냅샷 생성
+        
+        Args:
+            version: 스냅샷 버전
+            
+        Returns:
+            Optional[MenuCatalog]: 번들의 스냅샷 (번들이 없거나 원본이 바뀌었으면 None)
+        """
+        if not self.use_bundle:
+            return None
+        
+        bundle = data_bundle.get_bundle()
+        if bundle is None:
+            return None
+        
+        # 번들이 이 로더의 기본 위치 파일로 만들어진 경우에만 사용
+        if bundle.source_path("menus") != self._default_source_path():
+            return None
+        
+        section = bundle.fresh_section("menus")
+        if section is None:
+            return None
+        
+        # 이전 형식의 인덱스면 MenuCatalog.build가 검증된 메뉴로 인덱스만 다시 생성
+        catalog = MenuCatalog.build(section["menus"], version, section["indexes"])
+        print(f"데이터 번들에서 {len(catalog)}개의 메뉴를 로드했습니다.")
+        return catalog
+    
+    def _find_data_file(self) -> str:
+        """
+        메뉴 데이터 파일 경로 찾기
+        
+        Raises:
+            FileNotFoundError: 후보 경로에 파일이 없는 경우
+        """
+        # 여러 경로를 시도해서 파일을 찾습니다
+        possible_paths = [
+            # 현재 파일 기준 상대 경로
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), self.data_file_path),
+            # 프로젝트 루트 기준 경로
+            os.path.join(os.getcwd(), 'backend', self.data_file_path),
+            # Render 배포 환경 경로
+            os.path.join('/opt/render/project/src', 'backend', self.data_file_path),
+            # 작업 디렉토리 기준 경로
+            os.path.join(os.getcwd(), self.data_file_path),
+            # 상대 경로
+            self.data_file_path,
+            f'backend/{self.data_file_path}'
+        ]
+        
+        for path in possible_paths:
+            if os.path.exists(path):
+                return path
+        
+        raise FileNotFoundError(f"메뉴 데이터 파일을 찾을 수 없습니다. 시도한 경로들: {possible_paths}")
+    
+    def _build_catalog(self, version: int, file_path: str
+                       ) -> Tuple[Union[MenuCatalog, menu_columns.ColumnarMenuCatalog],
+                                  Optional[menu_stream.MenuLoadReport]]:
+        """
+        컬럼형 카탈로그, 데이터 번들 또는 메뉴 파일로 새 스냅샷 생성 (게시하지 않음)
+        
+        메뉴 파일(JSON 또는 .jsonl/.ndjson)은 스트리밍으로 읽어 청크별로 검증하며,
+        검증에 실패한 레코드는 건너뛰고 로드 리포트에 기록합니다.
+        
+        Args:
+            version: 스냅샷 버전
+            file_path: 메뉴 데이터 파일 경로
             
-            file_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    file_path = path
-                    break
+        Returns:
+            Tuple: (새 스냅샷, 메뉴 파일 로드 리포트 (번들/컬럼형 카탈로그에서 만들었으면 None))
             
-            if file_path is None:
-                raise FileNotFoundError(f"메뉴 데이터 파일을 찾을 수 없습니다. 시도한 경로들: {possible_paths}")
+        Raises:
+            OSError: 메뉴 파일을 읽을 수 없는 경우
+            ValueError: 메뉴 파일의 JSON 형식이 올바르지 않은 경우 (json.JSONDecodeError)
+        """
+        catalog = self._open_columns(version)
+        if catalog is None:
+            catalog = self._catalog_from_bundle(version)
+        if catalog is not None:
+            return catalog, None
+        
+        menus, report = menu_stream.load_menu_file(file_path, self.workers)
+        catalog = MenuCatalog.build(menus, version)
+        print(f"총 {len(catalog)}개의 메뉴를 로드했습니다.")
+        if report.rejected:
+            print(f"검증에 실패한 메뉴 {report.rejected}개를 건너뛰었습니다 (last_load_report 참고).")
+        return catalog, report
+    
+    def _load_menus(self) -> None:
+        """최초 로드 (실패하면 빈 카탈로그를 게시하고, 변경 감지가 켜져 있으면 파일이 고쳐질 때 다시 로드)"""
+        with self._reload_lock:
+            try:
+                file_path = self._find_data_file()
+                stamp = _file_stamp(file_path)
+                catalog, report = self._build_catalog(self._catalog.version + 1, file_path)
+                self.publish_catalog(catalog)
+                self._file_stamp = stamp
+                self.last_load_report = report
+                
+            except FileNotFoundError:
+                print(f"메뉴 데이터 파일을 찾을 수 없습니다: {self.data_file_path}")
+                self.publish([])
+            except json.JSONDecodeError as e:
+                print(f"JSON 파일 파싱 오류: {e}")
+                self.publish([])
+            except Exception as e:
+                print(f"메뉴 로드 중 예상치 못한 오류: {e}")
+                self.publish([])
+    
+    def reload(self, force: bool = False) -> bool:
+        """
+        메뉴 파일이 바뀌었으면 새 카탈로그를 만들어 교체합니다.
+        
+        새 카탈로그와 인덱스를 모두 만든 뒤 참조 하나만 바꾸므로 조회는 막히지 않고,
+        새 파일이 잘못되었으면 기존 카탈로그를 유지하고 예외를 그대로 전달합니다.
+        
+        Args:
+            force: True면 파일 변경 여부와 관계없이 다시 로드
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        Returns:
+            bool: 카탈로그를 교체했으면 True (세대가 1 증가)
+        """
+        with self._reload_lock:
+            file_path = self._find_data_file()
+            stamp = _file_stamp(file_path)
+            if not force and stamp == self._file_stamp:
+                return False
             
-            self._menus = []
-            for menu_data in data.get("menus", []):
-                try:
-                    menu = Menu.from_dict(menu_data)
-                    self._menus.append(menu)
-                except Exception as e:
-                    print(f"메뉴 로드 오류 (ID: {menu_data.get('id', 'unknown')}): {e}")
+            catalog, report = self._build_catalog(self._catalog.version + 1, file_path)
+            self.publish_catalog(catalog)
+            self._file_stamp = stamp
+            self.last_load_report = report
+            self.last_reload_error = None
+            return True
+    
+    def reload_in_background(self, force: bool = True) -> bool:
+        """
+        별도 스레드에서 reload()를 실행합니다 (관리 API용, 호출한 요청을 막지 않음).
+        
+        실패하면 last_reload_error에 기록합니다.
+        
+        Args:
+            force: True면 파일 변경 여부와 관계없이 다시 로드
             
-            print(f"총 {len(self._menus)}개의 메뉴를 로드했습니다.")
+        Returns:
+            bool: 리로드를 시작했으면 True (이미 리로드 중이면 False)
+        """
+        if not self._background_reload.acquire(blocking=False):
+            return False
+        
+        def run() -> None:
+            try:
+                self.reload(force)
+            except Exception as e:
+                self.last_reload_error = str(e)
+            finally:
+                self._background_reload.release()
+        
+        threading.Thread(target=run, name="menu-catalog-reload", daemon=True).start()
+        return True
+    
+    def start_watcher(self, interval: float = 2.0) -> None:
+        """
+        백그라운드 스레드에서 메뉴 파일의 변경을 주기적으로 확인해 리로드합니다.
+        
+        Args:
+            interval: 확인 주기 (초)
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="menu-catalog-watcher", daemon=True
+        )
+        self._watcher.start()
+    
+    def stop_watcher(self) -> None:
+        """변경 감지 스레드를 중지합니다."""
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+    
+    def _watch(self, interval: float) -> None:
+        """변경 감지 루프 (실패한 리로드는 last_reload_error에 기록하고 다음 변경을 기다림)"""
+        failed_stamp = None
+        while not self._watcher_stop.wait(interval):
+            try:
+                stamp = _file_stamp(self._find_data_file())
+            except OSError as e:
+                self.last_reload_error = str(e)
+                continue
             
-        except FileNotFoundError:
-            print(f"메뉴 데이터 파일을 찾을 수 없습니다: {self.data_file_path}")
-            self._menus = []
-        except json.JSONDecodeError as e:
-            print(f"JSON 파일 파싱 오류: {e}")
-            self._menus = []
-        except Exception as e:
-            print(f"메뉴 로드 중 예상치 못한 오류: {e}")
-            self._menus = []
-    
-    def get_all_menus(self) -> List[Menu]:
-        """모든 메뉴 반환"""
-        return self._menus.copy()
+            # 실패했던 파일이 다시 바뀌기 전까지는 재시도하지 않음
+            if stamp == failed_stamp:
+                continue
+            try:
+                self.reload()
+            except Exception as e:
+                # 예상하지 못한 오류도 기록만 하고 감지를 계속 (스레드가 끝나면 핫 리로드가 멈춤)
+                failed_stamp = stamp
+                self.last_reload_error = str(e)
+    
+    def get_all_menus(self) -> Tuple[Menu, ...]:
+        """모든 메뉴 반환 (현재 스냅샷의 불변 튜플, 복사하지 않음)"""
+        return self._catalog.menus
     
     def get_menu_by_id(self, menu_id: str) -> Optional[Menu]:
-        """ID로 특정 메뉴 조회"""
-        for menu in self._menus:
-            if menu.id == menu_id:
-                return menu
-        return None
-    
-    def filter_by_category(self, category: MenuCategory) -> List[Menu]:
-        """카테고리별 메뉴 필터링"""
-        return [menu for menu in self._menus if menu.category == category]
-    
-    def filter_by_score_range(self, min_score: int, max_score: int) -> List[Menu]:
-        """점수 범위로 메뉴 필터링"""
-        return [
-            menu for menu in self._menus 
-            if menu.score_range[0] <= max_score and menu.score_range[1] >= min_score
-        ]
+        """ID로 특정 메뉴 조회 (ID 인덱스)"""
+        return self._catalog.by_id.get(menu_id)
     
-    def filter_by_serving_size(self, serving_size: int) -> List[Menu]:
-        """인원수로 메뉴 필터링"""
-        return [
-            menu for menu in self._menus 
-            if menu.min_serving <= serving_size <= menu.max_serving
-        ]
+    def get_menus_by_ids(self, menu_ids: Iterable[str]) -> List[Optional[Menu]]:
+        """
+        여러 ID의 메뉴를 한 번에 조회
+        
+        Args:
+            menu_ids: 메뉴 ID 목록
+            
+        Returns:
+            List[Optional[Menu]]: 입력 순서대로의 메뉴 (없는 ID는 None)
+        """
+        menus_by_id = self._catalog.by_id
+        return [menus_by_id.get(menu_id) for menu_id in menu_ids]
     
-    def filter_by_sharing_type(self, sharing_type: SharingType) -> List[Menu]:
-        """공유 타입으로 메뉴 필터링"""
-        return [
-            menu for menu in self._menus 
-            if menu.sharing_type == sharing_type or menu.sharing_type == SharingType.BOTH
-        ]
+    def filter_by_category(self, category: MenuCategory) -> Tuple[Menu, ...]:
+        """카테고리별 메뉴 필터링 (미리 계산된 카테고리 버킷)"""
+        return self._catalog.by_category.get(category, ())
+    
+    def filter_by_score_range(self, min_score: int, max_score: int) -> Tuple[Menu, ...]:
+        """
+        점수 범위와 겹치는 메뉴 필터링
+        
+        한 점짜리 범위는 점수 버킷을 그대로 반환하고, 더 넓은 범위는 범위 안 점수별
+        비트셋의 합집합으로 카탈로그 순서의 메뉴를 꺼냅니다 (전체 목록을 훑지 않음).
+        """
+        if min_score == max_score and min_score == int(min_score):
+            return self.get_suitable_menus_for_score(min_score)
+        catalog = self._catalog
+        bits = score_range_bits(catalog.bitsets["score"], min_score, max_score)
+        return MenuSelection(bits, catalog.menus).menus()
     
-    def filter_by_difficulty(self, difficulty: DifficultyLevel) -> List[Menu]:
-        """난이도로 메뉴 필터링"""
-        return [menu for menu in self._menus if menu.difficulty == difficulty]
+    def filter_by_serving_size(self, serving_size: int) -> Tuple[Menu, ...]:
+        """인원수로 메뉴 필터링 (미리 계산된 버킷)"""
+        return self._catalog.by_serving_size.get(serving_size, ())
     
-    def filter_by_keywords(self, keywords: List[str]) -> List[Menu]:
-        """키워드로 메뉴 필터링 (교집합이 있는 메뉴)"""
-        keyword_set = set(keywords)
-        return [
-            menu for menu in self._menus 
-            if keyword_set & set(menu.fortune_keywords)
-        ]
+    def filter_by_sharing_type(self, sharing_type: SharingType) -> Tuple[Menu, ...]:
+        """공유 타입으로 메뉴 필터링 (BOTH 메뉴 포함, 공유 타입 비트셋)"""
+        return self.query(sharing=sharing_type).menus()
+    
+    def filter_by_difficulty(self, difficulty: DifficultyLevel) -> Tuple[Menu, ...]:
+        """난이도로 메뉴 필터링 (난이도 비트셋)"""
+        return self.query(difficulty=difficulty).menus()
+    
+    def filter_by_keywords(self, keywords: List[str]) -> Tuple[Menu, ...]:
+        """키워드로 메뉴 필터링 (교집합이 있는 메뉴, 키워드 역색인의 포스팅 목록 합집합)"""
+        catalog = self._catalog
+        postings = catalog.keyword_postings
+        positions = set()
+        for keyword in set(keywords):
+            positions.update(postings.get(keyword, ()))
+        menus = catalog.menus
+        return tuple(menus[position] for position in sorted(positions))
     
-    def get_suitable_menus_for_score(self, score: int) -> List[Menu]:
-        """특정 점수에 적합한 메뉴들 반환"""
-        return [menu for menu in self._menus if menu.is_suitable_for_score(score)]
+    def match_keywords(self, keywords: Iterable[str],
+                       menus: Optional[Sequence[Menu]] = None) -> List[List[str]]:
+        """
+        후보 메뉴별로 주어진 키워드와 일치하는 키워드 계산
+        
+        드문 키워드라 포스팅 목록 순회 비용(길이 합 x POSTING_WALK_COST)이 후보 메뉴
+        수보다 작으면 역색인의 포스팅 목록만 순회하고, 그렇지 않으면 후보 메뉴의
+        키워드를 요청당 한 번 만든 키워드 집합과 비교합니다.
+        
+        Args:
+            keywords: 운세 키워드 (중복은 한 번만 셈)
+            menus: 현재 카탈로그에서 조회한 후보 메뉴 (None이면 전체 카탈로그)
+            
+        Returns:
+            List[List[str]]: 후보 메뉴 순서대로의 일치 키워드 (메뉴의 키워드 순서, 일치하지 않으면 빈 리스트)
+        """
+        wanted = dict.fromkeys(keywords)
+        catalog = self._catalog
+        postings = catalog.keyword_postings
+        candidates = catalog.menus if menus is None else menus
+        
+        posting_count = sum(len(postings.get(keyword, ())) for keyword in wanted)
+        if posting_count * POSTING_WALK_COST < len(candidates):
+            # 카탈로그 위치별로 모음 (ID로 모으면 ID가 중복된 메뉴끼리 키워드가 섞임)
+            matched: Dict[int, set] = {}
+            for keyword in wanted:
+                for position in postings.get(keyword, ()):
+                    if position in matched:
+                        matched[position].add(keyword)
+                    else:
+                        matched[position] = {keyword}
+            
+            if isinstance(catalog, MenuCatalog):
+                # 후보는 카탈로그의 메뉴 객체 그대로이므로 객체로 위치를 찾음
+                catalog_menus = catalog.menus
+                positions = {id(catalog_menus[position]): position for position in matched}
+                position_of = lambda menu: positions.get(id(menu))
+            else:
+                # 컬럼형 카탈로그의 메뉴(LazyMenu)는 조회할 때마다 새로 만들어지며 자기 위치를 가짐
+                position_of = attrgetter("_position")
+            
+            results = []
+            for menu in candidates:
+                found = matched.get(position_of(menu))
+                # 스캔 경로와 같은 순서 (메뉴 키워드 순서, 중복은 한 번)
+                results.append([keyword for keyword in dict.fromkeys(menu.fortune_keywords) if keyword in found]
+                               if found else [])
+            return results
+        
+        results = []
+        for menu in candidates:
+            matched = [keyword for keyword in menu.fortune_keywords if keyword in wanted]
+            if len(matched) > 1 and len(set(matched)) != len(matched):
+                # 메뉴 키워드에 중복이 있으면 한 번만 셈
+                matched = list(dict.fromkeys(matched))
+            results.append(matched)
+        return results
+    
+    def query(self, score: Optional[float] = None, group_size: Optional[int] = None,
+              sharing: Optional[SharingType] = None, category: Optional[MenuCategory] = None,
+              difficulty: Optional[DifficultyLevel] = None,
+              keywords: Optional[Iterable[str]] = None) -> MenuSelection:
+        """
+        여러 조건을 모두 만족하는 메뉴 조회 (None인 조건은 무시)
+        
+        조건별로 미리 계산된 비트셋을 카디널리티가 작은 순서로 교집합하므로 조건을
+        이어 붙여도 중간 리스트를 만들지 않습니다. 결과는 메뉴 복사본이 아닌 카탈로그
+        위치 집합이며, menus()로 카탈로그 순서의 메뉴를, explain()으로 실행 계획을 얻습니다.
+        
+        Args:
+            score: 운세 점수 (소수 점수는 메뉴 점수 범위 안에 있는지로 판단)
+            group_size: 인원수
+            sharing: 공유 타입 (SHARED/INDIVIDUAL은 BOTH 메뉴도 포함)
+            category: 메뉴 카테고리
+            difficulty: 난이도
+            keywords: 운세 키워드 (하나라도 가진 메뉴)
+            
+        Returns:
+            MenuSelection: 조건을 만족하는 메뉴 위치 집합
+        """
+        filters = {
+            "score": score,
+            "group_size": group_size,
+            "sharing": sharing,
+            "category": category,
+            "difficulty": difficulty,
+            "keywords": keywords
+        }
+        catalog = self._catalog
+        return run_query(catalog.bitsets, catalog.menus, filters)
+    
+    def explain(self, **filters: Any) -> Dict[str, Any]:
+        """query()와 같은 조건의 실행 계획과 단계별 카디널리티 (MenuSelection.explain)"""
+        return self.query(**filters).explain()
+    
+    def get_suitable_menus_for_score(self, score: float) -> Tuple[Menu, ...]:
+        """
+        특정 점수에 적합한 메뉴들 반환 (미리 계산된 점수 버킷)
+        
+        정수 점수는 버킷을 그대로 반환하고, 소수 점수(그룹 평균 등)는 내림한 점수의
+        버킷에서 범위 상한을 한 번 더 확인합니다.
+        """
+        if not 1 <= score < SCORE_BUCKETS:
+            return ()
+        bucket = self._catalog.by_score[int(score)]
+        if score == int(score):
+            return bucket
+        return tuple(menu for menu in bucket if menu.score_range[1] >= score)
     
     def get_suitable_menus_for_group(self, group_size: int, 
-                                   prefer_shared: bool = False) -> List[Menu]:
+                                   prefer_shared: bool = False) -> Tuple[Menu, ...]:
         """
-        그룹 크기에 적합한 메뉴들 반환
+        그룹 크기에 적합한 메뉴들 반환 (미리 계산된 인원수 버킷)
         
         Args:
             group_size: 그룹 크기
             prefer_shared: 공유 음식 우선 여부
         """
-        suitable_menus = [
-            menu for menu in self._menus 
-            if menu.is_suitable_for_group_size(group_size)
-        ]
-        
         if prefer_shared:
             # 공유 가능한 메뉴를 우선적으로 반환
-            shared_menus = [
-                menu for menu in suitable_menus 
-                if menu.sharing_type in [SharingType.SHARED, SharingType.BOTH]
-            ]
+            shared_menus = self._catalog.shared_by_serving_size.get(group_size, ())
             if shared_menus:
                 return shared_menus
         
-        return suitable_menus
+        return self._catalog.by_serving_size.get(group_size, ())
     
     def get_menu_statistics(self) -> Dict[str, Any]:
-        """메뉴 데이터 통계 정보 반환"""
-        if not self._menus:
-            return {"total": 0}
-        
-        categories = {}
-        difficulties = {}
-        sharing_types = {}
-        
-        for menu in self._menus:
-            # 카테고리별 통계
-            cat_name = menu.category.value
-            categories[cat_name] = categories.get(cat_name, 0) + 1
-            
-            # 난이도별 통계
-            diff_name = menu.difficulty.value
-            difficulties[diff_name] = difficulties.get(diff_name, 0) + 1
-            
-            # 공유 타입별 통계
-            share_name = menu.sharing_type.value
-            sharing_types[share_name] = sharing_types.get(share_name, 0) + 1
-        
-        return {
-            "total": len(self._menus),
-            "categories": categories,
-            "difficulties": difficulties,
-            "sharing_types": sharing_types,
-            "score_ranges": {
-                "min": min(menu.score_range[0] for menu in self._menus),
-                "max": max(menu.score_range[1] for menu in self._menus)
-            },
-            "serving_sizes": {
-                "min": min(menu.min_serving for menu in self._menus),
-                "max": max(menu.max_serving for menu in self._menus)
-            }
-        }
+        """메뉴 데이터 통계 정보 반환 (스냅샷을 만들 때 계산해 둔 통계의 요약)"""
+        return summarize_menu_statistics(self._catalog.statistics)
+    
+    def get_catalog_statistics(self) -> Dict[str, Any]:
+        """
+        현재 스냅샷의 전체 통계 (menu_catalog.build_menu_statistics, 키워드/점수 버킷별 메뉴 수 포함)
+        
+        스냅샷을 만들 때 한 번 계산한 공유 사전이므로 수정하지 않아야 합니다.
+        """
+        return self._catalog.statistics
     
     def reload_menus(self) -> None:
-        """메뉴 데이터 다시 로드"""
-        self._load_menus()
-
-
-# 전역 메뉴 로더 인스턴스
-menu_loader = MenuLoader()
+        """메뉴 데이터 다시 로드 (새 스냅샷을 모두 만든 뒤 게시, 실패하면 기존 스냅샷 유지 후 예외 전달)"""
+        self.reload(force=True)
 
 
 def get_menu_loader() -> MenuLoader:
-    """메뉴 로더 인스턴스 반환"""
-    return menu_loader
+    """공유 메뉴 로더 인스턴스 반환 (리소스 레지스트리가 처음 요청될 때 생성)"""
+    from resources import registry
+    return registry.get("menu_loader")
 
 
 # 편의 함수들
-def get_all_menus() -> List[Menu]:
+def get_all_menus() -> Sequence[Menu]:
     """모든 메뉴 반환 (편의 함수)"""
-    return menu_loader.get_all_menus()
+    return get_menu_loader().get_all_menus()
 
 
-def get_menus_by_category(category: str) -> List[Menu]:
+def get_menus_by_category(category: str) -> Sequence[Menu]:
     """카테고리별 메뉴 반환 (편의 함수)"""
     try:
         menu_category = MenuCategory(category)
-        return menu_loader.filter_by_category(menu_category)
+        return get_menu_loader().filter_by_category(menu_category)
     except ValueError:
         return []
 
 
-def get_menus_for_score(score: int) -> List[Menu]:
+def get_menus_for_score(score: int) -> Sequence[Menu]:
     """점수에 적합한 메뉴 반환 (편의 함수)"""
-    return menu_loader.get_suitable_menus_for_score(score)
+    return get_menu_loader().get_suitable_menus_for_score(score)
 
 
-def get_menus_for_group(group_size: int, prefer_shared: bool = False) -> List[Menu]:
+def get_menus_for_group(group_size: int, prefer_shared: bool = False) -> Sequence[Menu]:
     """그룹에 적합한 메뉴 반환 (편의 함수)"""
-    return menu_loader.get_suitable_menus_for_group(group_size, prefer_shared)
+    return get_menu_loader().get_suitable_menus_for_group(group_size, prefer_shared)
 
 
 if __name__ == "__main__":
@@ -232,7 +606,7 @@ if __name__ == "__main__":
     print("=== 메뉴 데이터 로더 테스트 ===")
     
     # 통계 정보 출력
-    stats = menu_loader.get_menu_statistics()
+    stats = get_menu_loader().get_menu_statistics()
     print(f"메뉴 통계: {stats}")
     
     # 카테고리별 메뉴 테스트
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+메뉴 복합 조건 조회
+속성 값별로 미리 계산한 비트셋(파이썬 정수, 비트 i = 카탈로그 i번째 메뉴)을
+선택도가 높은 순서로 교집합해 조건을 만족하는 메뉴 위치 집합을 반환
+"""
+
+import math
+import re
+from itertools import compress
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from models import Menu, MenuCategory, DifficultyLevel, SharingType
+
+# 점수 비트셋 수 (인덱스 0은 사용하지 않음, 1-100은 점수)
+SCORE_BITSETS = 101
+
+_BIN_TO_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+_SET_BIT = re.compile("1")
+
+
+def positions_to_bitset(positions: Iterable[int], size: int) -> int:
+    """
+    메뉴 위치 목록을 비트셋으로 변환
+
+    Args:
+        positions: 메뉴 위치 (0부터 size-1)
+        size: 카탈로그 크기
+
+    Returns:
+        int: 위치에 해당하는 비트가 켜진 정수
+    """
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bitset_positions(bits: int) -> List[int]:
+    """
+    비트셋에서 켜진 비트의 위치를 오름차순으로 반환
+
+    켜진 비트가 적으면 2진 문자열에서 '1'만 찾고, 많으면 모든 비트를 0/1 바이트로
+    바꿔 itertools.compress로 한 번에 고릅니다 (둘 다 C 루프).
+    """
+    if not bits:
+        return []
+    digits = bin(bits)[:1:-1]
+    if bits.bit_count() * 8 < len(digits):
+        return [match.start() for match in _SET_BIT.finditer(digits)]
+    flags = digits.encode("ascii").translate(_BIN_TO_FLAGS)
+    return list(compress(range(len(flags)), flags))
+
+
+def build_menu_bitsets(menus: Sequence[Menu]) -> Dict[str, Any]:
+    """
+    메뉴 목록에서 속성 값별 비트셋 생성 (menu_catalog.build_menu_indexes의 "bitsets")
+
+    Args:
+        menus: 메뉴 목록
+
+    Returns:
+        Dict[str, Any]: {
+            "score": 점수(1-100)별 적합한 메뉴 비트셋 (길이 101),
+            "group_size": {인원수: 비트셋},
+            "sharing": {SharingType: 해당 공유 타입 메뉴 비트셋},
+            "category": {MenuCategory: 비트셋},
+            "difficulty": {DifficultyLevel: 비트셋},
+            "keywords": {운세 키워드: 비트셋}
+        }
+    """
+    size = len(menus)
+    min_scores: Dict[int, List[int]] = {}
+    max_scores: Dict[int, List[int]] = {}
+    group_sizes: Dict[int, List[int]] = {}
+    sharing: Dict[SharingType, List[int]] = {}
+    categories: Dict[MenuCategory, List[int]] = {}
+    difficulties: Dict[DifficultyLevel, List[int]] = {}
+    keywords: Dict[str, List[int]] = {}
+
+    for position, menu in enumerate(menus):
+        min_scores.setdefault(menu.score_range[0], []).append(position)
+        max_scores.setdefault(menu.score_range[1], []).append(position)
+        for serving_size in range(menu.min_serving, menu.max_serving + 1):
+            group_sizes.setdefault(serving_size, []).append(position)
+        sharing.setdefault(menu.sharing_type, []).append(position)
+        categories.setdefault(menu.category, []).append(position)
+        difficulties.setdefault(menu.difficulty, []).append(position)
+        for keyword in dict.fromkeys(menu.fortune_keywords):
+            keywords.setdefault(keyword, []).append(position)
+
+    # 점수 s에 적합한 메뉴 = (최소 점수 <= s) AND NOT (최대 점수 < s)
+    score_bits = [0] * SCORE_BITSETS
+    started = 0
+    ended = 0
+    for score in range(1, SCORE_BITSETS):
+        if score in min_scores:
+            started |= positions_to_bitset(min_scores[score], size)
+        score_bits[score] = started & ~ended
+        if score in max_scores:
+            ended |= positions_to_bitset(max_scores[score], size)
+
+    def to_bitsets(groups: Dict[Any, List[int]]) -> Dict[Any, int]:
+        return {value: positions_to_bitset(positions, size) for value, positions in groups.items()}
+
+    return {
+        "score": tuple(score_bits),
+        "group_size": to_bitsets(group_sizes),
+        "sharing": to_bitsets(sharing),
+        "category": to_bitsets(categories),
+        "difficulty": to_bitsets(difficulties),
+        "keywords": to_bitsets(keywords)
+    }
+
+
+class MenuSelection:
+    """
+    query() 결과: 조건을 만족하는 메뉴 위치의 비트셋
+
+    메뉴를 복사하지 않고 카탈로그 위치만 가지며, 필요할 때 positions()/menus()로
+    카탈로그 순서대로 꺼냅니다.
+    """
+
+    __slots__ = ("bits", "plan", "_catalog")
+
+    def __init__(self, bits: int, catalog: Sequence[Menu],
+                 plan: Sequence[Tuple[int, str, Any, int]] = ()):
+        """
+        Args:
+            bits: 메뉴 위치 비트셋
+            catalog: 위치가 가리키는 메뉴 카탈로그
+            plan: 교집합 순서대로의 (카디널리티, 조건 이름, 값, 비트셋) (explain()에 사용)
+        """
+        self.bits = bits
+        self.plan = plan
+        self._catalog = catalog
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, position: int) -> bool:
+        return position >= 0 and (self.bits >> position) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.positions())
+
+    def positions(self) -> List[int]:
+        """조건을 만족하는 메뉴 위치 (오름차순)"""
+        return bitset_positions(self.bits)
+
+    def menus(self) -> Tuple[Menu, ...]:
+        """조건을 만족하는 메뉴 (카탈로그 순서)"""
+        catalog = self._catalog
+        return tuple(catalog[position] for position in bitset_positions(self.bits))
+
+    def explain(self) -> Dict[str, Any]:
+        """
+        실행 계획과 단계별 카디널리티
+
+        Returns:
+            Dict[str, Any]: {
+                "catalog_size": 카탈로그 메뉴 수,
+                "steps": [{"filter", "value", "cardinality"(조건 단독), "remaining"(교집합 후)}],
+                "result": 결과 메뉴 수
+            }
+            결과가 중간에 비면 이후 단계는 실행하지 않고 "skipped"로 표시합니다.
+        """
+        steps = []
+        result = None
+        for cardinality, name, value, bits in self.plan:
+            step = {"filter": name, "value": value, "cardinality": cardinality}
+            if result == 0:
+                step["skipped"] = True
+            else:
+                result = bits if result is None else result & bits
+                step["remaining"] = result.bit_count()
+            steps.append(step)
+        return {
+            "catalog_size": len(self._catalog),
+            "steps": steps,
+            "result": len(self)
+        }
+
+
+def _score_bits(score_bitsets: Sequence[int], score: float) -> int:
+    """
+    점수에 적합한 메뉴 비트셋 (소수 점수는 내림/올림 점수 모두에 적합한 메뉴)
+
+    메뉴 점수 범위는 정수 구간이므로 min <= score <= max는
+    min <= floor(score) 그리고 ceil(score) <= max와 같습니다.
+    """
+    low, high = math.floor(score), math.ceil(score)
+    if low < 1 or high >= SCORE_BITSETS:
+        return 0
+    if low == high:
+        return score_bitsets[low]
+    return score_bitsets[low] & score_bitsets[high]
+
+
+def score_range_bits(score_bitsets: Sequence[int], min_score: float, max_score: float) -> int:
+    """
+    점수 범위 [min_score, max_score]와 겹치는 메뉴 비트셋
+
+    메뉴 점수 범위는 1-100 안의 정수 구간이므로 min <= max_score 그리고 max >= min_score는
+    min <= floor(max_score) 그리고 max >= ceil(min_score)와 같습니다. 그 사이에 정수 점수가
+    있으면 점수별 비트셋의 합집합이고, 없으면(소수 범위, 뒤집힌 범위) 양 끝 점수에 모두
+    적합한 메뉴입니다.
+    """
+    low, high = math.ceil(min_score), math.floor(max_score)
+    if low > high:
+        if high < 1 or low >= SCORE_BITSETS:
+            return 0
+        return score_bitsets[high] & score_bitsets[low]
+    bits = 0
+    for score in range(max(1, low), min(SCORE_BITSETS - 1, high) + 1):
+        bits |= score_bitsets[score]
+    return bits
+
+
+def run_query(bitsets: Dict[str, Any], catalog: Sequence[Menu],
+              filters: Dict[str, Any]) -> MenuSelection:
+    """
+    조건별 비트셋을 카디널리티가 작은 순서로 교집합
+
+    Args:
+        bitsets: build_menu_bitsets() 결과
+        catalog: 비트셋을 만든 메뉴 목록
+        filters: {조건 이름: 값} (None인 조건은 무시)
+
+    Returns:
+        MenuSelection: 조건을 모두 만족하는 메뉴 (조건이 없으면 전체 카탈로그)
+
+    Raises:
+        ValueError: 알 수 없는 조건이나 잘못된 공유 타입/카테고리/난이도 값
+    """
+    steps = []
+    for name, value in filters.items():
+        if value is None:
+            continue
+        if name == "score":
+            bits = _score_bits(bitsets["score"], value)
+        elif name == "group_size":
+            bits = bitsets["group_size"].get(value, 0)
+        elif name == "sharing":
+            # 공유/개인 조건은 둘 다 가능한(BOTH) 메뉴도 포함
+            value = SharingType(value)
+            sharing_bits = bitsets["sharing"]
+            bits = sharing_bits.get(value, 0) | sharing_bits.get(SharingType.BOTH, 0)
+        elif name == "category":
+            value = MenuCategory(value)
+            bits = bitsets["category"].get(value, 0)
+        elif name == "difficulty":
+            value = DifficultyLevel(value)
+            bits = bitsets["difficulty"].get(value, 0)
+        elif name == "keywords":
+            # 키워드 중 하나라도 가진 메뉴
+            value = list(dict.fromkeys(value))
+            keyword_bits = bitsets["keywords"]
+            bits = 0
+            for keyword in value:
+                bits |= keyword_bits.get(keyword, 0)
+        else:
+            raise ValueError(f"알 수 없는 조회 조건입니다: {name}")
+
+        if isinstance(value, (SharingType, MenuCategory, DifficultyLevel)):
+            value = value.value
+        steps.append((bits.bit_count(), name, value, bits))
+
+    if not steps:
+        return MenuSelection((1 << len(catalog)) - 1, catalog)
+
+    # 선택도가 높은(카디널리티가 작은) 조건부터 교집합해 결과가 비면 바로 중단
+    steps.sort(key=itemgetter(0))
+    result = steps[0][3]
+    for step in steps[1:]:
+        if not result:
+            break
+        result &= step[3]
+
+    return MenuSelection(result, catalog, steps)
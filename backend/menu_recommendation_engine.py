@@ -5,9 +5,11 @@
 """
 
 import random
-from typing import List, Dict, Any, Tuple, Optional
+import sys
+from typing import List, Dict, Any, Hashable, Sequence, Tuple, Optional
 from dataclasses import dataclass
 from models import Menu, Fortune, GroupFortune, SharingType
+from fortune_cache import FortuneCache
 from menu_loader import MenuLoader, get_menu_loader
 
 
@@ -20,17 +22,41 @@ class MenuRecommendation:
     keyword_matches: List[str]  # 매칭된 키워드들
 
 
+def estimate_recommendations_size(recommendations: Sequence[MenuRecommendation]) -> int:
+    """
+    추천 결과가 캐시에 추가로 차지하는 대략적인 메모리 크기(바이트) 추정
+
+    메뉴는 카탈로그와 공유되므로 포함하지 않습니다.
+    """
+    size = sys.getsizeof(recommendations)
+    for recommendation in recommendations:
+        size += sys.getsizeof(recommendation) + sys.getsizeof(recommendation.__dict__)
+        size += sys.getsizeof(recommendation.reason) + sys.getsizeof(recommendation.keyword_matches)
+    return size
+
+
 class MenuRecommendationEngine:
-    """메뉴 추천 엔진 클래스"""
+    """
+    메뉴 추천 엔진 클래스
+    
+    추천 한 번의 모든 카탈로그 조회는 같은 스냅샷에서 이루어지고, 결과는 카탈로그
+    세대별 캐시에 저장되므로 메뉴가 리로드되면 이전 세대의 결과는 더 이상 반환되지 않습니다.
+    """
     
-    def __init__(self, menu_loader: Optional[MenuLoader] = None):
+    def __init__(self, menu_loader: Optional[MenuLoader] = None,
+                 cache_max_entries: int = 10000,
+                 cache_max_bytes: int = 16 * 1024 * 1024):
         """
         메뉴 추천 엔진 초기화
         
         Args:
             menu_loader: 메뉴 로더 인스턴스 (None이면 기본 로더 사용)
+            cache_max_entries: 추천 결과 캐시 최대 항목 수
+            cache_max_bytes: 추천 결과 캐시 최대 추정 바이트 수
         """
         self.menu_loader = menu_loader or get_menu_loader()
+        # 세대 키는 메뉴 카탈로그 세대 (리로드되면 이전 세대 결과를 한 번에 버림)
+        self.recommendation_cache = FortuneCache(cache_max_entries, cache_max_bytes)
     
     def recommend_for_individual(self, fortune: Fortune, 
                                num_recommendations: int = 3) -> List[MenuRecommendation]:
@@ -42,17 +68,30 @@ class MenuRecommendationEngine:
             num_recommendations: 추천할 메뉴 개수
             
         Returns:
-            추천 메뉴 리스트
+            추천 메뉴 리스트 (추천 항목은 캐시와 공유되므로 수정하지 마세요)
         """
+        # 요청 도중 메뉴가 리로드되어도 모든 조회가 같은 스냅샷을 보도록 고정
+        menu_loader = self.menu_loader.pinned()
+        
+        # 추천 결과는 총점, 카테고리별 점수/키워드, 추천 개수로만 결정됨
+        cache_key: Hashable = (
+            "individual", num_recommendations, fortune.total_score,
+            tuple((name, category_fortune.score, tuple(category_fortune.keywords))
+                  for name, category_fortune in fortune.categories.items())
+        )
+        cached = self.recommendation_cache.get(menu_loader.generation, cache_key)
+        if cached is not None:
+            return list(cached)
+        
         # 1. 운세 점수에 적합한 메뉴들 필터링
-        suitable_menus = self._filter_by_score(fortune.total_score)
+        suitable_menus = menu_loader.get_suitable_menus_for_score(fortune.total_score)
         
         if not suitable_menus:
             # 적합한 메뉴가 없으면 전체 메뉴에서 선택
-            suitable_menus = self.menu_loader.get_all_menus()
+            suitable_menus = menu_loader.get_all_menus()
         
         # 2. 키워드 매칭 및 점수 계산
-        scored_menus = self._calculate_individual_scores(suitable_menus, fortune)
+        scored_menus = self._calculate_individual_scores(menu_loader, suitable_menus, fortune)
         
         # 3. 점수 순으로 정렬하고 상위 메뉴들 선택
         scored_menus.sort(key=lambda x: x.recommendation_score, reverse=True)
@@ -60,7 +99,7 @@ class MenuRecommendationEngine:
         # 4. 다양성을 위해 카테고리 중복 제거 (가능한 경우)
         diverse_menus = self._ensure_diversity(scored_menus, num_recommendations)
         
-        return diverse_menus[:num_recommendations]
+        return self._store(menu_loader.generation, cache_key, diverse_menus[:num_recommendations])
     
     def recommend_for_group(self, group_fortune: GroupFortune, 
                           num_recommendations: int = 3) -> List[MenuRecommendation]:
@@ -72,24 +111,39 @@ class MenuRecommendationEngine:
             num_recommendations: 추천할 메뉴 개수
             
         Returns:
-            추천 메뉴 리스트
+            추천 메뉴 리스트 (추천 항목은 캐시와 공유되므로 수정하지 마세요)
         """
+        # 요청 도중 메뉴가 리로드되어도 모든 조회가 같은 스냅샷을 보도록 고정
+        menu_loader = self.menu_loader.pinned()
+        group_keywords = self._group_keywords(group_fortune)
+        
+        # 추천 결과는 인원수, 화합/평균 점수, 주요 카테고리, 그룹 키워드, 추천 개수로만 결정됨
+        cache_key: Hashable = (
+            "group", num_recommendations, group_fortune.participant_count,
+            group_fortune.harmony_score, group_fortune.average_score,
+            tuple(group_fortune.dominant_categories), tuple(dict.fromkeys(group_keywords))
+        )
+        cached = self.recommendation_cache.get(menu_loader.generation, cache_key)
+        if cached is not None:
+            return list(cached)
+        
         # 1. 인원수에 적합한 메뉴들 필터링
-        suitable_menus = self._filter_by_group_size(group_fortune.participant_count)
+        filters: Dict[str, Any] = {"group_size": group_fortune.participant_count}
         
-        # 2. 화합 점수에 따른 공유 음식 우선 처리
+        # 2. 화합 점수에 따른 공유 음식 우선 처리 (공유 메뉴가 있을 때만)
         if group_fortune.harmony_score >= 70:
-            shared_menus = self._filter_by_sharing_preference(suitable_menus, prefer_shared=True)
-            if shared_menus:
-                suitable_menus = shared_menus
+            if menu_loader.query(sharing=SharingType.SHARED, **filters):
+                filters["sharing"] = SharingType.SHARED
+        
+        # 3. 그룹 평균 점수에 적합한 메뉴들로 추가 필터링 (적합한 메뉴가 있을 때만)
+        if menu_loader.query(score=group_fortune.average_score, **filters):
+            filters["score"] = group_fortune.average_score
         
-        # 3. 그룹 평균 점수에 적합한 메뉴들로 추가 필터링
-        score_filtered = self._filter_by_score_from_list(suitable_menus, group_fortune.average_score)
-        if score_filtered:
-            suitable_menus = score_filtered
+        # 조건 비트셋의 교집합만 계산하고 메뉴는 마지막에 한 번 꺼냄
+        suitable_menus = menu_loader.query(**filters).menus()
         
         # 4. 그룹 키워드 매칭 및 점수 계산
-        scored_menus = self._calculate_group_scores(suitable_menus, group_fortune)
+        scored_menus = self._calculate_group_scores(menu_loader, suitable_menus, group_fortune, group_keywords)
         
         # 5. 점수 순으로 정렬하고 상위 메뉴들 선택
         scored_menus.sort(key=lambda x: x.recommendation_score, reverse=True)
@@ -97,35 +151,16 @@ class MenuRecommendationEngine:
         # 6. 다양성 확보
         diverse_menus = self._ensure_diversity(scored_menus, num_recommendations)
         
-        return diverse_menus[:num_recommendations]
+        return self._store(menu_loader.generation, cache_key, diverse_menus[:num_recommendations])
     
-    def _filter_by_score(self, score: int) -> List[Menu]:
-        """운세 점수에 적합한 메뉴들 필터링"""
-        return self.menu_loader.get_suitable_menus_for_score(score)
-    
-    def _filter_by_score_from_list(self, menus: List[Menu], score: int) -> List[Menu]:
-        """주어진 메뉴 리스트에서 점수에 적합한 메뉴들 필터링"""
-        return [menu for menu in menus if menu.is_suitable_for_score(score)]
-    
-    def _filter_by_group_size(self, group_size: int) -> List[Menu]:
-        """그룹 크기에 적합한 메뉴들 필터링"""
-        return self.menu_loader.get_suitable_menus_for_group(group_size)
-    
-    def _filter_by_sharing_preference(self, menus: List[Menu], 
-                                    prefer_shared: bool = True) -> List[Menu]:
-        """공유 선호도에 따른 메뉴 필터링"""
-        if prefer_shared:
-            return [
-                menu for menu in menus 
-                if menu.sharing_type in [SharingType.SHARED, SharingType.BOTH]
-            ]
-        else:
-            return [
-                menu for menu in menus 
-                if menu.sharing_type in [SharingType.INDIVIDUAL, SharingType.BOTH]
-            ]
+    def _store(self, generation: int, cache_key: Hashable,
+               recommendations: List[MenuRecommendation]) -> List[MenuRecommendation]:
+        """추천 결과를 카탈로그 세대별 캐시에 저장하고 그대로 반환"""
+        cached = tuple(recommendations)
+        self.recommendation_cache.put(generation, cache_key, cached, estimate_recommendations_size(cached))
+        return recommendations
     
-    def _calculate_individual_scores(self, menus: List[Menu], 
+    def _calculate_individual_scores(self, menu_loader: MenuLoader, menus: Sequence[Menu], 
                                    fortune: Fortune) -> List[MenuRecommendation]:
         """개인 모드 메뉴 점수 계산"""
         recommendations = []
@@ -135,12 +170,20 @@ class MenuRecommendationEngine:
         for category_fortune in fortune.categories.values():
             fortune_keywords.extend(category_fortune.keywords)
         
-        for menu in menus:
+        # 메뉴별 일치 키워드를 한 번에 계산 (키워드가 드물면 역색인만 순회)
+        keyword_matches = menu_loader.match_keywords(fortune_keywords, menus)
+        high_category_matches = [
+            menu_loader.match_keywords(category_fortune.keywords, menus)
+            for category_fortune in fortune.categories.values()
+            if category_fortune.score >= 80
+        ]
+        
+        for index, menu in enumerate(menus):
             # 기본 점수에서 시작
             score = menu.base_score
             
             # 키워드 매칭 보너스
-            matched_keywords = list(set(menu.fortune_keywords) & set(fortune_keywords))
+            matched_keywords = keyword_matches[index]
             keyword_bonus = len(matched_keywords) * 10
             score += keyword_bonus
             
@@ -149,7 +192,7 @@ class MenuRecommendationEngine:
             score += score_fit
             
             # 카테고리별 운세 점수 고려
-            category_bonus = self._calculate_category_bonus(menu, fortune)
+            category_bonus = self._calculate_category_bonus(index, high_category_matches)
             score += category_bonus
             
             # 추천 이유 생성
@@ -164,27 +207,30 @@ class MenuRecommendationEngine:
         
         return recommendations
     
-    def _calculate_group_scores(self, menus: List[Menu], 
-                              group_fortune: GroupFortune) -> List[MenuRecommendation]:
-        """그룹 모드 메뉴 점수 계산"""
-        recommendations = []
-        
-        # 그룹의 주요 카테고리에서 키워드 추출
+    def _group_keywords(self, group_fortune: GroupFortune) -> List[str]:
+        """그룹의 주요 카테고리에서 키워드 추출"""
         group_keywords = []
         for individual_fortune in group_fortune.individual_fortunes:
             for category_name, category_fortune in individual_fortune.categories.items():
                 if category_name in group_fortune.dominant_categories:
                     group_keywords.extend(category_fortune.keywords)
+        return group_keywords
+    
+    def _calculate_group_scores(self, menu_loader: MenuLoader, menus: Sequence[Menu], 
+                              group_fortune: GroupFortune,
+                              group_keywords: List[str]) -> List[MenuRecommendation]:
+        """그룹 모드 메뉴 점수 계산"""
+        recommendations = []
         
-        # 중복 제거
-        group_keywords = list(set(group_keywords))
+        # 메뉴별 일치 키워드를 한 번에 계산 (중복 키워드는 한 번만 셈, 키워드가 드물면 역색인만 순회)
+        keyword_matches = menu_loader.match_keywords(group_keywords, menus)
         
-        for menu in menus:
+        for index, menu in enumerate(menus):
             # 기본 점수에서 시작
             score = menu.base_score
             
             # 키워드 매칭 보너스
-            matched_keywords = list(set(menu.fortune_keywords) & set(group_keywords))
+            matched_keywords = keyword_matches[index]
             keyword_bonus = len(matched_keywords) * 8  # 그룹에서는 개인보다 약간 낮게
             score += keyword_bonus
             
@@ -234,18 +280,17 @@ class MenuRecommendationEngine:
             penalty = min(distance * 0.5, 10)  # 최대 10점 감점
             return int(-penalty)
     
-    def _calculate_category_bonus(self, menu: Menu, fortune: Fortune) -> int:
-        """카테고리별 운세 점수에 따른 보너스 계산"""
-        bonus = 0
-        
-        # 각 카테고리의 점수가 높으면 관련 키워드가 있는 메뉴에 보너스
-        for category_name, category_fortune in fortune.categories.items():
-            if category_fortune.score >= 80:  # 높은 점수
-                category_keywords = category_fortune.keywords
-                matches = set(menu.fortune_keywords) & set(category_keywords)
-                bonus += len(matches) * 5  # 매칭당 5점 보너스
-        
-        return bonus
+    def _calculate_category_bonus(self, menu_index: int,
+                                  high_category_matches: List[List[List[str]]]) -> int:
+        """
+        카테고리별 운세 점수에 따른 보너스 계산
+        
+        Args:
+            menu_index: 후보 메뉴 목록에서의 위치
+            high_category_matches: 80점 이상 카테고리별 match_keywords 결과
+        """
+        # 각 카테고리의 점수가 높으면 관련 키워드가 있는 메뉴에 보너스 (매칭당 5점)
+        return sum(len(matches[menu_index]) for matches in high_category_matches) * 5
     
     def _calculate_group_size_bonus(self, menu: Menu, group_size: int) -> int:
         """그룹 크기에 따른 적합도 보너스"""
@@ -415,24 +460,21 @@ class MenuRecommendationEngine:
         }
 
 
-# 전역 추천 엔진 인스턴스
-recommendation_engine = MenuRecommendationEngine()
-
-
 def get_recommendation_engine() -> MenuRecommendationEngine:
-    """추천 엔진 인스턴스 반환"""
-    return recommendation_engine
+    """공유 추천 엔진 인스턴스 반환 (리소스 레지스트리가 처음 요청될 때 생성)"""
+    from resources import registry
+    return registry.get("recommendation_engine")
 
 
 # 편의 함수들
 def recommend_individual_menus(fortune: Fortune, count: int = 3) -> List[MenuRecommendation]:
     """개인 모드 메뉴 추천 (편의 함수)"""
-    return recommendation_engine.recommend_for_individual(fortune, count)
+    return get_recommendation_engine().recommend_for_individual(fortune, count)
 
 
 def recommend_group_menus(group_fortune: GroupFortune, count: int = 3) -> List[MenuRecommendation]:
     """그룹 모드 메뉴 추천 (편의 함수)"""
-    return recommendation_engine.recommend_for_group(group_fortune, count)
+    return get_recommendation_engine().recommend_for_group(group_fortune, count)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,813 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 메뉴 카탈로그
+메뉴를 SQLite 데이터베이스(WAL 모드)에 두고 조회 조건을 인덱스가 있는 SQL로 실행하는
+MenuLoader 대체 구현 (메뉴를 프로세스 메모리에 모두 올리지 않고, 서버 재시작이나
+파일 교체 없이 메뉴를 한 건씩 편집해야 할 때 사용)
+
+사용법 (데이터베이스 생성): python menu_sqlite.py --output data/menus.db
+"""
+
+import argparse
+import copy
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models import Menu, MenuCategory, DifficultyLevel, SharingType
+from menu_catalog import summarize_menu_statistics
+import data_bundle
+
+# 스키마 버전 (스키마가 바뀌면 숫자를 올려 이전 데이터베이스를 무효화)
+SCHEMA_VERSION = 1
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_DATABASE_PATH = os.path.join(_DATA_DIR, 'menus.db')
+
+# 읽기 캐시에 보관하는 메뉴 객체 수
+DEFAULT_CACHE_SIZE = 4096
+
+_COLUMNS = (
+    "position", "id", "name", "category", "min_score", "max_score", "fortune_keywords",
+    "ingredients", "cooking_time", "difficulty", "description", "min_serving", "max_serving",
+    "sharing_type", "base_score", "recommendation_score"
+)
+_SELECT_COLUMNS = ", ".join(_COLUMNS)
+
+_CATEGORIES = {category.value: category for category in MenuCategory}
+_DIFFICULTIES = {difficulty.value: difficulty for difficulty in DifficultyLevel}
+_SHARING_TYPES = {sharing_type.value: sharing_type for sharing_type in SharingType}
+_scan_json = json.JSONDecoder().scan_once
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS menus (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    min_score INTEGER NOT NULL,
+    max_score INTEGER NOT NULL,
+    fortune_keywords TEXT NOT NULL,
+    ingredients TEXT NOT NULL,
+    cooking_time TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    description TEXT NOT NULL,
+    min_serving INTEGER NOT NULL,
+    max_serving INTEGER NOT NULL,
+    sharing_type TEXT NOT NULL,
+    base_score INTEGER NOT NULL,
+    recommendation_score INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS menu_keywords (
+    keyword TEXT NOT NULL,
+    position INTEGER NOT NULL REFERENCES menus(position) ON DELETE CASCADE,
+    PRIMARY KEY (keyword, position)
+) WITHOUT ROWID;
+"""
+
+# 대량 적재가 끝난 뒤 만드는 인덱스
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS menus_id ON menus (id);
+CREATE INDEX IF NOT EXISTS menus_score ON menus (min_score, max_score);
+CREATE INDEX IF NOT EXISTS menus_serving ON menus (min_serving, max_serving);
+CREATE INDEX IF NOT EXISTS menus_sharing_type ON menus (sharing_type);
+CREATE INDEX IF NOT EXISTS menus_category ON menus (category);
+CREATE INDEX IF NOT EXISTS menus_difficulty ON menus (difficulty);
+CREATE INDEX IF NOT EXISTS menu_keywords_position ON menu_keywords (position);
+"""
+
+# 메뉴가 바뀌면 세대를 올리는 트리거 (읽기 캐시 무효화와 추천 캐시의 키로 사용)
+_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS menus_insert_generation AFTER INSERT ON menus
+BEGIN UPDATE catalog_meta SET value = value + 1 WHERE key = 'generation'; END;
+CREATE TRIGGER IF NOT EXISTS menus_update_generation AFTER UPDATE ON menus
+BEGIN UPDATE catalog_meta SET value = value + 1 WHERE key = 'generation'; END;
+CREATE TRIGGER IF NOT EXISTS menus_delete_generation AFTER DELETE ON menus
+BEGIN UPDATE catalog_meta SET value = value + 1 WHERE key = 'generation'; END;
+CREATE TRIGGER IF NOT EXISTS menu_keywords_insert_generation AFTER INSERT ON menu_keywords
+BEGIN UPDATE catalog_meta SET value = value + 1 WHERE key = 'generation'; END;
+CREATE TRIGGER IF NOT EXISTS menu_keywords_delete_generation AFTER DELETE ON menu_keywords
+BEGIN UPDATE catalog_meta SET value = value + 1 WHERE key = 'generation'; END;
+"""
+
+
+def database_path() -> Optional[str]:
+    """
+    사용할 SQLite 메뉴 데이터베이스 경로 (FORTUNE_MENU_DATABASE 환경 변수, 없거나 빈 문자열이면 비활성화)
+
+    Returns:
+        Optional[str]: 데이터베이스 파일 경로 또는 None
+    """
+    return os.environ.get('FORTUNE_MENU_DATABASE') or None
+
+
+def _menu_row(position: int, menu: Menu) -> Tuple[Any, ...]:
+    """메뉴를 menus 테이블 행으로 변환 (_COLUMNS 순서)"""
+    return (
+        position, menu.id, menu.name, menu.category.value,
+        menu.score_range[0], menu.score_range[1],
+        json.dumps(menu.fortune_keywords, ensure_ascii=False),
+        json.dumps(menu.ingredients, ensure_ascii=False),
+        menu.cooking_time, menu.difficulty.value, menu.description,
+        menu.min_serving, menu.max_serving, menu.sharing_type.value,
+        menu.base_score, menu.recommendation_score
+    )
+
+
+def _row_menu(row: Sequence[Any]) -> Menu:
+    """
+    menus 테이블 행(_COLUMNS 순서)을 메뉴로 변환
+
+    조회 결과 전체를 메뉴로 만드는 경로라 열거형은 값 사전으로, 리스트 컬럼은
+    json.loads의 공백 처리 없이 스캐너로 바로 읽습니다 (저장할 때 json.dumps로 쓴 값).
+    """
+    return Menu(
+        id=row[1],
+        name=row[2],
+        category=_CATEGORIES[row[3]],
+        score_range=(row[4], row[5]),
+        fortune_keywords=_scan_json(row[6], 0)[0],
+        ingredients=_scan_json(row[7], 0)[0],
+        cooking_time=row[8],
+        difficulty=_DIFFICULTIES[row[9]],
+        description=row[10],
+        min_serving=row[11],
+        max_serving=row[12],
+        sharing_type=_SHARING_TYPES[row[13]],
+        base_score=row[14],
+        recommendation_score=row[15]
+    )
+
+
+def _keyword_rows(position: int, menu: Menu) -> List[Tuple[str, int]]:
+    """메뉴의 menu_keywords 행 (중복 키워드는 한 번만)"""
+    return [(keyword, position) for keyword in dict.fromkeys(menu.fortune_keywords)]
+
+
+def _open_writer(path: str) -> sqlite3.Connection:
+    """편집용 연결 (자동 커밋 없이 with 블록 단위 트랜잭션)"""
+    connection = sqlite3.connect(path, timeout=30)
+    connection.execute("PRAGMA foreign_keys = ON")
+    return connection
+
+
+def write_database(menus: Sequence[Menu], output_path: str, force: bool = False) -> Dict[str, Any]:
+    """
+    메뉴 목록으로 SQLite 메뉴 데이터베이스 생성
+
+    실행 중인 서버가 열어 둔 데이터베이스를 파일째 바꾸면 WAL 파일이 어긋나므로,
+    이미 있는 데이터베이스는 force일 때만 지우고 다시 만듭니다 (운영 중에는 save_menu/delete_menu로 편집).
+
+    Args:
+        menus: 검증된 메뉴 목록 (목록 순서가 카탈로그 순서)
+        output_path: 생성할 파일 경로
+        force: 이미 있는 데이터베이스를 지우고 다시 만들지 여부
+
+    Returns:
+        Dict[str, Any]: {"path", "bytes", "menus"}
+
+    Raises:
+        FileExistsError: 데이터베이스가 이미 있고 force가 아닌 경우
+    """
+    if os.path.exists(output_path):
+        if not force:
+            raise FileExistsError(f"메뉴 데이터베이스가 이미 있습니다: {output_path}")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(output_path + suffix):
+                os.remove(output_path + suffix)
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+
+    connection = _open_writer(output_path)
+    try:
+        connection.execute("PRAGMA journal_mode = WAL")
+        with connection:
+            connection.executescript(_SCHEMA)
+            connection.executemany(
+                f"INSERT INTO menus ({_SELECT_COLUMNS}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                (_menu_row(position, menu) for position, menu in enumerate(menus))
+            )
+            connection.executemany(
+                "INSERT INTO menu_keywords (keyword, position) VALUES (?, ?)",
+                (row for position, menu in enumerate(menus) for row in _keyword_rows(position, menu))
+            )
+            connection.executemany(
+                "INSERT INTO catalog_meta (key, value) VALUES (?, ?)",
+                (("schema_version", SCHEMA_VERSION), ("generation", 1))
+            )
+        connection.executescript(_INDEXES + _TRIGGERS)
+        connection.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+
+    return {"path": output_path, "bytes": os.path.getsize(output_path), "menus": len(menus)}
+
+
+def save_menu(path: str, menu: Menu) -> int:
+    """
+    메뉴 하나를 추가하거나 같은 ID의 메뉴를 교체 (한 트랜잭션)
+
+    Args:
+        path: 데이터베이스 경로
+        menu: 검증된 메뉴
+
+    Returns:
+        int: 메뉴의 카탈로그 위치 (새 메뉴는 마지막 위치 다음)
+    """
+    connection = _open_writer(path)
+    try:
+        with connection:
+            row = connection.execute(
+                "SELECT position FROM menus WHERE id = ? ORDER BY position LIMIT 1", (menu.id,)
+            ).fetchone()
+            if row is None:
+                position = connection.execute(
+                    "SELECT COALESCE(MAX(position) + 1, 0) FROM menus"
+                ).fetchone()[0]
+                connection.execute(
+                    f"INSERT INTO menus ({_SELECT_COLUMNS}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    _menu_row(position, menu)
+                )
+            else:
+                position = row[0]
+                connection.execute(
+                    f"UPDATE menus SET {', '.join(f'{column} = ?' for column in _COLUMNS[1:])} "
+                    "WHERE position = ?",
+                    _menu_row(position, menu)[1:] + (position,)
+                )
+                connection.execute("DELETE FROM menu_keywords WHERE position = ?", (position,))
+            connection.executemany(
+                "INSERT INTO menu_keywords (keyword, position) VALUES (?, ?)",
+                _keyword_rows(position, menu)
+            )
+        return position
+    finally:
+        connection.close()
+
+
+def delete_menu(path: str, menu_id: str) -> bool:
+    """
+    ID가 같은 메뉴를 모두 삭제 (한 트랜잭션)
+
+    Args:
+        path: 데이터베이스 경로
+        menu_id: 메뉴 ID
+
+    Returns:
+        bool: 삭제한 메뉴가 있으면 True
+    """
+    connection = _open_writer(path)
+    try:
+        with connection:
+            deleted = connection.execute("DELETE FROM menus WHERE id = ?", (menu_id,)).rowcount
+        return deleted > 0
+    finally:
+        connection.close()
+
+
+class _MenuCache:
+    """카탈로그 위치 -> 메뉴 객체 LRU 캐시 (세대가 바뀌면 비움)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.generation: Optional[int] = None
+        self.menus: 'OrderedDict[int, Menu]' = OrderedDict()
+        self.positions_by_id: 'OrderedDict[str, int]' = OrderedDict()
+        self.lock = threading.Lock()
+
+    def sync(self, generation: int) -> None:
+        """세대가 바뀌었으면 캐시를 비움 (잠금을 잡은 상태에서 호출)"""
+        if generation != self.generation:
+            self.menus.clear()
+            self.positions_by_id.clear()
+            self.generation = generation
+
+    def remember_id(self, menu_id: str, position: int) -> None:
+        """ID -> 위치 기록 (잠금을 잡은 상태에서 호출)"""
+        self.positions_by_id[menu_id] = position
+        if len(self.positions_by_id) > self.max_entries:
+            self.positions_by_id.popitem(last=False)
+
+
+class SqliteMenuSelection:
+    """
+    SqliteMenuLoader.query() 결과: 조건을 만족하는 메뉴를 찾는 SQL 조건
+
+    만들 때는 SQL을 실행하지 않고, bool()은 EXISTS, len()은 COUNT, menus()는 행 조회로
+    필요한 만큼만 실행합니다. 위치는 menus 테이블의 position이며 삭제된 메뉴 자리는 비어 있습니다.
+    """
+
+    __slots__ = ("_loader", "_where", "_params", "_generation")
+
+    def __init__(self, loader: 'SqliteMenuLoader', where: str, params: Sequence[Any], generation: int):
+        """
+        Args:
+            loader: 조회한 로더
+            where: WHERE 절
+            params: WHERE 절 파라미터
+            generation: 조회 시점의 세대 (읽기 캐시 확인용)
+        """
+        self._loader = loader
+        self._where = where
+        self._params = tuple(params)
+        self._generation = generation
+
+    def _scalar(self, sql: str, params: Sequence[Any] = ()) -> Any:
+        return self._loader._connection().execute(sql, self._params + tuple(params)).fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._scalar(f"SELECT COUNT(*) FROM menus WHERE {self._where}")
+
+    def __bool__(self) -> bool:
+        return self._scalar(f"SELECT EXISTS(SELECT 1 FROM menus WHERE {self._where})") == 1
+
+    def __contains__(self, position: int) -> bool:
+        return self._scalar(
+            f"SELECT EXISTS(SELECT 1 FROM menus WHERE {self._where} AND position = ?)", (position,)
+        ) == 1
+
+    def __iter__(self):
+        return iter(self.positions())
+
+    def positions(self) -> List[int]:
+        """조건을 만족하는 메뉴 위치 (오름차순)"""
+        rows = self._loader._connection().execute(
+            f"SELECT position FROM menus WHERE {self._where} ORDER BY position", self._params
+        )
+        return [row[0] for row in rows]
+
+    def menus(self) -> Tuple[Menu, ...]:
+        """조건을 만족하는 메뉴 (카탈로그 순서)"""
+        return self._loader._select(self._where, self._params, self._generation)
+
+    def explain(self) -> Dict[str, Any]:
+        """
+        SQLite 실행 계획
+
+        Returns:
+            Dict[str, Any]: {
+                "sql": 실행하는 SQL,
+                "params": SQL 파라미터,
+                "plan": EXPLAIN QUERY PLAN의 단계 설명 목록,
+                "result": 결과 메뉴 수
+            }
+        """
+        sql = f"SELECT position FROM menus WHERE {self._where} ORDER BY position"
+        plan = self._loader._connection().execute(f"EXPLAIN QUERY PLAN {sql}", self._params)
+        return {
+            "sql": sql,
+            "params": list(self._params),
+            "plan": [row[3] for row in plan],
+            "result": len(self)
+        }
+
+
+class SqliteMenuLoader:
+    """
+    SQLite 메뉴 로더 (MenuLoader와 같은 조회 인터페이스)
+
+    조회 조건은 인덱스가 있는 SQL로 실행하고, 조회된 행만 메뉴 객체로 만들어
+    작은 LRU 캐시에 보관합니다. 연결은 스레드(그리고 포크된 프로세스)마다 따로 열며,
+    WAL 모드라 다른 프로세스의 편집이 읽기를 막지 않습니다. 편집이 커밋되면
+    트리거가 세대를 올리고, 다음 조회에서 바뀐 세대를 보고 캐시를 비웁니다.
+    """
+
+    def __init__(self, database_path: str = DEFAULT_DATABASE_PATH, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        SQLite 메뉴 로더 초기화
+
+        Args:
+            database_path: 메뉴 데이터베이스 경로 (write_database로 생성)
+            cache_size: 읽기 캐시에 보관할 메뉴 객체 수 (0이면 캐시 사용 안 함)
+
+        Raises:
+            FileNotFoundError: 데이터베이스가 없는 경우
+            ValueError: 스키마 버전이 다른 경우
+        """
+        if not os.path.exists(database_path):
+            raise FileNotFoundError(f"메뉴 데이터베이스를 찾을 수 없습니다: {database_path}")
+        self.database_path = database_path
+        # MenuLoader와 같은 상태 속성 (파일을 읽어 게시하지 않으므로 항상 None)
+        self.last_load_report = None
+        self.last_reload_error: Optional[str] = None
+        self._local = threading.local()
+        self._cache = _MenuCache(cache_size)
+        self._pinned_generation: Optional[int] = None
+        self._count: Tuple[Optional[int], int] = (None, 0)
+        self._statistics: Tuple[Optional[int], Dict[str, Any]] = (None, {})
+
+        schema_version = self._connection().execute(
+            "SELECT value FROM catalog_meta WHERE key = 'schema_version'"
+        ).fetchone()
+        if schema_version is None or schema_version[0] != SCHEMA_VERSION:
+            raise ValueError(f"메뉴 데이터베이스 스키마 버전이 다릅니다: {database_path}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 스레드의 읽기 전용 연결 (포크된 자식 프로세스에서는 새로 열기)"""
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.database_path, check_same_thread=False)
+            connection.execute("PRAGMA query_only = ON")
+            local.connection = connection
+            local.pid = os.getpid()
+            local.data_version = None
+            local.generation = 0
+        return local.connection
+
+    def _current_generation(self) -> int:
+        """
+        커밋된 최신 세대
+
+        PRAGMA data_version은 다른 연결이 커밋했을 때만 바뀌므로, 바뀌었을 때만 세대를 다시 읽습니다.
+        """
+        connection = self._connection()
+        local = self._local
+        data_version = connection.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != local.data_version:
+            local.generation = connection.execute(
+                "SELECT value FROM catalog_meta WHERE key = 'generation'"
+            ).fetchone()[0]
+            local.data_version = data_version
+        return local.generation
+
+    @property
+    def generation(self) -> int:
+        """현재 카탈로그 세대 (메뉴가 편집될 때마다 증가, 카탈로그에 의존하는 캐시의 키로 사용)"""
+        if self._pinned_generation is not None:
+            return self._pinned_generation
+        return self._current_generation()
+
+    @property
+    def menu_count(self) -> int:
+        """현재 메뉴 수 (세대별로 한 번만 셈)"""
+        generation = self.generation
+        counted_generation, count = self._count
+        if counted_generation != generation:
+            count = self._connection().execute("SELECT COUNT(*) FROM menus").fetchone()[0]
+            self._count = (generation, count)
+        return count
+
+    def pinned(self) -> 'SqliteMenuLoader':
+        """
+        현재 세대에 고정된 로더 (조회 메서드 전용)
+
+        generation이 고정되어 추천 캐시 키가 요청 도중 바뀌지 않습니다. 조회 자체는 SQL마다
+        커밋된 최신 데이터를 읽으므로, 요청 도중 커밋된 편집은 이후 조회에 보일 수 있습니다.
+
+        Returns:
+            SqliteMenuLoader: 현재 세대를 가리키는 얕은 복사본
+        """
+        pinned = copy.copy(self)
+        pinned._pinned_generation = self._current_generation()
+        return pinned
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        읽기 캐시를 비우고 세대를 다시 읽음 (편집은 커밋 즉시 보이므로 파일을 다시 읽을 필요 없음)
+
+        Returns:
+            bool: 항상 True
+        """
+        generation = self._current_generation()
+        with self._cache.lock:
+            self._cache.generation = None
+            self._cache.sync(generation)
+        return True
+
+    def reload_in_background(self, force: bool = True) -> bool:
+        """reload()와 같음 (캐시만 비우므로 바로 실행)"""
+        return self.reload(force)
+
+    def start_watcher(self, interval: float = 2.0) -> None:
+        """아무것도 하지 않음 (편집은 조회할 때 세대로 감지)"""
+
+    def stop_watcher(self) -> None:
+        """아무것도 하지 않음"""
+
+    def reload_menus(self) -> None:
+        """메뉴 데이터 다시 로드 (읽기 캐시 비우기)"""
+        self.reload(force=True)
+
+    def _select(self, where: str, params: Sequence[Any] = (),
+                generation: Optional[int] = None) -> Tuple[Menu, ...]:
+        """
+        조건에 맞는 메뉴를 카탈로그 순서로 조회 (캐시에 있는 메뉴는 다시 만들지 않음)
+
+        Args:
+            where: WHERE 절
+            params: WHERE 절 파라미터
+            generation: 캐시 확인에 사용할 세대 (None이면 현재 세대)
+        """
+        if generation is None:
+            generation = self.generation
+        rows = self._connection().execute(
+            f"SELECT {_SELECT_COLUMNS} FROM menus WHERE {where} ORDER BY position", params
+        ).fetchall()
+
+        cache = self._cache
+        if len(rows) > cache.max_entries:
+            # 캐시보다 큰 결과는 캐시를 밀어내지 않고 그대로 만듦
+            return tuple(map(_row_menu, rows))
+
+        menus = []
+        with cache.lock:
+            cache.sync(generation)
+            cached = cache.menus
+            for row in rows:
+                position = row[0]
+                menu = cached.get(position)
+                if menu is None:
+                    menu = _row_menu(row)
+                    cached[position] = menu
+                    if len(cached) > cache.max_entries:
+                        cached.popitem(last=False)
+                else:
+                    cached.move_to_end(position)
+                menus.append(menu)
+        return tuple(menus)
+
+    def get_all_menus(self) -> Tuple[Menu, ...]:
+        """모든 메뉴 반환 (카탈로그 순서)"""
+        return self._select("1")
+
+    def get_menu_by_id(self, menu_id: str) -> Optional[Menu]:
+        """ID로 특정 메뉴 조회 (캐시에 있으면 SQL 없이, 없으면 ID 인덱스, ID가 중복되면 먼저 나온 메뉴)"""
+        generation = self.generation
+        cache = self._cache
+        with cache.lock:
+            cache.sync(generation)
+            position = cache.positions_by_id.get(menu_id)
+            if position is not None and position in cache.menus:
+                cache.menus.move_to_end(position)
+                return cache.menus[position]
+
+        row = self._connection().execute(
+            f"SELECT {_SELECT_COLUMNS} FROM menus WHERE id = ? ORDER BY position LIMIT 1", (menu_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        menu = _row_menu(row)
+        if cache.max_entries:
+            with cache.lock:
+                cache.sync(generation)
+                cache.menus[row[0]] = menu
+                if len(cache.menus) > cache.max_entries:
+                    cache.menus.popitem(last=False)
+                cache.remember_id(menu_id, row[0])
+        return menu
+
+    def get_menus_by_ids(self, menu_ids: Iterable[str]) -> List[Optional[Menu]]:
+        """
+        여러 ID의 메뉴를 한 번에 조회 (SQL 한 번)
+
+        Args:
+            menu_ids: 메뉴 ID 목록
+
+        Returns:
+            List[Optional[Menu]]: 입력 순서대로의 메뉴 (없는 ID는 None)
+        """
+        menu_ids = list(menu_ids)
+        unique_ids = list(dict.fromkeys(menu_ids))
+        if not unique_ids:
+            return []
+        menus = self._select(f"id IN ({', '.join('?' * len(unique_ids))})", unique_ids)
+        menus_by_id: Dict[str, Menu] = {}
+        for menu in menus:
+            menus_by_id.setdefault(menu.id, menu)
+        return [menus_by_id.get(menu_id) for menu_id in menu_ids]
+
+    def filter_by_category(self, category: MenuCategory) -> Tuple[Menu, ...]:
+        """카테고리별 메뉴 필터링 (카테고리 인덱스)"""
+        return self._select("category = ?", (MenuCategory(category).value,))
+
+    def filter_by_score_range(self, min_score: int, max_score: int) -> Tuple[Menu, ...]:
+        """점수 범위와 겹치는 메뉴 필터링 (점수 범위 인덱스)"""
+        return self._select("min_score <= ? AND max_score >= ?", (max_score, min_score))
+
+    def filter_by_serving_size(self, serving_size: int) -> Tuple[Menu, ...]:
+        """인원수로 메뉴 필터링 (인원수 범위 인덱스)"""
+        return self.query(group_size=serving_size).menus()
+
+    def filter_by_sharing_type(self, sharing_type: SharingType) -> Tuple[Menu, ...]:
+        """공유 타입으로 메뉴 필터링 (BOTH 메뉴 포함, 공유 타입 인덱스)"""
+        return self.query(sharing=sharing_type).menus()
+
+    def filter_by_difficulty(self, difficulty: DifficultyLevel) -> Tuple[Menu, ...]:
+        """난이도로 메뉴 필터링 (난이도 인덱스)"""
+        return self.query(difficulty=difficulty).menus()
+
+    def filter_by_keywords(self, keywords: List[str]) -> Tuple[Menu, ...]:
+        """키워드로 메뉴 필터링 (교집합이 있는 메뉴, menu_keywords 조인)"""
+        return self.query(keywords=keywords).menus()
+
+    def match_keywords(self, keywords: Iterable[str],
+                       menus: Optional[Sequence[Menu]] = None) -> List[List[str]]:
+        """
+        후보 메뉴별로 주어진 키워드와 일치하는 키워드 계산
+
+        후보 메뉴는 이미 조회된 객체이므로 SQL 없이 각 메뉴의 키워드를 요청당 한 번 만든
+        키워드 집합과 비교합니다.
+
+        Args:
+            keywords: 운세 키워드 (중복은 한 번만 셈)
+            menus: 후보 메뉴 (None이면 전체 카탈로그)
+
+        Returns:
+            List[List[str]]: 후보 메뉴 순서대로의 일치 키워드 (일치하지 않으면 빈 리스트)
+        """
+        wanted = dict.fromkeys(keywords)
+        candidates = self.get_all_menus() if menus is None else menus
+        results = []
+        for menu in candidates:
+            matched = [keyword for keyword in menu.fortune_keywords if keyword in wanted]
+            if len(matched) > 1 and len(set(matched)) != len(matched):
+                # 메뉴 키워드에 중복이 있으면 한 번만 셈
+                matched = list(dict.fromkeys(matched))
+            results.append(matched)
+        return results
+
+    def query(self, score: Optional[float] = None, group_size: Optional[int] = None,
+              sharing: Optional[SharingType] = None, category: Optional[MenuCategory] = None,
+              difficulty: Optional[DifficultyLevel] = None,
+              keywords: Optional[Iterable[str]] = None) -> SqliteMenuSelection:
+        """
+        여러 조건을 모두 만족하는 메뉴 조회 (None인 조건은 무시, MenuLoader.query와 같은 의미)
+
+        조건을 WHERE 절 하나로 합쳐 SQLite가 인덱스를 고르게 하며, 결과는 SQL을
+        실행하지 않은 선택 객체입니다 (menus()/len()/bool()/explain()에서 실행).
+
+        Args:
+            score: 운세 점수 (소수 점수는 메뉴 점수 범위 안에 있는지로 판단)
+            group_size: 인원수
+            sharing: 공유 타입 (SHARED/INDIVIDUAL은 BOTH 메뉴도 포함)
+            category: 메뉴 카테고리
+            difficulty: 난이도
+            keywords: 운세 키워드 (하나라도 가진 메뉴)
+
+        Returns:
+            SqliteMenuSelection: 조건을 만족하는 메뉴
+
+        Raises:
+            ValueError: 잘못된 공유 타입/카테고리/난이도 값
+        """
+        clauses = []
+        params: List[Any] = []
+        if score is not None:
+            clauses.append("min_score <= ? AND max_score >= ?")
+            params += [score, score]
+        if group_size is not None:
+            clauses.append("min_serving <= ? AND max_serving >= ?")
+            params += [group_size, group_size]
+        if sharing is not None:
+            clauses.append("sharing_type IN (?, ?)")
+            params += [SharingType(sharing).value, SharingType.BOTH.value]
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(MenuCategory(category).value)
+        if difficulty is not None:
+            clauses.append("difficulty = ?")
+            params.append(DifficultyLevel(difficulty).value)
+        if keywords is not None:
+            wanted = list(dict.fromkeys(keywords))
+            if wanted:
+                clauses.append(
+                    "position IN (SELECT position FROM menu_keywords "
+                    f"WHERE keyword IN ({', '.join('?' * len(wanted))}))"
+                )
+                params += wanted
+            else:
+                clauses.append("0")
+
+        return SqliteMenuSelection(self, " AND ".join(clauses) or "1", params, self.generation)
+
+    def explain(self, **filters: Any) -> Dict[str, Any]:
+        """query()와 같은 조건의 SQLite 실행 계획 (SqliteMenuSelection.explain)"""
+        return self.query(**filters).explain()
+
+    def get_suitable_menus_for_score(self, score: float) -> Tuple[Menu, ...]:
+        """특정 점수에 적합한 메뉴들 반환 (점수 범위 인덱스)"""
+        return self.query(score=score).menus()
+
+    def get_suitable_menus_for_group(self, group_size: int,
+                                     prefer_shared: bool = False) -> Tuple[Menu, ...]:
+        """
+        그룹 크기에 적합한 메뉴들 반환
+
+        Args:
+            group_size: 그룹 크기
+            prefer_shared: 공유 음식 우선 여부 (공유 가능한 메뉴가 없으면 전체)
+        """
+        if prefer_shared:
+            shared_menus = self.query(group_size=group_size, sharing=SharingType.SHARED).menus()
+            if shared_menus:
+                return shared_menus
+
+        return self.query(group_size=group_size).menus()
+
+    def get_menu_statistics(self) -> Dict[str, Any]:
+        """메뉴 데이터 통계 정보 반환 (MenuLoader와 같은 형식, 세대별로 한 번 집계한 통계의 요약)"""
+        return summarize_menu_statistics(self.get_catalog_statistics())
+
+    def get_catalog_statistics(self) -> Dict[str, Any]:
+        """
+        현재 세대의 전체 통계 (menu_catalog.build_menu_statistics와 같은 형식)
+
+        세대가 바뀐 뒤 처음 호출할 때만 SQL로 집계하며, 반환하는 사전은 공유되므로 수정하지 않아야 합니다.
+        """
+        generation = self.generation
+        statistics_generation, statistics = self._statistics
+        if statistics_generation == generation:
+            return statistics
+
+        connection = self._connection()
+        total, min_score, max_score, min_serving, max_serving = connection.execute(
+            "SELECT COUNT(*), MIN(min_score), MAX(max_score), MIN(min_serving), MAX(max_serving) FROM menus"
+        ).fetchone()
+
+        def counts(sql: str) -> Dict[str, int]:
+            # 처음 나온 순서대로 (메모리 카탈로그의 통계와 같은 키 순서)
+            return dict(connection.execute(sql).fetchall())
+
+        def column_counts(column: str) -> Dict[str, int]:
+            return counts(f"SELECT {column}, COUNT(*) FROM menus GROUP BY {column} ORDER BY MIN(position)")
+
+        # 점수 s에 적합한 메뉴 수 = 범위가 s를 포함하는 (최소, 최대) 점수 쌍의 메뉴 수 합
+        score_buckets = dict.fromkeys(range(1, 101), 0)
+        for range_min, range_max, count in connection.execute(
+            "SELECT min_score, max_score, COUNT(*) FROM menus GROUP BY min_score, max_score"
+        ):
+            for score in range(range_min, range_max + 1):
+                score_buckets[score] += count
+
+        statistics = {
+            "total": total,
+            "categories": column_counts("category"),
+            "difficulties": column_counts("difficulty"),
+            "sharing_types": column_counts("sharing_type"),
+            "score_ranges": {"min": min_score, "max": max_score} if total else None,
+            "serving_sizes": {"min": min_serving, "max": max_serving} if total else None,
+            "keywords": self._keyword_counts(connection),
+            "score_buckets": score_buckets
+        }
+        self._statistics = (generation, statistics)
+        return statistics
+
+    @staticmethod
+    def _keyword_counts(connection: sqlite3.Connection) -> Dict[str, int]:
+        """
+        키워드별 메뉴 수 (처음 나온 메뉴 위치, 같은 메뉴 안에서는 메뉴의 키워드 순서대로)
+        """
+        rows = connection.execute(
+            "SELECT keyword, COUNT(*), MIN(position) FROM menu_keywords GROUP BY keyword"
+        ).fetchall()
+        first_positions = sorted({row[2] for row in rows})
+        keyword_orders: Dict[int, Dict[str, int]] = {}
+        for start in range(0, len(first_positions), 500):
+            chunk = first_positions[start:start + 500]
+            for position, fortune_keywords in connection.execute(
+                f"SELECT position, fortune_keywords FROM menus WHERE position IN ({', '.join('?' * len(chunk))})",
+                chunk
+            ):
+                keywords = dict.fromkeys(_scan_json(fortune_keywords, 0)[0])
+                keyword_orders[position] = {keyword: order for order, keyword in enumerate(keywords)}
+        rows.sort(key=lambda row: (row[2], keyword_orders[row[2]][row[0]]))
+        return {keyword: count for keyword, count, _ in rows}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점 (메뉴 JSON으로 데이터베이스 생성)"""
+    parser = argparse.ArgumentParser(description="SQLite 메뉴 데이터베이스 생성")
+    parser.add_argument("--menus", default=data_bundle.DEFAULT_MENUS_PATH, help="메뉴 데이터 JSON 경로")
+    parser.add_argument("--output", default=DEFAULT_DATABASE_PATH, help="생성할 데이터베이스 경로")
+    parser.add_argument("--force", action="store_true", help="이미 있는 데이터베이스를 지우고 다시 생성")
+    parser.add_argument("--workers", type=int, default=0, help="메뉴 검증 워커 프로세스 수 (0이면 현재 프로세스)")
+    args = parser.parse_args(argv)
+
+    # --force가 기존 데이터베이스를 지우기 전에 원본을 먼저 읽어 실패하면 중단
+    try:
+        menus, _ = data_bundle.load_source_menus(args.menus, args.workers)
+    except (OSError, ValueError) as e:
+        print(f"메뉴 데이터를 읽지 못했습니다: {e}", file=sys.stderr)
+        return 1
+    try:
+        result = write_database(menus, args.output, force=args.force)
+    except FileExistsError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
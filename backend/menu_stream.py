@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+메뉴 데이터 스트리밍 로더
+menus.json(또는 JSON Lines 변형)을 파일 전체를 읽지 않고 레코드 단위로 읽어
+청크별로 검증하고, 검증에 실패한 레코드는 표준 출력 대신 구조화된 리포트로 수집
+
+사용법: menu_stream.load_menu_file("data/menus.json", workers=4)
+"""
+
+import json
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from models import Menu
+
+# 한 번에 읽는 문자 수 (값 하나가 이보다 크면 버퍼를 두 배씩 늘려 다시 읽음)
+READ_CHARS = 1 << 20
+
+# 워커 프로세스에 한 번에 넘기는 레코드 수
+DEFAULT_CHUNK_SIZE = 2000
+
+# 리포트에 보관하는 거부 레코드 최대 개수 (개수는 모두 셈)
+MAX_REPORTED_REJECTIONS = 1000
+
+# 버퍼 끝에서 이만큼 안쪽에서 끝난 값은 잘린 숫자일 수 있음 ("1." / "1e" / "1e-"처럼
+# 숫자 뒤에 붙은 미완성 소수부/지수부는 raw_decode가 숫자로 읽지 않고 남겨 둠)
+_NUMBER_TAIL = 2
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+def load_workers() -> int:
+    """
+    메뉴 로드에 사용할 워커 프로세스 수 (FORTUNE_MENU_LOAD_WORKERS 환경 변수, 기본 0 = 현재 프로세스에서 처리)
+
+    Returns:
+        int: 워커 프로세스 수
+    """
+    return int(os.environ.get('FORTUNE_MENU_LOAD_WORKERS', 0) or 0)
+
+
+def is_json_lines(path: str) -> bool:
+    """확장자가 .jsonl/.ndjson이면 한 줄에 메뉴 레코드 하나인 JSON Lines 파일"""
+    return path.endswith(('.jsonl', '.ndjson'))
+
+
+@dataclass
+class MenuLoadReport:
+    """메뉴 파일 로드 결과 (검증에 실패한 레코드 포함)"""
+    source: str  # 읽은 파일 경로
+    workers: int  # 사용한 워커 프로세스 수 (0이면 현재 프로세스)
+    accepted: int = 0  # 카탈로그에 포함된 메뉴 수
+    rejected: int = 0  # 검증에 실패한 레코드 수
+    rejections: List[Dict[str, Any]] = field(default_factory=list)  # 실패 레코드 (최대 MAX_REPORTED_REJECTIONS개)
+    elapsed_seconds: float = 0.0  # 로드 시간
+
+    @property
+    def total(self) -> int:
+        """읽은 레코드 수"""
+        return self.accepted + self.rejected
+
+    def add_rejections(self, rejections: List[Dict[str, Any]]) -> None:
+        """청크의 실패 레코드 추가 (보관 개수 제한 적용)"""
+        self.rejected += len(rejections)
+        room = MAX_REPORTED_REJECTIONS - len(self.rejections)
+        if room > 0:
+            self.rejections.extend(rejections[:room])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "source": self.source,
+            "workers": self.workers,
+            "total": self.total,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "rejections": self.rejections,
+            "rejections_truncated": self.rejected > len(self.rejections),
+            "elapsed_seconds": round(self.elapsed_seconds, 3)
+        }
+
+
+class _JsonStream:
+    """
+    텍스트 파일 위의 증분 JSON 토크나이저
+
+    버퍼에 남은 부분만 유지하면서 값 하나씩 json.JSONDecoder.raw_decode로 읽습니다.
+    오류 위치(줄/열/문자)는 파일 기준으로 보고합니다.
+    """
+
+    def __init__(self, file: TextIO):
+        self._file = file
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        # 버퍼 앞에서 버린 문자 수, 줄바꿈 수, 마지막 줄의 시작 위치 (오류 위치 계산용)
+        self._consumed = 0
+        self._lines = 0
+        self._line_start = 0
+
+    def _fill(self) -> bool:
+        """버퍼에 더 읽어 붙임 (파일 끝이면 False)"""
+        if self._eof:
+            return False
+        data = self._file.read(max(READ_CHARS, len(self._buffer) - self._pos))
+        if not data:
+            self._eof = True
+            return False
+        if self._pos:
+            newlines = self._buffer.count("\n", 0, self._pos)
+            if newlines:
+                self._lines += newlines
+                self._line_start = self._consumed + self._buffer.rfind("\n", 0, self._pos) + 1
+            self._consumed += self._pos
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += data
+        return True
+
+    def error(self, message: str, pos: Optional[int] = None) -> json.JSONDecodeError:
+        """현재 위치(또는 버퍼 위치 pos)의 파싱 오류"""
+        pos = self._pos if pos is None else pos
+        error = json.JSONDecodeError(message, self._buffer, pos)
+        last_newline = self._buffer.rfind("\n", 0, pos)
+        error.pos = self._consumed + pos
+        error.lineno = self._lines + self._buffer.count("\n", 0, pos) + 1
+        error.colno = pos - last_newline if last_newline >= 0 else error.pos - self._line_start + 1
+        error.args = (f"{message}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (파일 끝이면 빈 문자열)"""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """다음 문자가 char인지 확인하고 건너뜀"""
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """다음 JSON 값 하나"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise self.error(e.msg, e.pos) from None
+            # 버퍼 끝 근처에서 끝난 숫자는 잘렸을 수 있으므로 더 읽고 다시 확인
+            if len(self._buffer) - end <= _NUMBER_TAIL and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array(self) -> Iterator[Any]:
+        """배열의 원소를 하나씩 반환"""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        scan_once = _DECODER.scan_once
+        skip_whitespace = _WHITESPACE.match
+        while True:
+            # 빠른 경로: 뒤따르는 구분자까지 버퍼 안에 있는 원소는 바로 디코딩
+            buffer = self._buffer
+            while True:
+                try:
+                    value, end = scan_once(buffer, self._pos)
+                except (StopIteration, json.JSONDecodeError):
+                    break
+                end = skip_whitespace(buffer, end).end()
+                if end >= len(buffer) or buffer[end] not in ",]":
+                    break
+                if buffer[end] == "]":
+                    self._pos = end + 1
+                    yield value
+                    return
+                self._pos = skip_whitespace(buffer, end + 1).end()
+                yield value
+
+            # 느린 경로: 버퍼 끝에 걸친 원소는 더 읽어서 디코딩하고, 오류는 파일 기준 위치로 보고
+            yield self.value()
+            char = self.peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                self._pos -= 1
+                raise self.error("Expecting ',' delimiter")
+
+
+def iter_menu_records(file: TextIO, json_lines: bool = False) -> Iterator[Any]:
+    """
+    메뉴 파일에서 레코드를 하나씩 읽습니다.
+
+    JSON 파일은 최상위 객체의 "menus" 배열 원소를 하나씩 디코딩해 반환하고 다른 키의
+    값은 읽고 버립니다. JSON Lines 파일은 디코딩하지 않은 줄 문자열을 반환하므로
+    디코딩도 검증과 함께 워커에서 처리되고, 잘못된 줄은 그 레코드만 거부됩니다.
+
+    Args:
+        file: 텍스트 모드로 연 메뉴 파일
+        json_lines: JSON Lines 파일 여부
+
+    Yields:
+        Any: 메뉴 레코드 (JSON Lines면 줄 문자열)
+
+    Raises:
+        json.JSONDecodeError: JSON 파일의 문법 오류 (파일 기준 위치)
+    """
+    if json_lines:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield line
+        return
+
+    stream = _JsonStream(file)
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+    else:
+        while True:
+            if stream.peek() != '"':
+                raise stream.error("Expecting property name enclosed in double quotes")
+            key = stream.value()
+            stream.expect(":")
+            if key == "menus":
+                yield from stream.array()
+            else:
+                stream.value()
+            if stream.peek() != ",":
+                stream.expect("}")
+                break
+            stream.expect(",")
+    if stream.peek():
+        raise stream.error("Extra data")
+
+
+def build_menus(first_index: int, records: List[Any],
+                json_lines: bool = False) -> Tuple[List[Menu], List[Dict[str, Any]]]:
+    """
+    레코드 청크를 검증해 Menu로 변환 (워커 프로세스에서도 실행)
+
+    Args:
+        first_index: 청크 첫 레코드의 파일 내 순번 (0부터)
+        records: 메뉴 레코드 (JSON Lines면 줄 문자열)
+        json_lines: 레코드가 디코딩 전 줄 문자열인지 여부
+
+    Returns:
+        Tuple[List[Menu], List[Dict[str, Any]]]: (검증된 메뉴, 실패 레코드 {"index", "id", "error"})
+    """
+    menus = []
+    rejections = []
+    for index, record in enumerate(records, first_index):
+        try:
+            if json_lines:
+                record = json.loads(record)
+            menus.append(Menu.from_dict(record))
+        except Exception as e:
+            menu_id = record.get("id") if isinstance(record, dict) else None
+            rejections.append({
+                "index": index,
+                "id": menu_id if isinstance(menu_id, str) else None,
+                "error": f"{type(e).__name__}: {e}"
+            })
+    return menus, rejections
+
+
+def load_menu_file(path: str, workers: int = 0,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[List[Menu], MenuLoadReport]:
+    """
+    메뉴 파일을 스트리밍으로 읽어 청크 단위로 검증
+
+    workers가 0이면 현재 프로세스에서 읽으면서 검증하고, 1 이상이면 chunk_size개씩
+    프로세스 풀에 넘기며 동시에 처리 중인 청크를 workers * 2개로 제한합니다. 어느
+    경우든 원시 레코드는 몇 청크 분량만 메모리에 있고, 결과 메뉴는 파일 순서를 유지합니다.
+
+    Args:
+        path: 메뉴 JSON 또는 JSON Lines(.jsonl/.ndjson) 파일 경로
+        workers: 워커 프로세스 수 (0이면 현재 프로세스)
+        chunk_size: 청크당 레코드 수
+
+    Returns:
+        Tuple[List[Menu], MenuLoadReport]: (검증된 메뉴, 로드 리포트)
+
+    Raises:
+        ValueError: workers가 음수이거나 chunk_size가 1보다 작은 경우
+        json.JSONDecodeError: JSON 파일의 문법 오류
+    """
+    if workers < 0 or chunk_size < 1:
+        raise ValueError("workers는 0 이상, chunk_size는 1 이상이어야 합니다")
+
+    started = time.perf_counter()
+    json_lines = is_json_lines(path)
+    report = MenuLoadReport(source=path, workers=workers)
+    menus: List[Menu] = []
+
+    def collect(chunk_menus: List[Menu], rejections: List[Dict[str, Any]]) -> None:
+        menus.extend(chunk_menus)
+        report.add_rejections(rejections)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        records = iter_menu_records(f, json_lines)
+        next_index = 0
+        if workers == 0:
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                collect(*build_menus(next_index, chunk, json_lines))
+                next_index += len(chunk)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending: Deque[Future] = deque()
+                while True:
+                    chunk = list(islice(records, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(build_menus, next_index, chunk, json_lines))
+                    next_index += len(chunk)
+                    if len(pending) >= workers * 2:
+                        collect(*pending.popleft().result())
+                while pending:
+                    collect(*pending.popleft().result())
+
+    report.accepted = len(menus)
+    report.elapsed_seconds = time.perf_counter() - started
+    return menus, report
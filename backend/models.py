@@ -5,7 +5,7 @@ Fortune, GroupFortune, Menu 클래스와 JSON 스키마 검증 로직 구현
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Sequence
 from datetime import datetime
 import json
 from enum import Enum
@@ -34,12 +34,12 @@ class MenuCategory(Enum):
     OTHER = "기타"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CategoryFortune:
-    """카테고리별 운세 정보"""
+    """카테고리별 운세 정보 (불변 객체, 운세 엔진에서는 인스턴스를 공유함)"""
     score: int  # 1-100 점수
     message: str  # 운세 메시지
-    keywords: List[str] = field(default_factory=list)  # 연관 키워드
+    keywords: Sequence[str] = field(default_factory=list)  # 연관 키워드
     
     def __post_init__(self):
         """초기화 후 검증"""
@@ -49,6 +49,31 @@ class CategoryFortune:
             raise ValueError("운세 메시지는 비어있을 수 없습니다")
 
 
+@dataclass(frozen=True)
+class SpecialCombination:
+    """특별 점수 조합 운세 (불변 객체, 컴파일된 규칙 테이블의 인스턴스를 공유함)"""
+    name: str  # 조합 이름 (예: all_excellent)
+    message: str  # 조합 메시지
+    keywords: Sequence[str] = field(default_factory=tuple)  # 연관 키워드
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "name": self.name,
+            "message": self.message,
+            "keywords": list(self.keywords)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SpecialCombination':
+        """딕셔너리에서 생성"""
+        return cls(
+            name=data["name"],
+            message=data["message"],
+            keywords=tuple(data.get("keywords", ()))
+        )
+
+
 @dataclass
 class Fortune:
     """개인 운세 정보"""
@@ -56,6 +81,8 @@ class Fortune:
     birth_date: str  # YYYY-MM-DD 형식
     categories: Dict[str, CategoryFortune]  # 카테고리별 운세
     total_score: int  # 전체 운세 점수
+    algorithm_version: Optional[str] = None  # 점수 알고리즘 버전
+    special_combination: Optional[SpecialCombination] = None  # 특별 점수 조합 (해당 없으면 None)
     
     def __post_init__(self):
         """초기화 후 검증"""
@@ -85,11 +112,15 @@ class Fortune:
                 name: {
                     "score": cat.score,
                     "message": cat.message,
-                    "keywords": cat.keywords
+                    "keywords": list(cat.keywords)
                 }
                 for name, cat in self.categories.items()
             },
-            "total_score": self.total_score
+            "total_score": self.total_score,
+            "algorithm_version": self.algorithm_version,
+            "special_combination": (
+                self.special_combination.to_dict() if self.special_combination is not None else None
+            )
         }
     
     @classmethod
@@ -107,7 +138,12 @@ class Fortune:
             date=data["date"],
             birth_date=data["birth_date"],
             categories=categories,
-            total_score=data["total_score"]
+            total_score=data["total_score"],
+            algorithm_version=data.get("algorithm_version"),
+            special_combination=(
+                SpecialCombination.from_dict(data["special_combination"])
+                if data.get("special_combination") else None
+            )
         )
 
 
@@ -120,6 +156,7 @@ class GroupFortune:
     group_message: str  # 그룹 종합 메시지
     participant_count: int  # 참석자 수
     individual_fortunes: List[Fortune] = field(default_factory=list)  # 개별 운세들
+    algorithm_version: Optional[str] = None  # 점수 알고리즘 버전
     
     def __post_init__(self):
         """초기화 후 검증"""
@@ -142,7 +179,8 @@ class GroupFortune:
             "dominant_categories": self.dominant_categories,
             "group_message": self.group_message,
             "participant_count": self.participant_count,
-            "individual_fortunes": [fortune.to_dict() for fortune in self.individual_fortunes]
+            "individual_fortunes": [fortune.to_dict() for fortune in self.individual_fortunes],
+            "algorithm_version": self.algorithm_version
         }
     
     @classmethod
@@ -159,10 +197,44 @@ class GroupFortune:
             dominant_categories=data["dominant_categories"],
             group_message=data["group_message"],
             participant_count=data["participant_count"],
-            individual_fortunes=individual_fortunes
+            individual_fortunes=individual_fortunes,
+            algorithm_version=data.get("algorithm_version")
         )
 
 
+@dataclass
+class LargeGroupFortune:
+    """대규모 그룹 운세 요약 (개별 운세 없이 집계값만 포함)"""
+    average_score: float  # 그룹 평균 점수
+    harmony_score: float  # 그룹 화합 점수 (0-100)
+    dominant_categories: List[str]  # 주요 운세 카테고리
+    group_message: str  # 그룹 종합 메시지
+    participant_count: int  # 참석자 수
+    algorithm_version: Optional[str] = None  # 점수 알고리즘 버전
+    
+    def __post_init__(self):
+        """초기화 후 검증"""
+        if not (0 <= self.average_score <= 100):
+            raise ValueError("평균 점수는 0-100 사이여야 합니다")
+        if not (0 <= self.harmony_score <= 100):
+            raise ValueError("화합 점수는 0-100 사이여야 합니다")
+        if self.participant_count < 2:
+            raise ValueError("그룹은 최소 2명 이상이어야 합니다")
+        if not self.group_message.strip():
+            raise ValueError("그룹 메시지는 비어있을 수 없습니다")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        return {
+            "average_score": self.average_score,
+            "harmony_score": self.harmony_score,
+            "dominant_categories": self.dominant_categories,
+            "group_message": self.group_message,
+            "participant_count": self.participant_count,
+            "algorithm_version": self.algorithm_version
+        }
+
+
 @dataclass
 class Menu:
     """메뉴 정보"""
@@ -188,8 +260,11 @@ class Menu:
         if not self.name.strip():
             raise ValueError("메뉴 이름은 비어있을 수 없습니다")
         
-        # 점수 범위 검증
+        # 점수 범위 검증 (점수/인원수는 점수 버킷과 인원수 버킷의 키이므로 정수만 허용)
         min_score, max_score = self.score_range
+        if not all(isinstance(value, int) and not isinstance(value, bool)
+                   for value in (min_score, max_score, self.min_serving, self.max_serving)):
+            raise ValueError("점수 범위와 인원수는 정수여야 합니다")
         if not (1 <= min_score <= 100) or not (1 <= max_score <= 100):
             raise ValueError("점수 범위는 1-100 사이여야 합니다")
         if min_score > max_score:
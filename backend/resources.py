@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+공유 리소스 레지스트리
+메뉴 카탈로그, 운세 템플릿, 운세/추천 엔진을 프로세스당 하나씩 소유하고
+지연 초기화와 명시적 preload(gunicorn --preload 마스터에서 한 번 로드)를 지원
+"""
+
+import gc
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# 템플릿/메뉴 파일 변경 확인 주기 기본값 (초)
+DEFAULT_TEMPLATE_RELOAD_INTERVAL = 2.0
+DEFAULT_MENU_RELOAD_INTERVAL = 2.0
+
+
+class ResourceRegistry:
+    """
+    이름별 리소스 팩토리와 인스턴스를 관리하는 레지스트리
+
+    get()은 처음 요청될 때 팩토리로 인스턴스를 만들고 이후에는 같은 인스턴스를
+    반환합니다. preload()로 모든 리소스를 미리 만들어 두면 fork된 워커가
+    마스터의 메모리를 copy-on-write로 공유합니다.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[['ResourceRegistry'], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[['ResourceRegistry'], Any]) -> None:
+        """
+        리소스 팩토리 등록
+
+        Args:
+            name: 리소스 이름
+            factory: 레지스트리를 받아 인스턴스를 만드는 함수 (다른 리소스는 registry.get으로 참조)
+        """
+        with self._lock:
+            self._factories[name] = factory
+
+    def get(self, name: str) -> Any:
+        """
+        리소스 인스턴스 반환 (없으면 생성)
+
+        Args:
+            name: 리소스 이름
+
+        Returns:
+            리소스 인스턴스
+
+        Raises:
+            KeyError: 등록되지 않은 리소스인 경우
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                if name not in self._factories:
+                    raise KeyError(f"등록되지 않은 리소스입니다: {name}")
+                instance = self._factories[name](self)
+                self._instances[name] = instance
+            return instance
+
+    def is_loaded(self, name: str) -> bool:
+        """리소스가 이미 생성되었는지 여부"""
+        return name in self._instances
+
+    def is_registered(self, name: str) -> bool:
+        """리소스 팩토리가 등록되었는지 여부"""
+        return name in self._factories
+
+    def names(self) -> List[str]:
+        """등록된 리소스 이름 리스트 (등록 순서)"""
+        return list(self._factories)
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        리소스를 미리 생성
+
+        Args:
+            names: 생성할 리소스 이름 (None이면 등록된 전체)
+
+        Returns:
+            List[str]: 생성(또는 이미 생성되어 있던) 리소스 이름
+        """
+        names = list(self._factories) if names is None else list(names)
+        for name in names:
+            self.get(name)
+        return names
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """
+        생성된 인스턴스 폐기 (다음 get에서 다시 생성)
+
+        Args:
+            name: 폐기할 리소스 이름 (None이면 전체)
+        """
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+
+def _create_menu_loader(registry: ResourceRegistry):
+    import menu_sqlite
+    database_path = menu_sqlite.database_path()
+    if database_path is not None:
+        return menu_sqlite.SqliteMenuLoader(database_path)
+    from menu_loader import MenuLoader
+    return MenuLoader()
+
+
+def _create_template_loader(registry: ResourceRegistry):
+    from fortune_template_loader import FortuneTemplateLoader
+    return FortuneTemplateLoader()
+
+
+def _create_recommendation_engine(registry: ResourceRegistry):
+    from menu_recommendation_engine import MenuRecommendationEngine
+    return MenuRecommendationEngine(registry.get("menu_loader"))
+
+
+def _fortune_engine_factory(algorithm_version: str) -> Callable[[ResourceRegistry], Any]:
+    def create(registry: ResourceRegistry):
+        from fortune_engine import FortuneEngine
+        return FortuneEngine(
+            algorithm_version=algorithm_version,
+            template_loader=registry.get("template_loader")
+        )
+    return create
+
+
+def fortune_engine_resource(algorithm_version: str) -> str:
+    """알고리즘 버전별 운세 엔진의 리소스 이름"""
+    return f"fortune_engine:{algorithm_version}"
+
+
+# 프로세스 전역 레지스트리
+registry = ResourceRegistry()
+registry.register("menu_loader", _create_menu_loader)
+registry.register("template_loader", _create_template_loader)
+registry.register("recommendation_engine", _create_recommendation_engine)
+
+
+def get_fortune_engine(algorithm_version: str):
+    """
+    알고리즘 버전별 운세 엔진 반환 (모든 엔진이 하나의 템플릿 로더를 공유)
+
+    Args:
+        algorithm_version: fortune_algorithms 레지스트리에 등록된 버전
+
+    Returns:
+        FortuneEngine: 해당 버전의 공유 엔진
+    """
+    name = fortune_engine_resource(algorithm_version)
+    if not registry.is_registered(name):
+        from fortune_algorithms import get_algorithm
+        get_algorithm(algorithm_version)  # 등록되지 않은 버전이면 ValueError
+        registry.register(name, _fortune_engine_factory(algorithm_version))
+    return registry.get(name)
+
+
+def loaded_fortune_engines() -> Dict[str, Any]:
+    """이미 생성된 운세 엔진 {버전: 엔진}"""
+    prefix = fortune_engine_resource("")
+    return {
+        name[len(prefix):]: registry.get(name)
+        for name in registry.names()
+        if name.startswith(prefix) and registry.is_loaded(name)
+    }
+
+
+def preload(algorithm_versions: Iterable[str] = ()) -> List[str]:
+    """
+    카탈로그, 템플릿, 추천 엔진과 지정한 버전의 운세 엔진을 미리 생성
+
+    gunicorn --preload 마스터에서 호출하면 워커를 fork하기 전에 데이터를 한 번만
+    로드합니다. 로드 후 gc.freeze()로 기존 객체를 GC 추적 대상에서 빼서, 워커의
+    GC가 공유 페이지에 쓰기를 일으키지 않도록 합니다.
+
+    Args:
+        algorithm_versions: 미리 생성할 운세 엔진 버전
+
+    Returns:
+        List[str]: 생성된 리소스 이름
+    """
+    for version in algorithm_versions:
+        get_fortune_engine(version)
+    loaded = registry.preload()
+    gc.freeze()
+    return loaded
+
+
+def start_background_tasks(template_reload_interval: float = DEFAULT_TEMPLATE_RELOAD_INTERVAL,
+                           menu_reload_interval: float = DEFAULT_MENU_RELOAD_INTERVAL) -> None:
+    """
+    프로세스별 백그라운드 작업 시작 (요청을 처리할 프로세스에서 호출)
+
+    스레드는 fork로 복제되지 않고 fork 시점에 잡혀 있던 잠금은 워커에 그대로 남으므로,
+    import 시점이 아니라 gunicorn의 post_fork 훅이나 직접 실행하는 진입점에서 호출합니다.
+
+    Args:
+        template_reload_interval: 템플릿 파일 변경 확인 주기 (초, 0 이하이면 비활성화)
+        menu_reload_interval: 메뉴 파일 변경 확인 주기 (초, 0 이하이면 비활성화)
+    """
+    if template_reload_interval > 0:
+        registry.get("template_loader").start_watcher(template_reload_interval)
+    if menu_reload_interval > 0:
+        registry.get("menu_loader").start_watcher(menu_reload_interval)
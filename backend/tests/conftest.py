@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+백엔드 단위 테스트 공통 설정
+저장소에 포함되지 않는 데이터 파일 대신 재현 가능한 합성 템플릿/메뉴 파일을 임시 디렉토리에 만들어 사용
+"""
+
+import json
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+CATEGORY_NAMES = {"love": "사랑운", "health": "건강운", "wealth": "재물운", "career": "학업/직장운"}
+SCORE_RANGES = ("excellent", "good", "average", "poor", "bad")
+KEYWORDS = ("로맨틱", "달콤한", "특별한", "행복한", "따뜻한", "활력적인", "건강한", "신선한", "에너지",
+            "풍성한", "고급스러운", "차분한", "편안한", "안정적인", "위로", "화합", "축하", "성공")
+
+
+def synthetic_templates(seed: int = 1) -> Dict[str, Any]:
+    """모든 카테고리/점수 구간/그룹 메시지/특별 조합을 갖춘 합성 운세 템플릿"""
+    rng = random.Random(seed)
+    return {
+        "categories": {
+            category: {
+                "name": name,
+                "icon": "⭐",
+                "score_ranges": {
+                    range_name: {
+                        "messages": [f"{name} {range_name} 메시지 {i}" for i in range(4)],
+                        "keywords": rng.sample(KEYWORDS, 5)
+                    }
+                    for range_name in SCORE_RANGES
+                }
+            }
+            for category, name in CATEGORY_NAMES.items()
+        },
+        "group_messages": {
+            f"harmony_{range_name}": {"messages": [f"그룹 {range_name} 메시지 {i}" for i in range(4)]}
+            for range_name in SCORE_RANGES
+        },
+        "special_combinations": {
+            name: {"message": f"특별 조합 {name}", "keywords": rng.sample(KEYWORDS, 3)}
+            for name in ("all_excellent", "love_wealth_high", "health_career_high", "all_low")
+        }
+    }
+
+
+def synthetic_menu_records(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """검증을 통과하는 합성 메뉴 레코드 (menus.json의 "menus" 원소 형식)"""
+    rng = random.Random(seed)
+    categories = ("한식", "중식", "일식", "양식", "기타")
+    difficulties = ("쉬움", "보통", "어려움")
+    sharing_types = ("individual", "shared", "both")
+    records = []
+    for index in range(count):
+        min_score = rng.randint(1, 70)
+        min_serving = rng.randint(1, 4)
+        records.append({
+            "id": f"menu_{index:04d}",
+            "name": f"메뉴{index}",
+            "category": categories[index % len(categories)],
+            "score_range": [min_score, rng.randint(min_score, 100)],
+            "fortune_keywords": rng.sample(KEYWORDS, 4),
+            "ingredients": ["재료1", "재료2"],
+            "cooking_time": "30분",
+            "difficulty": difficulties[index % len(difficulties)],
+            "description": "설명",
+            "min_serving": min_serving,
+            "max_serving": rng.randint(min_serving, 10),
+            "sharing_type": sharing_types[index % len(sharing_types)],
+            "base_score": rng.randint(40, 90)
+        })
+    return records
+
+
+def sample_birth_dates(count: int) -> List[str]:
+    """1900-01-01부터 일정 간격으로 떨어진 생년월일 샘플"""
+    from datetime import date, timedelta
+
+    start = date(1900, 1, 1)
+    step = max(1, 45000 // max(1, count))
+    return [(start + timedelta(days=i * step % 45000)).isoformat() for i in range(count)]
+
+
+def write_json(path: str, data: Any) -> str:
+    """JSON 파일 쓰기 (경로 반환)"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def template_path(tmp_path_factory) -> str:
+    """합성 운세 템플릿 파일 경로"""
+    return write_json(tmp_path_factory.mktemp("templates") / "fortune_templates.json", synthetic_templates())
+
+
+@pytest.fixture(scope="session")
+def template_loader(template_path):
+    """합성 템플릿을 읽은 템플릿 로더 (번들 사용 안 함)"""
+    from fortune_template_loader import FortuneTemplateLoader
+    return FortuneTemplateLoader(template_path, use_bundle=False)
+
+
+@pytest.fixture
+def menus_path(tmp_path) -> str:
+    """합성 메뉴 30개가 든 menus.json 경로"""
+    return write_json(tmp_path / "menus.json", {"menus": synthetic_menu_records(30)})
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""대량 배치 실행기 테스트"""
+
+import json
+
+import pytest
+
+import batch_runner
+import resources
+from fortune_algorithms import ALGORITHM_V2
+
+
+@pytest.fixture
+def batch_registry(monkeypatch, template_path, menus_path):
+    """합성 템플릿/메뉴를 쓰는 리소스 레지스트리 (fork된 워커가 그대로 상속)"""
+    from fortune_template_loader import FortuneTemplateLoader
+    from menu_loader import MenuLoader
+
+    registry = resources.ResourceRegistry()
+    registry.register("menu_loader", lambda _: MenuLoader(menus_path, use_bundle=False, workers=0))
+    registry.register("template_loader", lambda _: FortuneTemplateLoader(template_path, use_bundle=False))
+    registry.register("recommendation_engine", resources._create_recommendation_engine)
+    monkeypatch.setattr(resources, "registry", registry)
+    return registry
+
+
+def test_mixed_jsonl_rows_produce_error_records(tmp_path, batch_registry):
+    lines = [
+        json.dumps({"birth_date": "1990-05-15", "name": "가"}, ensure_ascii=False),
+        "[1, 2]",
+        '"x"',
+        '{"birth_date": "1985-01-01"',
+        json.dumps({"birth_date": "2999-01-01"}),
+        json.dumps({"birth_date": "1899-12-31"}),
+        json.dumps({"birth_date": 19900515}),
+        json.dumps({"birth_date": "1990/05/15"}),
+        "",
+        json.dumps({"birth_date": "2000-02-29", "name": "나"}, ensure_ascii=False),
+    ]
+    input_path = tmp_path / "rows.jsonl"
+    input_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    output_path = tmp_path / "results.jsonl"
+
+    stats = batch_runner.run_batch(str(input_path), str(output_path), "2024-05-01",
+                                   algorithm_version=ALGORITHM_V2, workers=1, chunk_size=3)
+
+    results = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert [result["row"] for result in results] == list(range(9))
+    assert [("error" in result) for result in results] == [False] + [True] * 7 + [False]
+    assert results[0]["name"] == "가" and len(results[0]["recommendations"]) == 3
+    assert results[8]["fortune"]["birth_date"] == "2000-02-29"
+    assert results[4]["birth_date"] == "2999-01-01"
+    assert stats["rows_processed"] == 9 and stats["errors"] == 7
+
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""데이터 빌드 도구(번들/컬럼형 카탈로그/SQLite) 테스트"""
+
+import os
+import sqlite3
+
+import pytest
+
+import data_bundle
+import menu_columns
+import menu_sqlite
+
+
+@pytest.fixture
+def broken_menus_path(tmp_path):
+    """JSON이 중간에 잘린 메뉴 파일"""
+    path = tmp_path / "broken.json"
+    path.write_text('{"menus": [{"id": "a", "name": ', encoding="utf-8")
+    return str(path)
+
+
+def test_bundle_build_fails_on_broken_menus(tmp_path, broken_menus_path, template_path):
+    output = tmp_path / "bundle.bin"
+    assert data_bundle.main(["--menus", broken_menus_path, "--templates", template_path,
+                             "--output", str(output)]) == 1
+    assert not output.exists()
+
+
+def test_bundle_build_fails_on_missing_menus(tmp_path, template_path):
+    output = tmp_path / "bundle.bin"
+    assert data_bundle.main(["--menus", str(tmp_path / "none.json"), "--templates", template_path,
+                             "--output", str(output)]) == 1
+    assert not output.exists()
+
+
+def test_bundle_build(tmp_path, menus_path, template_path):
+    output = tmp_path / "bundle.bin"
+    result = data_bundle.build_bundle(menus_path, template_path, str(output))
+    assert result["menus"] == 30 and result["rejected_menus"] == 0
+    assert output.exists()
+
+
+def test_columnar_build_fails_on_broken_menus(tmp_path, broken_menus_path):
+    output = tmp_path / "menu_columns.bin"
+    assert menu_columns.main(["--menus", broken_menus_path, "--output", str(output)]) == 1
+    assert not output.exists()
+
+
+def test_sqlite_force_build_keeps_database_on_broken_menus(tmp_path, menus_path, broken_menus_path):
+    output = str(tmp_path / "menus.db")
+    assert menu_sqlite.main(["--menus", menus_path, "--output", output]) == 0
+
+    assert menu_sqlite.main(["--menus", broken_menus_path, "--output", output, "--force"]) == 1
+
+    assert os.path.exists(output)
+    with sqlite3.connect(output) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM menus").fetchone() == (30,)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""점수 알고리즘 레지스트리 테스트"""
+
+import pytest
+
+import fortune_algorithms
+from fortune_algorithms import FortuneAlgorithm
+
+
+def test_subclass_without_category_scores_cannot_be_instantiated():
+    class Incomplete(FortuneAlgorithm):
+        version = "test-incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_registry_rejects_duplicate_and_empty_versions():
+    class Constant(FortuneAlgorithm):
+        version = fortune_algorithms.ALGORITHM_V1
+
+        def category_scores(self, birth_date, current_date, categories):
+            return {category: 50 for category in categories}
+
+    with pytest.raises(ValueError):
+        fortune_algorithms.register_algorithm(Constant())
+
+    Constant.version = ""
+    with pytest.raises(ValueError):
+        fortune_algorithms.register_algorithm(Constant())
+
+    assert fortune_algorithms.get_algorithm(fortune_algorithms.ALGORITHM_V1).version == "v1"
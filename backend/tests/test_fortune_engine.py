@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""운세 엔진 결정성 테스트 (스레드 동시 실행, 프로세스별 해시 시드)"""
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import BACKEND_DIR, sample_birth_dates
+from fortune_engine import FortuneEngine, SUPPORTED_ALGORITHM_VERSIONS
+
+CURRENT_DATE = "2024-01-01"
+
+_DIGEST_CODE = """
+import hashlib, json, sys
+from fortune_engine import FortuneEngine, SUPPORTED_ALGORITHM_VERSIONS
+from fortune_template_loader import FortuneTemplateLoader
+from conftest import sample_birth_dates
+loader = FortuneTemplateLoader(sys.argv[1], use_bundle=False)
+birth_dates = sample_birth_dates(int(sys.argv[2]))
+digest = hashlib.sha256()
+for version in SUPPORTED_ALGORITHM_VERSIONS:
+    engine = FortuneEngine(algorithm_version=version, template_loader=loader)
+    for birth_date in birth_dates:
+        fortune = engine.generate_individual_fortune(birth_date, "2024-01-01")
+        digest.update(json.dumps(fortune.to_dict(), sort_keys=True, ensure_ascii=False).encode())
+    for i in range(0, len(birth_dates) - 3, 4):
+        group = engine.generate_group_fortune(birth_dates[i:i + 4], "2024-01-01")
+        digest.update(json.dumps(group.to_dict(), sort_keys=True, ensure_ascii=False).encode())
+print(digest.hexdigest())
+"""
+
+
+@pytest.mark.parametrize("version", SUPPORTED_ALGORITHM_VERSIONS)
+def test_threaded_fortunes_match_single_thread(template_loader, version):
+    birth_dates = sample_birth_dates(400)
+    groups = [birth_dates[i:i + 4] for i in range(0, len(birth_dates) - 3, 4)]
+    engine = FortuneEngine(algorithm_version=version, template_loader=template_loader)
+
+    def individual(birth_date):
+        return engine.generate_individual_fortune(birth_date, CURRENT_DATE).to_dict()
+
+    def group(members):
+        return engine.generate_group_fortune(members, CURRENT_DATE).to_dict()
+
+    expected_individual = [individual(birth_date) for birth_date in birth_dates]
+    expected_group = [group(members) for members in groups]
+    engine.fortune_cache.clear()
+
+    # 스레드 전환을 자주 일으켜 경쟁 상태가 드러나도록 함
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            actual_individual = list(executor.map(individual, birth_dates))
+            actual_group = list(executor.map(group, groups))
+    finally:
+        sys.setswitchinterval(previous_interval)
+
+    assert actual_individual == expected_individual
+    assert actual_group == expected_group
+
+
+def test_fortune_json_is_identical_across_hash_seeds(template_path):
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    digests = set()
+    for hash_seed in ("0", "1", "42", "random"):
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed,
+                   PYTHONPATH=os.pathsep.join([BACKEND_DIR, tests_dir]))
+        result = subprocess.run([sys.executable, "-c", _DIGEST_CODE, template_path, "200"],
+                                env=env, cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+        digests.add(result.stdout.strip().splitlines()[-1])
+    assert len(digests) == 1
+
+
+def test_table_scores_match_kernel(template_loader):
+    from fortune_algorithms import ALGORITHM_V2
+
+    engine = FortuneEngine(algorithm_version=ALGORITHM_V2, template_loader=template_loader)
+    for birth_date in sample_birth_dates(300):
+        assert engine.generate_category_scores(birth_date, CURRENT_DATE) == \
+            engine.algorithm.category_scores(birth_date, CURRENT_DATE, engine.categories)
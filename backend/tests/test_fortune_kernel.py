@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""상태 없는 점수 커널 테스트"""
+
+from datetime import date
+
+import pytest
+
+import fortune_kernel
+from validation import validate_forecast_request
+
+CAT_KEYS = [fortune_kernel.category_key(category) for category in ("love", "health", "wealth", "career")]
+
+
+def test_batch_kernels_match_single_scores():
+    birth_ordinal = date(1990, 5, 15).toordinal()
+    date_ordinal = date(2024, 1, 1).toordinal()
+    by_date = fortune_kernel.scores_for_date_range(birth_ordinal, date_ordinal, 30, CAT_KEYS)
+    by_birth = fortune_kernel.scores_for_birth_range(birth_ordinal, 30, date_ordinal, CAT_KEYS)
+    for offset in range(30):
+        for index, key in enumerate(CAT_KEYS):
+            assert by_date[offset * 4 + index] == \
+                fortune_kernel.score_from_ordinals(birth_ordinal, date_ordinal + offset, key)
+            assert by_birth[offset * 4 + index] == \
+                fortune_kernel.score_from_ordinals(birth_ordinal + offset, date_ordinal, key)
+
+
+def test_dates_past_counter_field_are_rejected():
+    birth_ordinal = date(1990, 5, 15).toordinal()
+    last = fortune_kernel.MAX_DATE_ORDINAL
+    fortune_kernel.score_from_ordinals(birth_ordinal, last, CAT_KEYS[0])
+    fortune_kernel.scores_for_date_range(birth_ordinal, last - 9, 10, CAT_KEYS)
+
+    with pytest.raises(ValueError):
+        fortune_kernel.score_from_ordinals(birth_ordinal, last + 1, CAT_KEYS[0])
+    with pytest.raises(ValueError):
+        fortune_kernel.scores_for_date_range(birth_ordinal, last - 9, 11, CAT_KEYS)
+    with pytest.raises(ValueError):
+        fortune_kernel.scores_for_birth_range(birth_ordinal, 10, last + 1, CAT_KEYS)
+
+
+def test_forecast_request_past_kernel_range_is_invalid():
+    last_date = date.fromordinal(fortune_kernel.MAX_DATE_ORDINAL)
+    start = date.fromordinal(fortune_kernel.MAX_DATE_ORDINAL - 9).isoformat()
+    assert last_date.isoformat() == fortune_kernel.MAX_FORTUNE_DATE
+
+    assert validate_forecast_request({"birth_date": "1990-05-15", "start_date": start, "days": 10}, 365)["valid"]
+    assert not validate_forecast_request({"birth_date": "1990-05-15", "start_date": start, "days": 11}, 365)["valid"]
+    assert not validate_forecast_request({"birth_date": "1990-05-15", "start_date": "9999-01-01"}, 365)["valid"]
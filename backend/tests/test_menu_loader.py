@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""메뉴 로더 스냅샷 게시/리로드 테스트"""
+
+import json
+import sys
+import threading
+
+from conftest import synthetic_menu_records, write_json
+from menu_loader import MenuLoader
+from models import Menu
+
+
+def _menus(prefix: str, count: int = 200):
+    menus = []
+    for record in synthetic_menu_records(count):
+        record["id"] = f"{prefix}{record['id']}"
+        menus.append(Menu.from_dict(record))
+    return menus
+
+
+def test_pinned_loader_sees_one_generation_while_publishing():
+    generations = {version: _menus(f"g{version}_") for version in range(1, 21)}
+    loader = MenuLoader(menus=generations[1])
+    errors = []
+    stop = threading.Event()
+
+    def reader() -> None:
+        while not stop.is_set():
+            try:
+                view = loader.pinned()
+                prefix = f"g{view.generation}_"
+                ids = [menu.id for menu in view.get_all_menus()]
+                ids += [menu.id for menu in view.filter_by_score_range(30, 70)]
+                ids += [menu.id for menu in view.filter_by_serving_size(3)]
+                ids += [menu.id for menu in view.query(score=55, group_size=2).menus()]
+                if view.get_menu_by_id(f"{prefix}menu_0000") is None:
+                    errors.append(f"{prefix}menu_0000 없음")
+                mixed = [menu_id for menu_id in ids if not menu_id.startswith(prefix)]
+                if mixed:
+                    errors.append(mixed[:3])
+            except Exception as e:
+                errors.append(repr(e))
+                return
+
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for version in range(2, 21):
+            assert loader.publish(generations[version]).version == version
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        sys.setswitchinterval(previous_interval)
+
+    assert errors == []
+    assert loader.generation == 20
+
+
+def test_reload_keeps_previous_catalog_when_file_is_broken(menus_path):
+    loader = MenuLoader(menus_path, use_bundle=False, workers=0)
+    assert loader.menu_count == 30 and loader.generation == 1
+
+    with open(menus_path, "w", encoding="utf-8") as f:
+        f.write('{"menus": [')
+    try:
+        loader.reload(force=True)
+    except json.JSONDecodeError:
+        pass
+    else:
+        raise AssertionError("잘린 파일을 다시 로드했습니다")
+    assert loader.menu_count == 30 and loader.generation == 1
+
+    write_json(menus_path, {"menus": synthetic_menu_records(5)})
+    assert loader.reload(force=True)
+    assert loader.menu_count == 5 and loader.generation == 2
+
+
+def test_score_range_filter_matches_scan(tmp_path):
+    import random
+    import data_bundle
+    import menu_columns
+
+    menus = _menus("m_", 300)
+    path = str(tmp_path / "menu_columns.bin")
+    menu_columns.write_columnar_catalog(menus, path, data_bundle.source_info(__file__))
+    memory_loader = MenuLoader(menus=menus)
+    columnar_loader = MenuLoader(menus=())
+    columnar_loader.publish_catalog(menu_columns.ColumnarMenuCatalog(path, columnar_loader.generation + 1))
+
+    rng = random.Random(0)
+    ranges = [(rng.randint(-10, 110), rng.randint(-10, 110)) for _ in range(200)]
+    ranges += [(rng.uniform(0, 101), rng.uniform(0, 101)) for _ in range(200)]
+    ranges += [(50, 50), (0, 0), (1, 100), (70.5, 70.5), (100, 1)]
+    for min_score, max_score in ranges:
+        expected = [menu.id for menu in menus
+                    if menu.score_range[0] <= max_score and menu.score_range[1] >= min_score]
+        for loader in (memory_loader, columnar_loader):
+            assert [menu.id for menu in loader.filter_by_score_range(min_score, max_score)] == expected
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""메뉴 파일 스트리밍 파서/로더 테스트"""
+
+import io
+import json
+import random
+
+import pytest
+
+import menu_stream
+from conftest import synthetic_menu_records, write_json
+
+
+@pytest.fixture
+def small_reads(monkeypatch):
+    """READ_CHARS를 바꿔 값이 버퍼 경계에서 잘리도록 함"""
+    def set_read_chars(read_chars: int) -> None:
+        monkeypatch.setattr(menu_stream, "READ_CHARS", read_chars)
+    return set_read_chars
+
+
+def _records(text: str):
+    return list(menu_stream.iter_menu_records(io.StringIO(text)))
+
+
+def _random_json_value(rng: random.Random, depth: int = 0):
+    """임의 JSON 값 (숫자는 소수부/지수부가 있는 형식 위주)"""
+    kind = rng.randrange(8 if depth < 3 else 5)
+    if kind == 0:
+        return rng.randint(-10 ** rng.randint(0, 12), 10 ** rng.randint(0, 12))
+    if kind in (1, 2):
+        return rng.uniform(-1, 1) * 10 ** rng.randint(-30, 30)
+    if kind == 3:
+        return "".join(rng.choice('ab가나 "\\/\n\t\u0001😀') for _ in range(rng.randint(0, 6)))
+    if kind == 4:
+        return rng.choice([True, False, None])
+    if kind in (5, 6):
+        return [_random_json_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{i}": _random_json_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+@pytest.mark.parametrize("read_chars", [1, 2, 3, 5, 8])
+@pytest.mark.parametrize("text", [
+    '{"menus": [1.5, 2]}',
+    '{"menus": [1e5, -2.5E-3, 10, 0.25e+2]}',
+    '{"x": 1.5e3, "menus": [[1.25], {"a": 3.5}], "y": -0.0}',
+])
+def test_numbers_cut_at_buffer_boundary(small_reads, read_chars, text):
+    small_reads(read_chars)
+    assert _records(text) == json.loads(text)["menus"]
+
+
+@pytest.mark.parametrize("read_chars", [1, 2, 3, 5, 8])
+def test_stream_matches_json_loads(small_reads, read_chars):
+    rng = random.Random(read_chars)
+    small_reads(read_chars)
+    for _ in range(300):
+        data = {"menus": [_random_json_value(rng) for _ in range(rng.randint(0, 6))]}
+        if rng.random() < 0.5:
+            data = {"before": _random_json_value(rng), **data, "after": _random_json_value(rng)}
+        text = json.dumps(data, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 0, 2]),
+                          separators=rng.choice([(",", ":"), (", ", ": "), (" , ", " : ")]))
+        assert _records(text) == data["menus"], text
+
+        truncated = text[:rng.randrange(len(text))]
+        with pytest.raises(json.JSONDecodeError):
+            _records(truncated)
+
+
+def test_error_position_is_reported_in_file_coordinates(small_reads):
+    small_reads(4)
+    text = '{"menus": [\n  {"a": 1},\n  {"a": 2,}\n]}'
+    with pytest.raises(json.JSONDecodeError) as excinfo:
+        _records(text)
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    assert (excinfo.value.lineno, excinfo.value.colno) == (expected.value.lineno, expected.value.colno)
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_load_menu_file_rejects_only_invalid_records(tmp_path, workers):
+    records = synthetic_menu_records(10)
+    records[3]["score_range"] = [1.5, 80]
+    records[7] = [1, 2]
+    path = write_json(tmp_path / "menus.json", {"menus": records})
+
+    menus, report = menu_stream.load_menu_file(path, workers, chunk_size=3)
+
+    assert [menu.id for menu in menus] == [record["id"] for i, record in enumerate(records) if i not in (3, 7)]
+    assert (report.accepted, report.rejected) == (8, 2)
+    assert [rejection["index"] for rejection in report.rejections] == [3, 7]
+
+
+def test_load_menu_file_json_lines_rejects_bad_lines(tmp_path):
+    lines = [json.dumps(record, ensure_ascii=False) for record in synthetic_menu_records(4)]
+    lines.insert(2, '{"id": "broken"')
+    path = tmp_path / "menus.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    menus, report = menu_stream.load_menu_file(str(path))
+
+    assert len(menus) == 4
+    assert report.rejected == 1 and report.rejections[0]["index"] == 2
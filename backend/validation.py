@@ -9,6 +9,14 @@ import jsonschema
 from jsonschema import validate, ValidationError
 from datetime import datetime
 
+from fortune_kernel import MAX_DATE_ORDINAL, MAX_FORTUNE_DATE
+
+# 대규모 그룹 모드 최대 참석자 수
+LARGE_GROUP_MAX_PARTICIPANTS = 1000
+
+# 메뉴 일괄 조회 최대 ID 수
+MENU_LOOKUP_MAX_IDS = 100
+
 
 class ValidationSchemas:
     """JSON 스키마 정의 클래스"""
@@ -466,8 +474,8 @@ def validate_fortune_request(data: Dict[str, Any]) -> Dict[str, Any]:
         participants = data["participants"]
         
         # 모드 검증
-        if mode not in ["individual", "group"]:
-            return {"valid": False, "error": "mode는 'individual' 또는 'group'이어야 합니다"}
+        if mode not in ["individual", "group", "large_group"]:
+            return {"valid": False, "error": "mode는 'individual', 'group' 또는 'large_group'이어야 합니다"}
         
         # 참석자 수 검증
         if not isinstance(participants, list):
@@ -476,10 +484,13 @@ def validate_fortune_request(data: Dict[str, Any]) -> Dict[str, Any]:
         if mode == "individual" and len(participants) != 1:
             return {"valid": False, "error": "개인 모드에서는 정확히 1명의 참석자가 필요합니다"}
         
-        if mode == "group" and len(participants) < 2:
+        if mode in ["group", "large_group"] and len(participants) < 2:
             return {"valid": False, "error": "그룹 모드에서는 최소 2명의 참석자가 필요합니다"}
         
-        if len(participants) > 10:
+        if mode == "large_group":
+            if len(participants) > LARGE_GROUP_MAX_PARTICIPANTS:
+                return {"valid": False, "error": f"대규모 그룹은 최대 {LARGE_GROUP_MAX_PARTICIPANTS}명까지만 가능합니다"}
+        elif len(participants) > 10:
             return {"valid": False, "error": "최대 10명까지만 가능합니다"}
         
         # 각 참석자 데이터 검증
@@ -515,6 +526,104 @@ def validate_fortune_request(data: Dict[str, Any]) -> Dict[str, Any]:
         return {"valid": False, "error": f"검증 중 오류가 발생했습니다: {str(e)}"}
 
 
+def validate_forecast_request(data: Dict[str, Any], max_days: int) -> Dict[str, Any]:
+    """
+    운세 예보 요청 데이터 검증
+    
+    Args:
+        data: 검증할 요청 데이터 ({"birth_date", "start_date"(선택), "days"(선택)})
+        max_days: 허용하는 최대 예보 일수
+        
+    Returns:
+        Dict: {"valid": bool, "error": str}
+    """
+    try:
+        if not data:
+            return {"valid": False, "error": "요청 데이터가 비어있습니다"}
+        
+        if "birth_date" not in data:
+            return {"valid": False, "error": "birth_date 필드가 필요합니다"}
+        
+        # 날짜 형식 검증
+        try:
+            birth_date_obj = datetime.strptime(data["birth_date"], "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            return {"valid": False, "error": "생년월일 형식이 올바르지 않습니다 (YYYY-MM-DD)"}
+        
+        if birth_date_obj > datetime.now().date():
+            return {"valid": False, "error": "생년월일은 미래 날짜일 수 없습니다"}
+        
+        if birth_date_obj.year < 1900:
+            return {"valid": False, "error": "생년월일이 너무 오래되었습니다"}
+        
+        if "start_date" in data:
+            try:
+                datetime.strptime(data["start_date"], "%Y-%m-%d")
+            except (TypeError, ValueError):
+                return {"valid": False, "error": "start_date 형식이 올바르지 않습니다 (YYYY-MM-DD)"}
+        
+        days = data.get("days", 30)
+        if not isinstance(days, int) or isinstance(days, bool) or not 1 <= days <= max_days:
+            return {"valid": False, "error": f"days는 1-{max_days} 사이의 정수여야 합니다"}
+        
+        # 점수 커널이 계산할 수 있는 마지막 날짜까지만 예보
+        start_date = (datetime.strptime(data["start_date"], "%Y-%m-%d").date()
+                      if "start_date" in data else datetime.now().date())
+        if start_date.toordinal() + days - 1 > MAX_DATE_ORDINAL:
+            return {"valid": False, "error": f"예보 기간은 {MAX_FORTUNE_DATE} 이전이어야 합니다"}
+        
+        return {"valid": True, "error": ""}
+        
+    except Exception as e:
+        return {"valid": False, "error": f"검증 중 오류가 발생했습니다: {str(e)}"}
+
+
+def validate_menu_ids(menu_ids: List[str], max_ids: int = MENU_LOOKUP_MAX_IDS) -> Dict[str, Any]:
+    """
+    메뉴 일괄 조회 ID 목록 검증
+    
+    Args:
+        menu_ids: 쉼표로 구분된 ids 쿼리 파라미터를 나눈 ID 목록
+        max_ids: 한 번에 조회할 수 있는 최대 ID 수
+        
+    Returns:
+        Dict: {"valid": bool, "error": str}
+    """
+    if not menu_ids:
+        return {"valid": False, "error": "ids 쿼리 파라미터가 필요합니다 (예: ?ids=menu_001,menu_002)"}
+    
+    if len(menu_ids) > max_ids:
+        return {"valid": False, "error": f"메뉴 ID는 한 번에 최대 {max_ids}개까지 조회할 수 있습니다"}
+    
+    if any(not menu_id for menu_id in menu_ids):
+        return {"valid": False, "error": "빈 메뉴 ID가 있습니다"}
+    
+    return {"valid": True, "error": ""}
+
+
+def validate_algorithm_version(data: Dict[str, Any], supported_versions: List[str]) -> Dict[str, Any]:
+    """
+    요청의 점수 알고리즘 버전 검증 (algorithm_version 필드는 선택사항)
+    
+    Args:
+        data: 검증할 요청 데이터
+        supported_versions: 등록된 알고리즘 버전 리스트
+        
+    Returns:
+        Dict: {"valid": bool, "error": str}
+    """
+    if "algorithm_version" not in data:
+        return {"valid": True, "error": ""}
+    
+    if data["algorithm_version"] not in supported_versions:
+        return {
+            "valid": False,
+            "error": f"algorithm_version은 {', '.join(supported_versions)} 중 하나여야 합니다"
+        }
+    
+    return {"valid": True, "error": ""}
+
+
 # 검증 데코레이터
 def validate_request(validation_type: str):
     """
@@ -84,6 +84,42 @@ class TestRunner:
             self.server_process.wait()
             print(f"{Colors.CYAN}서버가 중지되었습니다.{Colors.END}")
     
+    def run_unit_tests(self):
+        """백엔드 단위 테스트 실행 (pytest, 서버 불필요)"""
+        self.print_header("백엔드 단위 테스트")
+        
+        tests_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", "tests")
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "pytest", "-q", tests_dir],
+                capture_output=True,
+                text=True,
+                timeout=300  # 5분 타임아웃
+            )
+            
+            print(result.stdout)
+            if result.stderr:
+                print(f"{Colors.YELLOW}경고/오류:{Colors.END}")
+                print(result.stderr)
+            
+            success = result.returncode == 0
+            self.test_results['unit'] = {
+                'success': success,
+                'return_code': result.returncode,
+                'output': result.stdout,
+                'errors': result.stderr
+            }
+            return success
+            
+        except subprocess.TimeoutExpired:
+            print(f"{Colors.RED}❌ 단위 테스트 시간 초과 (5분){Colors.END}")
+            self.test_results['unit'] = {'success': False, 'error': 'timeout'}
+            return False
+        except Exception as e:
+            print(f"{Colors.RED}❌ 단위 테스트 실행 실패: {str(e)}{Colors.END}")
+            self.test_results['unit'] = {'success': False, 'error': str(e)}
+            return False
+    
     def run_backend_tests(self):
         """백엔드 API 테스트 실행"""
         self.print_header("백엔드 API 테스트")
@@ -248,6 +284,7 @@ class TestRunner:
         self.print_header("최종 테스트 결과 요약")
         
         # 각 테스트 카테고리별 결과
+        unit_success = self.test_results.get('unit', {}).get('success', False)
         backend_success = self.test_results.get('backend', {}).get('success', False)
         browser_success = self.test_results.get('browser', {}).get('success', False)
         browser_skipped = self.test_results.get('browser', {}).get('skipped', False)
@@ -257,6 +294,7 @@ class TestRunner:
         integration_total = len(integration_results)
         
         print(f"{Colors.BOLD}테스트 카테고리별 결과:{Colors.END}")
+        print(f"  백엔드 단위: {Colors.GREEN if unit_success else Colors.RED}{'✅ 성공' if unit_success else '❌ 실패'}{Colors.END}")
         print(f"  백엔드 API: {Colors.GREEN if backend_success else Colors.RED}{'✅ 성공' if backend_success else '❌ 실패'}{Colors.END}")
         
         if browser_skipped:
@@ -286,7 +324,7 @@ class TestRunner:
             print(f"  성공률: {Colors.YELLOW}{browser_stats['success_rate']:.1f}%{Colors.END}")
         
         # 전체 성공 여부 결정
-        required_tests_passed = backend_success
+        required_tests_passed = unit_success and backend_success
         optional_tests_passed = browser_success or browser_skipped
         integration_tests_passed = integration_success >= (integration_total * 0.7) if integration_total > 0 else True
         
@@ -298,6 +336,7 @@ class TestRunner:
             'overall_success': overall_success,
             'test_results': self.test_results,
             'summary': {
+                'unit_success': unit_success,
                 'backend_success': backend_success,
                 'browser_success': browser_success,
                 'browser_skipped': browser_skipped,
@@ -327,6 +366,9 @@ class TestRunner:
         print("=" * 80)
         print(f"{Colors.END}")
         
+        # 단위 테스트는 서버 없이 먼저 실행
+        self.run_unit_tests()
+        
         # 서버 시작
         if not self.start_server():
             print(f"{Colors.RED}서버를 시작할 수 없어 테스트를 중단합니다.{Colors.END}")